@@ -28,6 +28,10 @@ class Configuration:
     enable_context_compression: bool = True
     max_context_tokens: int = 32000
 
+    # Parallel step execution settings
+    enable_parallel_steps: bool = False
+    max_parallel_steps: int = 3
+
     # Token management settings for observations compression
     max_observations_tokens: int = 45000
     compression_safety_margin: float = 0.8
@@ -67,6 +71,8 @@ class Configuration:
             auto_accepted_plan=configurable.get("auto_accepted_plan", False),
             enable_context_compression=configurable.get("enable_context_compression", True),
             max_context_tokens=get_with_default("max_context_tokens", 32000),
+            enable_parallel_steps=configurable.get("enable_parallel_steps", False),
+            max_parallel_steps=get_with_default("max_parallel_steps", 3),
             max_observations_tokens=get_with_default("max_observations_tokens", 45000),
             compression_safety_margin=get_with_default("compression_safety_margin", 0.8),
             summarizer_chunk_size=get_with_default("summarizer_chunk_size", 8000),
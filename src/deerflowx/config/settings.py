@@ -2,6 +2,8 @@
 # SPDX-License-Identifier: MIT
 """Application settings using pydantic-settings."""
 
+from typing import Literal
+
 from pydantic import Field
 from pydantic_settings import BaseSettings as _BaseSettings
 from pydantic_settings import SettingsConfigDict
@@ -70,6 +72,137 @@ class LangfuseSettings(BaseSettings):
         return bool(self.public_key and self.secret_key)
 
 
+class ThreadLifecycleSettings(BaseSettings):
+    """Retention settings for conversation threads kept by the checkpointer."""
+
+    model_config = SettingsConfigDict(env_prefix="THREAD_")
+
+    idle_ttl_seconds: float = 6 * 60 * 60
+    max_threads: int = 1000
+    max_bytes: int = 512 * 1024 * 1024
+    keep_last_checkpoints: int = 20
+    sweep_interval_seconds: float = 60
+
+
+class MCPPoolSettings(BaseSettings):
+    """Settings of the process-wide pool of MCP server sessions."""
+
+    model_config = SettingsConfigDict(env_prefix="MCP_POOL_")
+
+    max_sessions: int = 16
+    idle_timeout_seconds: int = 300
+    health_check_interval_seconds: int = 30
+    health_check_timeout_seconds: int = 5
+
+
+class CrawlerSettings(BaseSettings):
+    """Concurrency and connection settings of the web crawler."""
+
+    model_config = SettingsConfigDict(env_prefix="CRAWLER_")
+
+    max_concurrency: int = 8
+    max_concurrency_per_domain: int = 2
+    max_keepalive_connections: int = 20
+    timeout_seconds: float = 30
+    cache_enabled: bool = True
+    cache_path: str = "data/crawl_cache.sqlite"
+    cache_ttl_seconds: int = 24 * 60 * 60
+    cache_max_bytes: int = 256 * 1024 * 1024
+    extraction_mode: Literal["inline", "process"] = "inline"
+    extraction_workers: int = 2
+    extraction_timeout_seconds: float = 20
+    content_mode: Literal["passages", "truncate"] = "passages"
+    passage_token_budget: int = 250
+    passage_max_chars: int = 500
+    # Crawl the top search results in the background while the agent is still reasoning
+    prefetch_enabled: bool = False
+    prefetch_top_k: int = 3
+    prefetch_max_concurrency: int = 2
+    prefetch_max_pending: int = 8
+
+
+class TavilySettings(BaseSettings):
+    """Connection settings of the Tavily search client."""
+
+    model_config = SettingsConfigDict(env_prefix="TAVILY_")
+
+    max_connections: int = 20
+    keepalive_seconds: float = 60
+    timeout_seconds: float = 30
+
+
+class RAGSettings(BaseSettings):
+    """Settings of the RAG provider clients."""
+
+    model_config = SettingsConfigDict(env_prefix="RAG_")
+
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    timeout_seconds: float = 30
+    # Age after which the cached resource list of /api/rag/resources is refreshed in the background
+    resources_ttl_seconds: float = 300
+
+
+class SearchCacheSettings(BaseSettings):
+    """Settings of the persistent web search result cache."""
+
+    model_config = SettingsConfigDict(env_prefix="SEARCH_CACHE_")
+
+    enabled: bool = True
+    path: str = "data/search_cache.sqlite"
+    ttl_seconds: int = 6 * 60 * 60
+    max_bytes: int = 64 * 1024 * 1024
+
+
+class SearchResilienceSettings(BaseSettings):
+    """Settings of request hedging, retries and circuit breakers for the search providers."""
+
+    model_config = SettingsConfigDict(env_prefix="SEARCH_RESILIENCE_")
+
+    enabled: bool = True
+    # Send a second request once a request is slower than this latency percentile
+    hedge_enabled: bool = True
+    hedge_percentile: float = 0.95
+    hedge_min_samples: int = 20
+    latency_window: int = 200
+    failure_threshold: int = 5
+    reset_timeout_seconds: float = 30
+    max_retries: int = 2
+    backoff_base_seconds: float = 0.5
+    backoff_max_seconds: float = 10
+
+
+class FusionSearchSettings(BaseSettings):
+    """Settings of the ``fusion`` search mode, which merges the results of several engines."""
+
+    model_config = SettingsConfigDict(env_prefix="FUSION_SEARCH_")
+
+    # Comma separated engines to query, any of tavily, duckduckgo, brave_search, arxiv
+    engines: str = "tavily,duckduckgo"
+    timeout_seconds: float = 8
+    rrf_k: int = 60
+
+    @property
+    def engine_list(self) -> list[str]:
+        return [engine.strip() for engine in self.engines.split(",") if engine.strip()]
+
+
+class HybridRAGSettings(BaseSettings):
+    """Settings of the ``hybrid`` RAG provider, which merges the results of several providers."""
+
+    model_config = SettingsConfigDict(env_prefix="HYBRID_RAG_")
+
+    # Comma separated providers to query, any of ragflow, vikingdb_knowledge_base, local
+    providers: str = "ragflow,local"
+    rrf_k: int = 60
+    # Chunks whose 64-bit SimHash fingerprints differ in at most this many bits are duplicates
+    dedup_max_distance: int = 3
+
+    @property
+    def provider_list(self) -> list[str]:
+        return [provider.strip() for provider in self.providers.split(",") if provider.strip()]
+
+
 class AppSettings(BaseSettings):
     """Main application settings."""
 
@@ -80,11 +213,21 @@ class AppSettings(BaseSettings):
     # Global settings
     search_api: str = Field(default="tavily", alias="SEARCH_API")
     rag_provider: str | None = Field(default=None, alias="RAG_PROVIDER")
+    checkpointer: str = Field(default="memory", alias="CHECKPOINTER")
 
     basic_model: BasicModelSettings = BasicModelSettings()
     reasoning_model: ReasoningModelSettings = ReasoningModelSettings()
     vision_model: VisionModelSettings = VisionModelSettings()
     langfuse: LangfuseSettings = LangfuseSettings()
+    thread_lifecycle: ThreadLifecycleSettings = ThreadLifecycleSettings()
+    mcp_pool: MCPPoolSettings = MCPPoolSettings()
+    crawler: CrawlerSettings = CrawlerSettings()
+    tavily: TavilySettings = TavilySettings()
+    rag: RAGSettings = RAGSettings()
+    hybrid_rag: HybridRAGSettings = HybridRAGSettings()
+    search_cache: SearchCacheSettings = SearchCacheSettings()
+    search_resilience: SearchResilienceSettings = SearchResilienceSettings()
+    fusion_search: FusionSearchSettings = FusionSearchSettings()
 
 
 # Global settings instance
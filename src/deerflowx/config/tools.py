@@ -14,6 +14,8 @@ class SearchEngine(enum.Enum):
     DUCKDUCKGO = "duckduckgo"
     BRAVE_SEARCH = "brave_search"
     ARXIV = "arxiv"
+    # Query several engines concurrently and merge their results
+    FUSION = "fusion"
 
 
 # Tool configuration
@@ -23,6 +25,17 @@ SELECTED_SEARCH_ENGINE = os.getenv("SEARCH_API", SearchEngine.TAVILY.value)
 class RAGProvider(enum.Enum):
     RAGFLOW = "ragflow"
     VIKINGDB_KNOWLEDGE_BASE = "vikingdb_knowledge_base"
+    LOCAL = "local"
+    # Query several providers concurrently and merge their results
+    HYBRID = "hybrid"
 
 
 SELECTED_RAG_PROVIDER = os.getenv("RAG_PROVIDER")
+
+
+class CheckpointerBackend(enum.Enum):
+    MEMORY = "memory"
+    SQLITE = "sqlite"
+
+
+SELECTED_CHECKPOINTER = os.getenv("CHECKPOINTER", CheckpointerBackend.MEMORY.value)
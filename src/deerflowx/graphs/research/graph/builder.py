@@ -3,10 +3,12 @@
 
 import logging
 
-from langgraph.checkpoint.memory import MemorySaver
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import END, START, StateGraph
 from langgraph.graph.state import CompiledStateGraph
+from langgraph.types import Send
 
+from deerflowx.config.configuration import Configuration
 from deerflowx.graphs.research.graph.nodes.background_investigation import BackgroundInvestigationNode
 from deerflowx.graphs.research.graph.nodes.coder import CoderNode
 from deerflowx.graphs.research.graph.nodes.coordinator import CoordinatorNode
@@ -21,11 +23,33 @@ from deerflowx.graphs.research.graph.nodes.summarizer import (
     SummarizerNode,
 )
 from deerflowx.graphs.research.graph.nodes.tokens_evaluator import TokensEvaluatorNode
+from deerflowx.graphs.research.graph.scheduler import get_ready_step_indices
 from deerflowx.graphs.research.graph.state import State
-from deerflowx.prompts.planner_model import StepType
+from deerflowx.libs.checkpoint import build_checkpointer
+from deerflowx.prompts.planner_model import Step, StepType
 
 
-def continue_to_running_research_team(state: State) -> str:
+def _get_step_node(step: Step) -> str | None:
+    if step.step_type and step.step_type == StepType.RESEARCH:
+        return "researcher"
+    if step.step_type and step.step_type == StepType.PROCESSING:
+        return "coder"
+    return None
+
+
+def _fan_out_ready_steps(state: State, max_parallel_steps: int) -> list[Send]:
+    """Dispatch every ready step to its agent concurrently, one Send per step."""
+    current_plan = state["current_plan"]
+    sends = []
+    for index in get_ready_step_indices(current_plan, max_parallel_steps):
+        node = _get_step_node(current_plan.steps[index])
+        if node is None:
+            return []
+        sends.append(Send(node, {**state, "step_index": index}))
+    return sends
+
+
+def continue_to_running_research_team(state: State, config: RunnableConfig | None = None) -> str | list[Send]:
     current_plan = state.get("current_plan")
     if not current_plan or isinstance(current_plan, str):
         return "planner"
@@ -35,14 +59,17 @@ def continue_to_running_research_team(state: State) -> str:
 
     if all(step.execution_res for step in current_plan.steps):
         return "tokens_evaluator"  # 研究完成后,先进行token估算
+
+    configurable = Configuration.from_runnable_config(config)
+    if configurable.enable_parallel_steps and (sends := _fan_out_ready_steps(state, configurable.max_parallel_steps)):
+        logger = logging.getLogger(__name__)
+        logger.info(f"Dispatching {len(sends)} plan steps in parallel")
+        return sends
+
     for step in current_plan.steps:
         if not step.execution_res:
             break
-    if step.step_type and step.step_type == StepType.RESEARCH:
-        return "researcher"
-    if step.step_type and step.step_type == StepType.PROCESSING:
-        return "coder"
-    return "planner"
+    return _get_step_node(step) or "planner"
 
 
 def route_after_token_estimation(state: State) -> str:
@@ -130,9 +157,8 @@ def _build_base_graph() -> StateGraph:
 
 def build_graph_with_memory() -> CompiledStateGraph:
     """Build and return the agent workflow graph with memory."""
-    # use persistent memory to save conversation history
-    # NOTE: Future enhancement - add SQLite/PostgreSQL compatibility
-    memory = MemorySaver()
+    # use the configured checkpointer (CHECKPOINTER env) to save conversation history
+    memory = build_checkpointer()
 
     # build state graph
     builder = _build_base_graph()
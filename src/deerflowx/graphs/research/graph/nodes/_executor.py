@@ -3,9 +3,7 @@ import os
 from typing import Any, Literal
 
 from langchain_core.messages import AnyMessage, HumanMessage
-from langchain_core.messages.utils import count_tokens_approximately
 from langchain_core.runnables import RunnableConfig
-from langchain_mcp_adapters.client import MultiServerMCPClient
 from langgraph.graph.graph import CompiledGraph
 from langgraph.prebuilt import create_react_agent
 from langgraph.types import Command
@@ -14,8 +12,10 @@ from deerflowx.config.agents import AGENT_LLM_MAP
 from deerflowx.config.configuration import Configuration
 from deerflowx.graphs.research.graph.state import State
 from deerflowx.prompts import apply_prompt_template
-from deerflowx.utils.context_compressor import SmartContextCompressor
+from deerflowx.utils.context_compressor import get_context_compressor
 from deerflowx.utils.llms.llm import get_llm_by_type, get_model_name_for_agent
+from deerflowx.utils.mcp_session_pool import mcp_session_pool
+from deerflowx.utils.tokenizer import get_agent_tokenizer
 
 logger = logging.getLogger(__name__)
 
@@ -54,32 +54,42 @@ async def _execute_agent_step(  # noqa: C901, PLR0912, PLR0915
         logger.warning("Invalid current_plan type, expected Plan object")
         return Command(goto="research_team")
 
-    current_step = None
-    completed_steps = []
-    for step in current_plan.steps:
-        if not step.execution_res:
-            current_step = step
-            break
-        completed_steps.append(step)
+    # In parallel mode the research team fans out one branch per step and tells it which step to run.
+    step_index = state.get("step_index")
+    if step_index is not None:
+        current_index = step_index if 0 <= step_index < len(current_plan.steps) else None
+    else:
+        current_index = next((i for i, step in enumerate(current_plan.steps) if not step.execution_res), None)
 
-    if not current_step:
+    if current_index is None:
         logger.warning("No unexecuted step found")
         return Command(goto="research_team")
 
+    current_step = current_plan.steps[current_index]
+
+    if current_step.depends_on is not None:
+        # The step declared its inputs, so it only sees the results of those steps.
+        context_indices = current_step.depends_on
+        context_observations = []
+    else:
+        context_indices = range(current_index)
+        context_observations = observations
+    completed_steps = [(i, current_plan.steps[i]) for i in context_indices if current_plan.steps[i].execution_res]
+
     messages = state.get("messages", [])
 
     completed_steps_info = ""
     if completed_steps:
         completed_steps_info += "## Completed Steps\n\n"
-        for i, step in enumerate(completed_steps):
+        for i, step in completed_steps:
             completed_steps_info += f"### Step {i + 1}: {step.title}\n\n"
             completed_steps_info += f"Result: {step.execution_res}\n\n"
 
-    if observations:
+    if context_observations:
         completed_steps_info += "## Observations\n\n"
-        completed_steps_info += "\n\n".join(observations) + "\n\n"
+        completed_steps_info += "\n\n".join(context_observations) + "\n\n"
 
-    num_tokens = count_tokens_approximately(messages)
+    num_tokens = get_agent_tokenizer(agent_name).count_messages(messages, approximate=True)
     if num_tokens > DEFAULT_TOKEN_WARNING_THRESHOLD:
         logger.warning(f"High token count ({num_tokens}) detected in messages before agent execution.")
 
@@ -128,8 +138,8 @@ async def _execute_agent_step(  # noqa: C901, PLR0912, PLR0915
                 if configurable.max_context_tokens != DEFAULT_MAX_CONTEXT_TOKENS
                 else None
             )
-            compressor = SmartContextCompressor(model_name=model_name, override_token_limit=override_limit)
-            agent_input["messages"] = await compressor.compress(agent_input["messages"])
+            compressor = get_context_compressor(model_name, override_token_limit=override_limit)
+            agent_input["messages"] = await compressor.compress(agent_input["messages"], query=current_step.title)
         except ValueError as e:
             logger.warning(f"Failed to initialize context compressor: {e}. Skipping compression.")
 
@@ -160,6 +170,22 @@ async def _execute_agent_step(  # noqa: C901, PLR0912, PLR0915
     response_content = result["messages"][-1].content
     logger.debug(f"{agent_name.capitalize()} full response: {response_content}")
 
+    if step_index is not None:
+        # Concurrent branches must not touch the shared plan; the research team merges results in plan order.
+        logger.info(f"Step '{current_step.title}' (index {step_index}) execution completed by {agent_name}")
+        return Command(
+            update={
+                "messages": [
+                    HumanMessage(
+                        content=response_content,
+                        name=agent_name,
+                    ),
+                ],
+                "step_results": [{"step_index": step_index, "execution_res": response_content}],
+            },
+            goto="research_team",
+        )
+
     current_step.execution_res = response_content
     logger.info(f"Step '{current_step.title}' execution completed by {agent_name}")
 
@@ -216,12 +242,14 @@ async def _setup_and_execute_agent_step(
 
     # Create and execute agent with MCP tools if available
     if mcp_servers:
-        async with MultiServerMCPClient(mcp_servers) as client:
+        async with mcp_session_pool.lease(mcp_servers) as server_tools:
             loaded_tools = default_tools[:]
-            for tool in client.get_tools():
-                if tool.name in enabled_tools:
-                    tool.description = f"Powered by '{enabled_tools[tool.name]}'.\n{tool.description}"
-                    loaded_tools.append(tool)
+            for server_name, tools in server_tools.items():
+                for tool in tools:
+                    if enabled_tools.get(tool.name) == server_name:
+                        # Pooled tools are shared across steps, so annotate a copy
+                        description = f"Powered by '{server_name}'.\n{tool.description}"
+                        loaded_tools.append(tool.model_copy(update={"description": description}))
             agent = create_agent(agent_type, agent_type, loaded_tools, agent_type)
             return await _execute_agent_step(state, agent, agent_type, config)
     else:
@@ -24,12 +24,18 @@ async def background_investigation_node(state: State, config: RunnableConfig) ->
     configurable = Configuration.from_runnable_config(config)
     query = state.get("research_topic")
     background_investigation_results = None
-    if SearchEngine.TAVILY.value == SELECTED_SEARCH_ENGINE:
-        searched_content = await LoggedTavilySearch(max_results=configurable.max_search_results).ainvoke(query)
+    if SELECTED_SEARCH_ENGINE in (SearchEngine.TAVILY.value, SearchEngine.FUSION.value):
+        if SearchEngine.TAVILY.value == SELECTED_SEARCH_ENGINE:
+            search_tool = LoggedTavilySearch(max_results=configurable.max_search_results)
+        else:
+            search_tool = get_web_search_tool(configurable.max_search_results)
+        searched_content = await search_tool.ainvoke(query)
         if isinstance(searched_content, list):
-            background_investigation_results = [f"## {elem['title']}\n\n{elem['content']}" for elem in searched_content]
+            background_investigation_results = [
+                f"## {elem['title']}\n\n{elem['content']}" for elem in searched_content if elem.get("type") == "page"
+            ]
             return {"background_investigation_results": "\n\n".join(background_investigation_results)}
-        logger.error(f"Tavily search returned malformed response: {searched_content}")
+        logger.error(f"{SELECTED_SEARCH_ENGINE} search returned malformed response: {searched_content}")
     else:
         background_investigation_results = await get_web_search_tool(configurable.max_search_results).ainvoke(query)
     return {"background_investigation_results": json.dumps(background_investigation_results, ensure_ascii=False)}
@@ -4,16 +4,54 @@
 import logging
 from typing import Any
 
-from deerflowx.graphs.research.graph.state import State
+from deerflowx.graphs.research.graph.state import State, StepResult
+from deerflowx.prompts.planner_model import Plan
 from deerflowx.utils.node_base import NodeBase
 
 logger = logging.getLogger(__name__)
 
 
-async def research_team_node(_state: State) -> dict[str, Any]:
+def merge_parallel_step_results(state: State, step_results: list[StepResult]) -> dict[str, Any]:
+    """Merge results of steps executed in parallel back into the plan and observations, in plan order."""
+    current_plan = state.get("current_plan")
+    if not isinstance(current_plan, Plan):
+        logger.warning("Discarding parallel step results, no valid plan found")
+        return {"step_results": []}
+
+    current_plan = current_plan.model_copy(deep=True)
+    # Outputs of steps finished earlier are the trailing observations, one per step
+    finished_before = sum(1 for step in current_plan.steps if step.execution_res)
+    for result in step_results:
+        index = result["step_index"]
+        if not 0 <= index < len(current_plan.steps):
+            logger.warning(f"Discarding result for unknown step index {index}")
+            continue
+        step = current_plan.steps[index]
+        if not step.execution_res:
+            step.execution_res = result["execution_res"]
+
+    # Steps may finish out of plan order when they have dependencies, so rebuild the
+    # step observations by step index in plan order and keep any other observations in
+    # front. Matching by position rather than content keeps identical step outputs apart.
+    observations = list(state.get("observations", []))
+    del observations[max(len(observations) - finished_before, 0) :]
+    observations.extend(step.execution_res for step in current_plan.steps if step.execution_res)
+
+    logger.info(f"Merged {len(step_results)} parallel step results into the plan")
+    return {
+        "current_plan": current_plan,
+        "observations": observations,
+        "step_results": [],
+    }
+
+
+async def research_team_node(state: State) -> dict[str, Any]:
     """Research team node that collaborates on tasks."""
     logger.info("Research team is collaborating on tasks.")
-    return {}
+    step_results = state.get("step_results") or []
+    if not step_results:
+        return {}
+    return merge_parallel_step_results(state, step_results)
 
 
 class ResearchTeamNode(NodeBase):
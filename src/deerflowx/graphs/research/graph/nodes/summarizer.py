@@ -6,9 +6,7 @@ import operator
 from typing import Annotated, Any
 
 from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_core.messages.utils import count_tokens_approximately
 from langchain_core.runnables import RunnableConfig
-from langchain_text_splitters import TokenTextSplitter
 from langgraph.types import Send
 from typing_extensions import TypedDict
 
@@ -18,6 +16,7 @@ from deerflowx.graphs.research.graph.state import State
 from deerflowx.prompts.planner_model import Plan
 from deerflowx.utils.llms.llm import get_llm_by_type
 from deerflowx.utils.node_base import NodeBase
+from deerflowx.utils.tokenizer import get_agent_tokenizer
 
 logger = logging.getLogger(__name__)
 
@@ -32,13 +31,11 @@ class ChunkState(TypedDict):
 
 
 def split_text_into_chunks(text: str, chunk_size: int, overlap: int) -> list[str]:
-    """Split text into overlapping chunks using LangChain's TokenTextSplitter."""
+    """Split text into overlapping chunks of the researcher model's tokens."""
     if not text.strip():
         return []
 
-    splitter = TokenTextSplitter(chunk_size=chunk_size, chunk_overlap=overlap)
-
-    chunks = splitter.split_text(text)
+    chunks = get_agent_tokenizer("researcher").split(text, chunk_size, overlap)
 
     if not chunks:
         return [text]
@@ -111,13 +108,7 @@ async def reduce_summaries(state: State, config: RunnableConfig) -> dict[str, An
     if configurable.summarizer_enable_second_pass:
         try:
             llm = get_llm_by_type(AGENT_LLM_MAP["researcher"])
-
-            try:
-                combined_tokens = llm.get_num_tokens(combined_summaries)
-            except Exception as e:
-                logger.warning(f"Error calculating tokens with LLM: {e}, using approximate calculation")
-
-                combined_tokens = count_tokens_approximately(combined_summaries)
+            combined_tokens = get_agent_tokenizer("researcher").count(combined_summaries)
 
             if combined_tokens > configurable.max_observations_tokens // 2:
                 logger.info(f"Performing second-pass compression (current: {combined_tokens} tokens)")
@@ -4,14 +4,12 @@
 import logging
 from typing import Any
 
-from langchain_core.messages.utils import count_tokens_approximately
 from langchain_core.runnables import RunnableConfig
 
-from deerflowx.config.agents import AGENT_LLM_MAP
 from deerflowx.config.configuration import Configuration
 from deerflowx.graphs.research.graph.state import State
-from deerflowx.utils.llms.llm import get_llm_by_type
 from deerflowx.utils.node_base import NodeBase
+from deerflowx.utils.tokenizer import get_agent_tokenizer
 
 logger = logging.getLogger(__name__)
 
@@ -41,16 +39,9 @@ async def token_evaluator_node(state: State, config: RunnableConfig) -> dict[str
             "decision_reason": "No valid texts to process",
         }
 
-    llm = get_llm_by_type(AGENT_LLM_MAP["researcher"])
-
-    combined_text = "\n".join(valid_observations)
-
-    try:
-        token_count = llm.get_num_tokens(combined_text)
-    except Exception as e:
-        logger.warning(f"Error calculating tokens with LLM: {e}, using approximate calculation")
-
-        token_count = count_tokens_approximately(combined_text)
+    # Counting the observations one by one reuses the counts cached by earlier evaluations;
+    # each newline joining them is one more token
+    token_count = sum(get_agent_tokenizer("researcher").count_batch(valid_observations)) + len(valid_observations) - 1
 
     threshold = configurable.max_observations_tokens
     safety_margin = configurable.compression_safety_margin
@@ -0,0 +1,44 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+"""Topological scheduling of plan steps for parallel execution."""
+
+from deerflowx.prompts.planner_model import Plan, StepType
+
+
+def get_step_dependencies(plan: Plan, index: int) -> list[int]:
+    """Return the indices of the steps that must finish before the step at ``index`` can start.
+
+    Steps that declare ``depends_on`` get exactly those dependencies. For steps without a
+    declaration, research steps only wait for earlier processing steps, while a processing
+    step consumes the results of every step before it.
+    """
+    step = plan.steps[index]
+    if step.depends_on is not None:
+        return [dep for dep in step.depends_on if 0 <= dep < index]
+    if step.step_type == StepType.RESEARCH:
+        return [i for i in range(index) if plan.steps[i].step_type != StepType.RESEARCH]
+    return list(range(index))
+
+
+def get_ready_step_indices(plan: Plan, max_parallel_steps: int) -> list[int]:
+    """Return the indices of unexecuted steps whose dependencies have all been executed.
+
+    Dependencies always point to earlier steps, so the plan is a DAG and walking it in
+    order yields a valid topological schedule.
+
+    Args:
+        plan: The current plan
+        max_parallel_steps: Upper bound on the number of steps dispatched at once
+
+    Returns:
+        Indices of ready steps in plan order, empty if every step has been executed
+    """
+    ready: list[int] = []
+    for index, step in enumerate(plan.steps):
+        if step.execution_res:
+            continue
+        if all(plan.steps[dep].execution_res for dep in get_step_dependencies(plan, index)):
+            ready.append(index)
+            if len(ready) >= max(max_parallel_steps, 1):
+                break
+    return ready
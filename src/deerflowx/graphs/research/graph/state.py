@@ -11,6 +11,20 @@ from deerflowx.libs.rag import Resource
 from deerflowx.prompts.planner_model import Plan
 
 
+class StepResult(TypedDict):
+    """Result of a plan step executed in parallel mode."""
+
+    step_index: int
+    execution_res: str
+
+
+def merge_step_results(left: list[StepResult] | None, right: list[StepResult] | None) -> list[StepResult]:
+    """Accumulate parallel step results; an empty update clears the buffer once it has been merged."""
+    if not right:
+        return []
+    return [*(left or []), *right]
+
+
 class State(TypedDict):
     """State for the agent system"""
 
@@ -31,3 +45,8 @@ class State(TypedDict):
     estimated_tokens: NotRequired[int]
     decision_reason: NotRequired[str]
     summarized_observations: NotRequired[str]
+
+    # Parallel step execution: index of the step a fanned-out branch works on,
+    # and the results buffered until the research team merges them into the plan.
+    step_index: NotRequired[int]
+    step_results: Annotated[list[StepResult], merge_step_results]
@@ -0,0 +1,15 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+"""Pluggable LangGraph checkpointer backends."""
+
+from .base import CheckpointRetention
+from .builder import build_checkpointer
+from .memory import InMemoryCheckpointSaver
+from .sqlite import SQLiteCheckpointSaver
+
+__all__ = [
+    "CheckpointRetention",
+    "InMemoryCheckpointSaver",
+    "SQLiteCheckpointSaver",
+    "build_checkpointer",
+]
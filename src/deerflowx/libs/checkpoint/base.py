@@ -0,0 +1,51 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+import abc
+from datetime import datetime
+
+from langgraph.checkpoint.base import Checkpoint
+
+
+def checkpoint_timestamp(checkpoint: Checkpoint) -> float:
+    """Return the time a checkpoint was written, in seconds since the epoch."""
+    return datetime.fromisoformat(checkpoint["ts"]).timestamp()
+
+
+class CheckpointRetention(abc.ABC):
+    """Define the retention operations a checkpointer exposes to the thread lifecycle manager."""
+
+    @abc.abstractmethod
+    def list_thread_ids(self) -> list[str]:
+        """List the ids of all threads with stored checkpoints."""
+
+    @abc.abstractmethod
+    def get_thread_size(self, thread_id: str) -> int:
+        """Return the number of serialized bytes stored for a thread."""
+
+    @abc.abstractmethod
+    def get_thread_last_write(self, thread_id: str) -> float | None:
+        """Return when the newest checkpoint of a thread was written, or None without checkpoints.
+
+        Unlike access times tracked in memory, this sees runs of every process sharing the store.
+        """
+
+    @abc.abstractmethod
+    def prune_thread(self, thread_id: str, keep_last: int) -> int:
+        """Keep only the latest ``keep_last`` checkpoints of every namespace of a thread.
+
+        Writes attached to the parent of a kept checkpoint are preserved, since pending sends
+        are restored from them on resume. Returns the number of deleted checkpoints.
+        """
+
+    async def alist_thread_ids(self) -> list[str]:
+        return self.list_thread_ids()
+
+    async def aget_thread_size(self, thread_id: str) -> int:
+        return self.get_thread_size(thread_id)
+
+    async def aget_thread_last_write(self, thread_id: str) -> float | None:
+        return self.get_thread_last_write(thread_id)
+
+    async def aprune_thread(self, thread_id: str, keep_last: int) -> int:
+        return self.prune_thread(thread_id, keep_last)
@@ -0,0 +1,24 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+import os
+
+from langgraph.checkpoint.base import BaseCheckpointSaver
+
+from deerflowx.config.tools import (
+    SELECTED_CHECKPOINTER,
+    CheckpointerBackend,
+)
+from deerflowx.libs.checkpoint.memory import InMemoryCheckpointSaver
+from deerflowx.libs.checkpoint.sqlite import SQLiteCheckpointSaver
+
+DEFAULT_SQLITE_CHECKPOINTER_PATH = "data/checkpoints.sqlite"
+
+
+def build_checkpointer() -> BaseCheckpointSaver:
+    if CheckpointerBackend.MEMORY.value == SELECTED_CHECKPOINTER:
+        return InMemoryCheckpointSaver()
+    if CheckpointerBackend.SQLITE.value == SELECTED_CHECKPOINTER:
+        return SQLiteCheckpointSaver(os.getenv("SQLITE_CHECKPOINTER_PATH", DEFAULT_SQLITE_CHECKPOINTER_PATH))
+    msg = f"Unsupported checkpointer: {SELECTED_CHECKPOINTER}"
+    raise ValueError(msg)
@@ -0,0 +1,62 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+from langgraph.checkpoint.memory import MemorySaver
+
+from deerflowx.libs.checkpoint.base import CheckpointRetention, checkpoint_timestamp
+
+
+class InMemoryCheckpointSaver(MemorySaver, CheckpointRetention):
+    """MemorySaver that can report its size and drop old checkpoints of a thread."""
+
+    def list_thread_ids(self) -> list[str]:
+        return [thread_id for thread_id, namespaces in self.storage.items() if any(namespaces.values())]
+
+    def get_thread_size(self, thread_id: str) -> int:
+        size = 0
+        for checkpoints in self.storage.get(thread_id, {}).values():
+            for checkpoint, metadata, _ in checkpoints.values():
+                size += len(checkpoint[1]) + len(metadata[1])
+        for key, writes in self.writes.items():
+            if key[0] == thread_id:
+                size += sum(len(write[2][1]) for write in writes.values())
+        for key, blob in self.blobs.items():
+            if key[0] == thread_id:
+                size += len(blob[1])
+        return size
+
+    def get_thread_last_write(self, thread_id: str) -> float | None:
+        newest = max(
+            (
+                (checkpoint_id, checkpoint)
+                for checkpoints in self.storage.get(thread_id, {}).values()
+                for checkpoint_id, (checkpoint, _, _) in checkpoints.items()
+            ),
+            default=None,
+        )
+        return checkpoint_timestamp(self.serde.loads_typed(newest[1])) if newest else None
+
+    def prune_thread(self, thread_id: str, keep_last: int) -> int:
+        if keep_last <= 0 or thread_id not in self.storage:
+            return 0
+
+        deleted = 0
+        for checkpoint_ns, checkpoints in self.storage[thread_id].items():
+            if len(checkpoints) <= keep_last:
+                continue
+            kept_ids = sorted(checkpoints, reverse=True)[:keep_last]
+            needed_writes = {*kept_ids, *(checkpoints[cid][2] for cid in kept_ids if checkpoints[cid][2])}
+            for checkpoint_id in [cid for cid in checkpoints if cid not in kept_ids]:
+                del checkpoints[checkpoint_id]
+                deleted += 1
+            for key in [k for k in self.writes if k[:2] == (thread_id, checkpoint_ns) and k[2] not in needed_writes]:
+                del self.writes[key]
+
+            referenced = set()
+            for checkpoint, _, _ in checkpoints.values():
+                referenced.update(self.serde.loads_typed(checkpoint)["channel_versions"].items())
+            for key in [
+                k for k in self.blobs if k[:2] == (thread_id, checkpoint_ns) and (k[2], k[3]) not in referenced
+            ]:
+                del self.blobs[key]
+        return deleted
@@ -3,8 +3,27 @@
 """Web crawling and content extraction utilities."""
 
 from .article import Article
-from .crawler import Crawler
+from .cache import CrawlCache, get_crawl_cache
+from .crawler import Crawler, CrawlLimiter
+from .extraction_pool import ExtractionPool, get_extraction_pool, shutdown_extraction_pool
+from .http_client import aclose_http_clients
 from .jina_client import JinaClient
+from .prefetch import CrawlPrefetcher, aclose_crawl_prefetcher, get_crawl_prefetcher
 from .readability_extractor import ReadabilityExtractor
 
-__all__ = ["Article", "Crawler", "JinaClient", "ReadabilityExtractor"]
+__all__ = [
+    "Article",
+    "CrawlCache",
+    "CrawlLimiter",
+    "CrawlPrefetcher",
+    "Crawler",
+    "ExtractionPool",
+    "JinaClient",
+    "ReadabilityExtractor",
+    "aclose_crawl_prefetcher",
+    "aclose_http_clients",
+    "get_crawl_cache",
+    "get_crawl_prefetcher",
+    "get_extraction_pool",
+    "shutdown_extraction_pool",
+]
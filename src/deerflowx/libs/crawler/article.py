@@ -10,15 +10,18 @@ from markdownify import markdownify as md
 class Article:
     url: str
 
-    def __init__(self, title: str, html_content: str) -> None:
+    def __init__(self, title: str, html_content: str, markdown: str | None = None) -> None:
         self.title = title
         self.html_content = html_content
+        self._markdown = markdown
 
     def to_markdown(self, *, including_title: bool = True) -> str:
+        if self._markdown is None:
+            self._markdown = md(self.html_content)
         markdown = ""
         if including_title:
             markdown += f"# {self.title}\n\n"
-        markdown += md(self.html_content)
+        markdown += self._markdown
         return markdown
 
     def to_message(self) -> list[dict]:
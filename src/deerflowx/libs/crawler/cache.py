@@ -0,0 +1,198 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from deerflowx.config.settings import settings
+
+from .article import Article
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS crawl_cache (
+    url TEXT NOT NULL,
+    return_format TEXT NOT NULL,
+    title TEXT,
+    html_content TEXT NOT NULL,
+    markdown TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    size INTEGER NOT NULL,
+    fetched_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (url, return_format)
+);
+CREATE INDEX IF NOT EXISTS crawl_cache_accessed_at ON crawl_cache (accessed_at);
+"""
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def normalize_url(url: str) -> str:
+    """Normalize a url so that equivalent spellings share a cache entry."""
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, host, parts.path or "/", query, ""))
+
+
+@dataclass
+class CachedArticle:
+    """An extracted article stored in the crawl cache."""
+
+    url: str
+    title: str | None
+    html_content: str
+    markdown: str
+    etag: str | None
+    last_modified: str | None
+    fetched_at: float
+    ttl_seconds: float
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.time() - self.fetched_at < self.ttl_seconds
+
+    @property
+    def validators(self) -> dict[str, str]:
+        """Conditional request headers to revalidate a stale entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_article(self, url: str) -> Article:
+        article = Article(title=self.title, html_content=self.html_content, markdown=self.markdown)
+        article.url = url
+        return article
+
+
+class CrawlCache:
+    """On-disk cache of extracted articles, keyed by normalized url and return format.
+
+    Entries are fresh for ``ttl_seconds``; stale entries with an ETag or Last-Modified
+    validator can be revalidated with a conditional request instead of a full crawl. The
+    cache is bounded to ``max_bytes`` by evicting the least recently accessed entries.
+    """
+
+    def __init__(self, path: str | Path, *, ttl_seconds: float, max_bytes: int) -> None:
+        self.path = str(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA busy_timeout = 5000")
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def get(self, url: str, return_format: str) -> CachedArticle | None:
+        key = normalize_url(url)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT title, html_content, markdown, etag, last_modified, fetched_at FROM crawl_cache "
+                "WHERE url = ? AND return_format = ?",
+                (key, return_format),
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE crawl_cache SET accessed_at = ? WHERE url = ? AND return_format = ?",
+                (time.time(), key, return_format),
+            )
+        title, html_content, markdown, etag, last_modified, fetched_at = row
+        return CachedArticle(key, title, html_content, markdown, etag, last_modified, fetched_at, self.ttl_seconds)
+
+    def put(
+        self,
+        url: str,
+        return_format: str,
+        article: Article,
+        *,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        markdown = article.to_markdown(including_title=False)
+        size = len(article.html_content.encode()) + len(markdown.encode())
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO crawl_cache (url, return_format, title, html_content, markdown, "
+                "etag, last_modified, size, fetched_at, accessed_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    normalize_url(url),
+                    return_format,
+                    article.title,
+                    article.html_content,
+                    markdown,
+                    etag,
+                    last_modified,
+                    size,
+                    now,
+                    now,
+                ),
+            )
+            self._evict()
+
+    def refresh(self, url: str, return_format: str) -> None:
+        """Mark a revalidated entry as freshly fetched."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE crawl_cache SET fetched_at = ?, accessed_at = ? WHERE url = ? AND return_format = ?",
+                (now, now, normalize_url(url), return_format),
+            )
+
+    @property
+    def total_bytes(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM crawl_cache").fetchone()[0]
+
+    def _evict(self) -> None:
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM crawl_cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute("SELECT url, return_format, size FROM crawl_cache ORDER BY accessed_at").fetchall()
+        for url, return_format, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM crawl_cache WHERE url = ? AND return_format = ?", (url, return_format))
+            total -= size
+
+
+_crawl_cache: CrawlCache | None = None
+
+
+def get_crawl_cache() -> CrawlCache | None:
+    """Return the process-wide crawl cache, or None when caching is disabled."""
+    global _crawl_cache  # noqa: PLW0603
+    if not settings.crawler.cache_enabled:
+        return None
+    if _crawl_cache is None:
+        _crawl_cache = CrawlCache(
+            settings.crawler.cache_path,
+            ttl_seconds=settings.crawler.cache_ttl_seconds,
+            max_bytes=settings.crawler.cache_max_bytes,
+        )
+        logger.info(f"Crawl cache initialized at {settings.crawler.cache_path}")
+    return _crawl_cache
@@ -1,13 +1,71 @@
 # Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
 # SPDX-License-Identifier: MIT
 
+import asyncio
+import functools
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from urllib.parse import urlsplit
+
+from deerflowx.config.settings import settings
 
 from .article import Article
+from .cache import CrawlCache
+from .extraction_pool import ExtractionPool
 from .jina_client import JinaClient
 from .readability_extractor import ReadabilityExtractor
 
 
+class CrawlLimiter:
+    """Bound the number of concurrent crawls, globally and per target domain."""
+
+    def __init__(self, max_concurrency: int, max_concurrency_per_domain: int) -> None:
+        self.max_concurrency = max_concurrency
+        self.max_concurrency_per_domain = max_concurrency_per_domain
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._global: asyncio.Semaphore | None = None
+        # domain -> (semaphore, number of crawls holding or waiting for it)
+        self._domains: dict[str, tuple[asyncio.Semaphore, int]] = {}
+
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[None]:
+        """Wait for a free crawl slot for ``url``."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._global = asyncio.Semaphore(self.max_concurrency)
+            self._domains = {}
+
+        domain = urlsplit(url).hostname or ""
+        semaphore, users = self._domains.get(domain, (None, 0))
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency_per_domain)
+        self._domains[domain] = (semaphore, users + 1)
+        try:
+            async with semaphore, self._global:
+                yield
+        finally:
+            semaphore, users = self._domains[domain]
+            if users == 1:
+                del self._domains[domain]
+            else:
+                self._domains[domain] = (semaphore, users - 1)
+
+
+_default_limiter = CrawlLimiter(settings.crawler.max_concurrency, settings.crawler.max_concurrency_per_domain)
+
+
 class Crawler:
+    def __init__(
+        self,
+        limiter: CrawlLimiter | None = None,
+        cache: CrawlCache | None = None,
+        extraction_pool: ExtractionPool | None = None,
+    ) -> None:
+        self.limiter = limiter or _default_limiter
+        self.cache = cache
+        self.extraction_pool = extraction_pool
+
     def crawl(self, url: str) -> Article:
         # To help LLMs better understand content, we extract clean
         # articles from HTML, convert them to markdown, and split
@@ -20,8 +78,64 @@ class Crawler:
         # Instead of using Jina's own markdown converter, we'll use
         # our own solution to get better readability results.
         jina_client = JinaClient()
-        html = jina_client.crawl(url, return_format="html")
+        if self.cache is None:
+            html = jina_client.crawl(url, return_format="html")
+            return self._extract(url, html)
+
+        cached = self.cache.get(url, "html")
+        if cached is not None and cached.is_fresh:
+            return cached.to_article(url)
+        response = jina_client.fetch(url, "html", cached.validators if cached else None)
+        if cached is not None and response.not_modified:
+            self.cache.refresh(url, "html")
+            return cached.to_article(url)
+        article = self._extract(url, response.text)
+        if response.ok:
+            self.cache.put(url, "html", article, etag=response.etag, last_modified=response.last_modified)
+        return article
+
+    async def acrawl(self, url: str) -> Article:
+        if self.cache is None:
+            async with self.limiter.slot(url):
+                html = await JinaClient().acrawl(url, return_format="html")
+            return await self._aextract(url, html)
+
+        cached = await asyncio.to_thread(self.cache.get, url, "html")
+        if cached is not None and cached.is_fresh:
+            return cached.to_article(url)
+        async with self.limiter.slot(url):
+            response = await JinaClient().afetch(url, "html", cached.validators if cached else None)
+        if cached is not None and response.not_modified:
+            await asyncio.to_thread(self.cache.refresh, url, "html")
+            return cached.to_article(url)
+        article = await self._aextract(url, response.text)
+        if response.ok:
+            await asyncio.to_thread(
+                functools.partial(
+                    self.cache.put, url, "html", article, etag=response.etag, last_modified=response.last_modified
+                )
+            )
+        return article
+
+    async def acrawl_many(self, urls: list[str]) -> list[Article | Exception]:
+        """Crawl urls concurrently, returning an article or the raised exception per url."""
+        results = await asyncio.gather(*(self.acrawl(url) for url in urls), return_exceptions=True)
+        for result in results:
+            # Cancellation must propagate rather than be reported per url
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result
+        return results
+
+    def _extract(self, url: str, html: str) -> Article:
+        if self.extraction_pool is not None:
+            return self.extraction_pool.extract(url, html)
         extractor = ReadabilityExtractor()
         article = extractor.extract_article(html)
         article.url = url
         return article
+
+    async def _aextract(self, url: str, html: str) -> Article:
+        # Extraction is CPU bound, keep it off the event loop
+        if self.extraction_pool is not None:
+            return await self.extraction_pool.aextract(url, html)
+        return await asyncio.to_thread(self._extract, url, html)
@@ -0,0 +1,215 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import logging
+import multiprocessing
+import queue
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future
+from multiprocessing.connection import Connection
+
+from deerflowx.config.settings import settings
+
+from .article import Article
+from .readability_extractor import ReadabilityExtractor
+
+logger = logging.getLogger(__name__)
+
+
+def _warm_up() -> None:
+    # Import the HTML processing stack once per worker instead of on the first document
+    import markdownify  # noqa: F401, PLC0415
+    import readabilipy  # noqa: F401, PLC0415
+
+
+def _extract(html: str) -> tuple[str | None, str, str]:
+    article = ReadabilityExtractor().extract_article(html)
+    return article.title, article.html_content, article.to_markdown(including_title=False)
+
+
+def _serve(conn: Connection, extract: Callable[[str], tuple[str | None, str, str]]) -> None:
+    _warm_up()
+    conn.send(None)
+    while True:
+        try:
+            html = conn.recv()
+        except EOFError:
+            return
+        try:
+            conn.send((True, extract(html)))
+        except Exception as e:
+            conn.send((False, RuntimeError(f"{type(e).__name__}: {e}")))
+
+
+class _Worker:
+    """One worker process and the pipe to it, replaced when a document hangs or kills it.
+
+    Workers are spawned rather than forked: they are started from a server that already
+    runs many threads, and a forked child could inherit locks held by those threads.
+    """
+
+    def __init__(self) -> None:
+        self._conn: Connection | None = None
+        self._process: multiprocessing.process.BaseProcess | None = None
+
+    def run(self, html: str, timeout_seconds: float) -> tuple[str | None, str, str]:
+        if self._process is None or not self._process.is_alive():
+            # Start a worker that failed to start, or replace one that died between documents
+            self.stop()
+            self.start()
+        try:
+            self._conn.send(html)
+            # The clock starts once the document is in the worker, not when it was queued
+            done = self._conn.poll(timeout_seconds)
+            result = self._conn.recv() if done else None
+        except (OSError, EOFError) as e:
+            self.restart()
+            msg = "Extraction worker exited unexpectedly"
+            raise RuntimeError(msg) from e
+        if result is None:
+            self.restart()
+            raise TimeoutError
+        ok, value = result
+        if not ok:
+            raise value
+        return value
+
+    def start(self) -> None:
+        context = multiprocessing.get_context("spawn")
+        self._conn, child_conn = context.Pipe()
+        # Pass the extractor explicitly, since a spawned worker imports this module afresh
+        self._process = context.Process(target=_serve, args=(child_conn, _extract), daemon=True)
+        try:
+            self._process.start()
+            child_conn.close()
+            # Wait for the warm-up, so it does not count against the first document's timeout
+            self._conn.recv()
+        except BaseException:
+            child_conn.close()
+            self.stop()
+            raise
+
+    def restart(self) -> None:
+        """Replace the worker process; if the new one fails to start, the next document retries."""
+        self.stop()
+        try:
+            self.start()
+        except Exception:
+            logger.exception("Failed to restart an extraction worker")
+
+    def stop(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        if self._process is not None:
+            if self._process.pid is not None:
+                self._process.terminate()
+                self._process.join()
+            self._process = None
+
+
+class ExtractionPool:
+    """Bounded pool of warm worker processes for readability extraction and markdown conversion.
+
+    Both steps are CPU-bound pure-Python code that holds the GIL, so running them in worker
+    processes keeps large pages from stalling the event loop and other streams. Documents
+    wait in a queue for a free worker; a document that runs longer than ``timeout_seconds``
+    in its worker fails with ``TimeoutError`` and that worker alone is replaced, since a
+    busy worker process cannot be interrupted.
+    """
+
+    def __init__(self, max_workers: int, timeout_seconds: float) -> None:
+        self.max_workers = max_workers
+        self.timeout_seconds = timeout_seconds
+        self._lock = threading.Lock()
+        self._jobs: queue.SimpleQueue[tuple[str, str, Future] | None] | None = None
+
+    def extract(self, url: str, html: str) -> Article:
+        title, html_content, markdown = self._submit(url, html).result()
+        return self._to_article(url, title, html_content, markdown)
+
+    async def aextract(self, url: str, html: str) -> Article:
+        title, html_content, markdown = await asyncio.wrap_future(self._submit(url, html))
+        return self._to_article(url, title, html_content, markdown)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            jobs, self._jobs = self._jobs, None
+        if jobs is None:
+            return
+        while True:
+            try:
+                job = jobs.get_nowait()
+            except queue.Empty:
+                break
+            if job is not None:
+                job[2].cancel()
+        for _ in range(self.max_workers):
+            jobs.put(None)
+
+    def _submit(self, url: str, html: str) -> Future:
+        future: Future = Future()
+        with self._lock:
+            if self._jobs is None:
+                self._jobs = queue.SimpleQueue()
+                # Start every worker now so the first documents do not pay for process startup
+                for i in range(self.max_workers):
+                    threading.Thread(
+                        target=self._dispatch, args=(self._jobs,), name=f"extraction-worker-{i}", daemon=True
+                    ).start()
+            self._jobs.put((url, html, future))
+        return future
+
+    def _dispatch(self, jobs: queue.SimpleQueue) -> None:
+        worker = _Worker()
+        try:
+            worker.start()
+        except Exception:
+            # Documents still get served: each one retries the start, and fails if it fails again
+            logger.exception("Failed to start an extraction worker")
+        try:
+            while (job := jobs.get()) is not None:
+                url, html, future = job
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    future.set_result(worker.run(html, self.timeout_seconds))
+                except TimeoutError:
+                    logger.warning(
+                        f"Extraction of {url} timed out after {self.timeout_seconds}s, restarting its worker"
+                    )
+                    future.set_exception(TimeoutError(f"Extraction of {url} exceeded {self.timeout_seconds}s"))
+                except Exception as e:
+                    future.set_exception(e)
+        finally:
+            worker.stop()
+
+    @staticmethod
+    def _to_article(url: str, title: str | None, html_content: str, markdown: str) -> Article:
+        article = Article(title=title, html_content=html_content, markdown=markdown)
+        article.url = url
+        return article
+
+
+_extraction_pool: ExtractionPool | None = None
+
+
+def get_extraction_pool() -> ExtractionPool | None:
+    """Return the process-wide extraction pool, or None when extraction runs inline."""
+    global _extraction_pool  # noqa: PLW0603
+    if settings.crawler.extraction_mode != "process":
+        return None
+    if _extraction_pool is None:
+        _extraction_pool = ExtractionPool(
+            settings.crawler.extraction_workers,
+            settings.crawler.extraction_timeout_seconds,
+        )
+    return _extraction_pool
+
+
+def shutdown_extraction_pool() -> None:
+    """Stop the worker processes of the extraction pool."""
+    if _extraction_pool is not None:
+        _extraction_pool.shutdown()
@@ -0,0 +1,36 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+"""Shared keep-alive HTTP clients used by the crawler."""
+
+import httpx
+import requests
+
+from deerflowx.config.settings import settings
+from deerflowx.utils.http_pool import aclose_clients, get_async_client, get_session
+
+_CLIENT_NAME = "crawler"
+
+
+def _create_async_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        timeout=settings.crawler.timeout_seconds,
+        limits=httpx.Limits(
+            max_connections=settings.crawler.max_keepalive_connections * 2,
+            max_keepalive_connections=settings.crawler.max_keepalive_connections,
+        ),
+    )
+
+
+def get_http_session() -> requests.Session:
+    """Return the process-wide ``requests`` session, so sync crawls reuse connections."""
+    return get_session(_CLIENT_NAME, requests.Session)
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """Return the pooled async HTTP client of the running event loop."""
+    return get_async_client(_CLIENT_NAME, _create_async_client)
+
+
+async def aclose_http_clients() -> None:
+    """Close the shared HTTP clients."""
+    await aclose_clients(_CLIENT_NAME)
@@ -3,17 +3,73 @@
 
 import logging
 import os
+from dataclasses import dataclass
+from http import HTTPStatus
 
-import requests
+from deerflowx.config.settings import settings
+
+from .http_client import get_async_http_client, get_http_session
 
 logger = logging.getLogger(__name__)
 
+JINA_READER_URL = "https://r.jina.ai/"
+
+
+@dataclass
+class CrawlResponse:
+    status_code: int
+    text: str
+    etag: str | None = None
+    last_modified: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return HTTPStatus.OK <= self.status_code < HTTPStatus.MULTIPLE_CHOICES
+
+    @property
+    def not_modified(self) -> bool:
+        return self.status_code == HTTPStatus.NOT_MODIFIED
+
 
 class JinaClient:
     def crawl(self, url: str, return_format: str = "html") -> str:
+        return self.fetch(url, return_format).text
+
+    async def acrawl(self, url: str, return_format: str = "html") -> str:
+        return (await self.afetch(url, return_format)).text
+
+    def fetch(self, url: str, return_format: str = "html", validators: dict[str, str] | None = None) -> CrawlResponse:
+        """Crawl a url, sending conditional request headers when revalidating a cached copy."""
+        response = get_http_session().post(
+            JINA_READER_URL,
+            headers=self._build_headers(return_format, validators),
+            json={"url": url},
+            timeout=settings.crawler.timeout_seconds,
+        )
+        return CrawlResponse(
+            response.status_code, response.text, response.headers.get("ETag"), response.headers.get("Last-Modified")
+        )
+
+    async def afetch(
+        self,
+        url: str,
+        return_format: str = "html",
+        validators: dict[str, str] | None = None,
+    ) -> CrawlResponse:
+        response = await get_async_http_client().post(
+            JINA_READER_URL,
+            headers=self._build_headers(return_format, validators),
+            json={"url": url},
+        )
+        return CrawlResponse(
+            response.status_code, response.text, response.headers.get("ETag"), response.headers.get("Last-Modified")
+        )
+
+    def _build_headers(self, return_format: str, validators: dict[str, str] | None = None) -> dict[str, str]:
         headers = {
             "Content-Type": "application/json",
             "X-Return-Format": return_format,
+            **(validators or {}),
         }
         if os.getenv("JINA_API_KEY"):
             headers["Authorization"] = f"Bearer {os.getenv('JINA_API_KEY')}"
@@ -22,6 +78,4 @@ class JinaClient:
                 "Jina API key is not set. Provide your own key to access a higher rate limit. "
                 "See https://jina.ai/reader for more information.",
             )
-        data = {"url": url}
-        response = requests.post("https://r.jina.ai/", headers=headers, json=data, timeout=30)
-        return response.text
+        return headers
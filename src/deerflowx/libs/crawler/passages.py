@@ -0,0 +1,88 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+import re
+
+from deerflowx.utils.bm25 import BM25, tokenize
+from deerflowx.utils.tokenizer import Tokenizer, get_tokenizer, split_sentences
+
+PASSAGE_SEPARATOR = "\n\n...\n\n"
+
+
+def split_passages(markdown: str, max_chars: int) -> list[str]:
+    """Split markdown into passages of whole paragraphs of at most ``max_chars``.
+
+    Each heading starts a new passage together with the paragraphs that follow it, and
+    paragraphs longer than ``max_chars`` are split on sentence boundaries.
+    """
+    passages: list[str] = []
+    current = ""
+    for block in _paragraphs(markdown, max_chars):
+        # A heading starts a new passage; short paragraphs of one section are merged
+        if current and (block.startswith("#") or len(current) + len(block) + 2 > max_chars):
+            passages.append(current)
+            current = ""
+        current = f"{current}\n\n{block}" if current else block
+    if current:
+        passages.append(current)
+    return passages
+
+
+def _paragraphs(markdown: str, max_chars: int) -> list[str]:
+    blocks: list[str] = []
+    for paragraph in re.split(r"\n\s*\n", markdown):
+        paragraph = paragraph.strip()  # noqa: PLW2901
+        if not paragraph:
+            continue
+        if len(paragraph) <= max_chars:
+            blocks.append(paragraph)
+            continue
+        piece = ""
+        for sentence in split_sentences(paragraph):
+            while len(sentence) > max_chars:
+                if piece:
+                    blocks.append(piece)
+                    piece = ""
+                blocks.append(sentence[:max_chars])
+                sentence = sentence[max_chars:]  # noqa: PLW2901
+            if piece and len(piece) + len(sentence) + 1 > max_chars:
+                blocks.append(piece)
+                piece = ""
+            piece = f"{piece} {sentence}" if piece else sentence
+        if piece:
+            blocks.append(piece)
+    return blocks
+
+
+def select_passages(
+    passages: list[str], query: str | None, token_budget: int, tokenizer: Tokenizer | None = None
+) -> list[str]:
+    """Pick the passages most relevant to ``query`` that fit in ``token_budget`` tokens of ``tokenizer``.
+
+    Passages are ranked with BM25 and returned in document order. Without a query, or when
+    no passage matches it, the leading passages are returned.
+    """
+    tokenizer = tokenizer or get_tokenizer()
+    order = list(range(len(passages)))
+    query_terms = tokenize(query) if query else []
+    if query_terms:
+        scores = BM25([tokenize(passage) for passage in passages]).scores(query_terms)
+        if any(scores):
+            order.sort(key=lambda index: (-scores[index], index))
+
+    separator_cost = tokenizer.count(PASSAGE_SEPARATOR)
+    passage_tokens = tokenizer.count_batch(passages)
+    selected: list[int] = []
+    remaining = token_budget
+    for index in order:
+        cost = passage_tokens[index] + (separator_cost if selected else 0)
+        if cost <= remaining:
+            selected.append(index)
+            remaining -= cost
+        elif not query_terms:
+            # Leading passages must stay contiguous
+            break
+    if not selected and passages:
+        # Even the best passage exceeds the budget
+        return [tokenizer.split(passages[order[0]], chunk_size=max(token_budget, 1), overlap=0)[0]]
+    return [passages[index] for index in sorted(selected)]
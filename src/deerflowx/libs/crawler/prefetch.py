@@ -0,0 +1,124 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import Iterable
+
+from deerflowx.config.settings import settings
+
+from .cache import CrawlCache, get_crawl_cache, normalize_url
+from .crawler import Crawler
+from .extraction_pool import ExtractionPool, get_extraction_pool
+
+logger = logging.getLogger(__name__)
+
+
+class CrawlPrefetcher:
+    """Crawl the urls an agent is likely to read next and park the articles in the crawl cache.
+
+    Speculative crawls run in the background on at most ``max_concurrency`` of the crawler's
+    slots, so they cannot starve the crawls an agent actually asked for. Urls offered while
+    ``max_pending`` prefetches are already queued are dropped rather than queued.
+    """
+
+    def __init__(
+        self,
+        cache: CrawlCache,
+        extraction_pool: ExtractionPool | None = None,
+        *,
+        max_concurrency: int,
+        max_pending: int,
+    ) -> None:
+        self.cache = cache
+        self.extraction_pool = extraction_pool
+        self.max_concurrency = max_concurrency
+        self.max_pending = max_pending
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._tasks: dict[str, asyncio.Task] = {}
+
+    def prefetch(self, urls: Iterable[str]) -> int:
+        """Schedule background crawls of ``urls`` and return how many were scheduled."""
+        self._bind_to_running_loop()
+        scheduled = 0
+        for url in urls:
+            key = normalize_url(url)
+            if key in self._tasks:
+                continue
+            if len(self._tasks) >= self.max_pending:
+                logger.debug(f"Prefetch queue is full, not prefetching {url}")
+                break
+            task = asyncio.create_task(self._prefetch(url), name=f"prefetch-{key}")
+            self._tasks[key] = task
+            task.add_done_callback(lambda _, key=key: self._tasks.pop(key, None))
+            scheduled += 1
+        return scheduled
+
+    async def wait_for(self, url: str) -> None:
+        """Wait for a running prefetch of ``url``, so the caller is served from the cache."""
+        if self._loop is not asyncio.get_running_loop():
+            return
+        task = self._tasks.get(normalize_url(url))
+        if task is not None:
+            # The prefetch reports its own failures; the caller crawls again on a cache miss
+            with contextlib.suppress(Exception):
+                await asyncio.shield(task)
+
+    @property
+    def pending(self) -> int:
+        return len(self._tasks)
+
+    async def close(self) -> None:
+        """Cancel the running prefetches."""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _bind_to_running_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._tasks = {}
+
+    async def _prefetch(self, url: str) -> None:
+        async with self._semaphore:
+            cached = await asyncio.to_thread(self.cache.get, url, "html")
+            if cached is not None and cached.is_fresh:
+                return
+            try:
+                await Crawler(cache=self.cache, extraction_pool=self.extraction_pool).acrawl(url)
+            except Exception as e:
+                logger.debug(f"Prefetch of {url} failed: {e!r}")
+            else:
+                logger.debug(f"Prefetched {url}")
+
+
+_crawl_prefetcher: CrawlPrefetcher | None = None
+
+
+def get_crawl_prefetcher() -> CrawlPrefetcher | None:
+    """Return the process-wide prefetcher, or None when prefetching or the crawl cache is disabled."""
+    global _crawl_prefetcher  # noqa: PLW0603
+    if not settings.crawler.prefetch_enabled:
+        return None
+    cache = get_crawl_cache()
+    if cache is None:
+        return None
+    if _crawl_prefetcher is None or _crawl_prefetcher.cache is not cache:
+        _crawl_prefetcher = CrawlPrefetcher(
+            cache,
+            get_extraction_pool(),
+            max_concurrency=settings.crawler.prefetch_max_concurrency,
+            max_pending=settings.crawler.prefetch_max_pending,
+        )
+    return _crawl_prefetcher
+
+
+async def aclose_crawl_prefetcher() -> None:
+    """Cancel the running prefetches of the process-wide prefetcher."""
+    if _crawl_prefetcher is not None:
+        await _crawl_prefetcher.close()
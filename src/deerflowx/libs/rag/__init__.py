@@ -3,6 +3,12 @@
 """Retrieval-Augmented Generation (RAG) utilities and providers."""
 
 from .builder import build_retriever
+from .catalog import ResourceCatalog, aclose_resource_catalog, get_resource_catalog
+from .http_client import aclose_rag_http_clients
+from .hybrid import HybridRetriever
+from .ingest import IngestStats, build_local_index, ingest_local_documents
+from .local import LocalIndexProvider
+from .local_index import LocalDataset, LocalDocument, LocalIndex
 from .ragflow import RAGFlowProvider
 from .retriever import Chunk, Document, Resource, Retriever
 from .vikingdb_knowledge_base import VikingDBKnowledgeBaseProvider
@@ -10,9 +16,21 @@ from .vikingdb_knowledge_base import VikingDBKnowledgeBaseProvider
 __all__ = [
     "Chunk",
     "Document",
+    "HybridRetriever",
+    "IngestStats",
+    "LocalDataset",
+    "LocalDocument",
+    "LocalIndex",
+    "LocalIndexProvider",
     "RAGFlowProvider",
     "Resource",
+    "ResourceCatalog",
     "Retriever",
     "VikingDBKnowledgeBaseProvider",
+    "aclose_rag_http_clients",
+    "aclose_resource_catalog",
+    "build_local_index",
     "build_retriever",
+    "get_resource_catalog",
+    "ingest_local_documents",
 ]
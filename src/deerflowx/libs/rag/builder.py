@@ -1,21 +1,36 @@
 # Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
 # SPDX-License-Identifier: MIT
 
+from deerflowx.config.settings import settings
 from deerflowx.config.tools import (  # NOTE: @l8ng need refactor, move this logic to outside of libs/
     SELECTED_RAG_PROVIDER,
     RAGProvider,
 )
+from deerflowx.libs.rag.hybrid import HybridRetriever
+from deerflowx.libs.rag.local import LocalIndexProvider
 from deerflowx.libs.rag.ragflow import RAGFlowProvider
 from deerflowx.libs.rag.retriever import Retriever
 from deerflowx.libs.rag.vikingdb_knowledge_base import VikingDBKnowledgeBaseProvider
 
 
 def build_retriever() -> Retriever | None:
-    if RAGProvider.RAGFLOW.value == SELECTED_RAG_PROVIDER:
+    if not SELECTED_RAG_PROVIDER:
+        return None
+    if RAGProvider.HYBRID.value == SELECTED_RAG_PROVIDER:
+        return HybridRetriever(
+            {provider: _build_provider(provider) for provider in settings.hybrid_rag.provider_list},
+            rrf_k=settings.hybrid_rag.rrf_k,
+            dedup_max_distance=settings.hybrid_rag.dedup_max_distance,
+        )
+    return _build_provider(SELECTED_RAG_PROVIDER)
+
+
+def _build_provider(provider: str) -> Retriever:
+    if RAGProvider.RAGFLOW.value == provider:
         return RAGFlowProvider()
-    if RAGProvider.VIKINGDB_KNOWLEDGE_BASE.value == SELECTED_RAG_PROVIDER:
+    if RAGProvider.VIKINGDB_KNOWLEDGE_BASE.value == provider:
         return VikingDBKnowledgeBaseProvider()
-    if SELECTED_RAG_PROVIDER:
-        msg = f"Unsupported RAG provider: {SELECTED_RAG_PROVIDER}"
-        raise ValueError(msg)
-    return None
+    if RAGProvider.LOCAL.value == provider:
+        return LocalIndexProvider()
+    msg = f"Unsupported RAG provider: {provider}"
+    raise ValueError(msg)
@@ -0,0 +1,109 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import bisect
+import logging
+import time
+
+from deerflowx.config.settings import settings
+
+from .builder import build_retriever
+from .retriever import Resource, Retriever
+
+logger = logging.getLogger(__name__)
+
+
+class ResourceCatalog:
+    """In-memory catalog of the resources of a RAG provider, refreshed in the background.
+
+    The full resource list is fetched once and filtered in memory, so the resource picker
+    gets an answer per keystroke without a round trip to the provider. After
+    ``ttl_seconds`` the catalog keeps serving the stale list while one background task
+    fetches a new one (stale-while-revalidate); a failed refresh keeps the stale list.
+    """
+
+    def __init__(self, retriever: Retriever, ttl_seconds: float) -> None:
+        self.retriever = retriever
+        self.ttl_seconds = ttl_seconds
+        self._resources: list[Resource] | None = None
+        self._prefixes: list[tuple[str, int]] = []
+        self._fetched_at = 0.0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._refresh: asyncio.Task | None = None
+
+    async def search(self, query: str | None = None) -> list[Resource]:
+        """Return the resources whose title has a word starting with ``query``, ignoring case."""
+        self._bind_to_running_loop()
+        if self._resources is None:
+            # Nothing to serve yet; concurrent first requests share one fetch
+            await asyncio.shield(self._start_refresh())
+        elif time.monotonic() - self._fetched_at >= self.ttl_seconds:
+            self._start_refresh()
+        return self._filter(query)
+
+    async def close(self) -> None:
+        """Cancel a running refresh."""
+        if self._refresh is not None:
+            self._refresh.cancel()
+            await asyncio.gather(self._refresh, return_exceptions=True)
+
+    def _bind_to_running_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._refresh = None
+
+    def _start_refresh(self) -> asyncio.Task:
+        if self._refresh is None or self._refresh.done():
+            self._refresh = asyncio.create_task(self._fetch(), name="rag-resource-catalog-refresh")
+        return self._refresh
+
+    async def _fetch(self) -> None:
+        try:
+            resources = await self.retriever.alist_resources()
+        except Exception as e:
+            if self._resources is None:
+                raise
+            logger.warning(f"Failed to refresh the RAG resource catalog, serving the stale one: {e!r}")
+            return
+        self._index(resources)
+        logger.debug(f"Refreshed the RAG resource catalog, {len(resources)} resources")
+
+    def _index(self, resources: list[Resource]) -> None:
+        # Every word-aligned suffix of a title, so a prefix query matches at any word
+        prefixes = []
+        for i, resource in enumerate(resources):
+            words = resource.title.lower().split()
+            prefixes.extend((" ".join(words[start:]), i) for start in range(len(words)))
+        prefixes.sort()
+        self._resources, self._prefixes, self._fetched_at = resources, prefixes, time.monotonic()
+
+    def _filter(self, query: str | None) -> list[Resource]:
+        query = " ".join((query or "").lower().split())
+        if not query:
+            return list(self._resources)
+        start = bisect.bisect_left(self._prefixes, (query,))
+        end = bisect.bisect_left(self._prefixes, (query + "\U0010ffff",))
+        matches = sorted({i for _, i in self._prefixes[start:end]})
+        return [self._resources[i] for i in matches]
+
+
+_resource_catalog: ResourceCatalog | None = None
+
+
+def get_resource_catalog() -> ResourceCatalog | None:
+    """Return the process-wide resource catalog, or None when no RAG provider is configured."""
+    global _resource_catalog  # noqa: PLW0603
+    if _resource_catalog is None:
+        retriever = build_retriever()
+        if retriever is None:
+            return None
+        _resource_catalog = ResourceCatalog(retriever, settings.rag.resources_ttl_seconds)
+    return _resource_catalog
+
+
+async def aclose_resource_catalog() -> None:
+    """Cancel a running refresh of the process-wide resource catalog."""
+    if _resource_catalog is not None:
+        await _resource_catalog.close()
@@ -0,0 +1,45 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+"""Shared keep-alive HTTP clients used by the RAG providers."""
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+from deerflowx.config.settings import settings
+from deerflowx.utils.http_pool import aclose_clients, get_async_client, get_session
+
+_CLIENT_NAME = "rag"
+
+
+def _create_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_maxsize=settings.rag.max_connections)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _create_async_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        timeout=settings.rag.timeout_seconds,
+        limits=httpx.Limits(
+            max_connections=settings.rag.max_connections,
+            max_keepalive_connections=settings.rag.max_keepalive_connections,
+        ),
+    )
+
+
+def get_rag_session() -> requests.Session:
+    """Return the process-wide ``requests`` session for sync provider calls."""
+    return get_session(_CLIENT_NAME, _create_session)
+
+
+def get_rag_async_client() -> httpx.AsyncClient:
+    """Return the pooled async HTTP client of the running event loop."""
+    return get_async_client(_CLIENT_NAME, _create_async_client)
+
+
+async def aclose_rag_http_clients() -> None:
+    """Close the shared RAG HTTP clients."""
+    await aclose_clients(_CLIENT_NAME)
@@ -0,0 +1,203 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+"""Retrieval across several RAG providers with rank fusion and near-duplicate removal."""
+
+import asyncio
+import hashlib
+import logging
+from collections.abc import Awaitable, Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import numpy as np
+
+from deerflowx.libs.search.fusion import canonicalize_url
+from deerflowx.utils.bm25 import tokenize
+
+from .retriever import Document, Resource, Retriever
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RRF_K = 60
+DEFAULT_DEDUP_MAX_DISTANCE = 3
+SHINGLE_SIZE = 3
+
+# Query parameter of a resource uri naming the provider that serves it
+_PROVIDER_PARAM = "provider"
+
+
+def simhash(text: str) -> int:
+    """Return the 64-bit SimHash fingerprint of the word shingles of ``text``.
+
+    Texts that differ in a few words or only in case, punctuation and whitespace get
+    fingerprints a few bits apart.
+    """
+    tokens = tokenize(text)
+    if not tokens:
+        return 0
+    shingles = [" ".join(tokens[i : i + SHINGLE_SIZE]) for i in range(max(len(tokens) - SHINGLE_SIZE + 1, 1))]
+    hashes = np.array(
+        [int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=8).digest()) for shingle in shingles],
+        dtype=np.uint64,
+    )
+    bits = np.unpackbits(hashes.view(np.uint8).reshape(-1, 8), axis=1)
+    # Each bit of the fingerprint is the majority vote of that bit over the shingles
+    majority = bits.sum(axis=0, dtype=np.int64) * 2 > len(shingles)
+    return int(np.packbits(majority).view(np.uint64)[0])
+
+
+def dedup_chunks(documents: list[Document], max_distance: int = DEFAULT_DEDUP_MAX_DISTANCE) -> list[Document]:
+    """Drop the chunks that nearly duplicate an earlier chunk, then the documents left empty."""
+    fingerprints: list[int] = []
+    result = []
+    for document in documents:
+        chunks = []
+        for chunk in document.chunks or []:
+            fingerprint = simhash(chunk.content)
+            if any((fingerprint ^ other).bit_count() <= max_distance for other in fingerprints):
+                continue
+            fingerprints.append(fingerprint)
+            chunks.append(chunk)
+        if chunks:
+            result.append(Document(document.id, document.url, document.title, chunks))
+    return result
+
+
+def fuse_documents(documents_by_provider: Mapping[str, list[Document]], k: int = DEFAULT_RRF_K) -> list[Document]:
+    """Merge ranked document lists with reciprocal-rank fusion.
+
+    Documents with the same url are merged across providers, pooling their chunks, and
+    ranked by ``sum(1 / (k + rank))`` over the providers that returned them.
+    """
+    documents: dict[str, Document] = {}
+    scores: dict[str, float] = {}
+    for provider, provider_documents in documents_by_provider.items():
+        for rank, document in enumerate(provider_documents, start=1):
+            key = canonicalize_url(document.url) if document.url else f"{provider}:{document.id}"
+            scores[key] = scores.get(key, 0.0) + 1 / (k + rank)
+            if key in documents:
+                documents[key].chunks.extend(document.chunks or [])
+            else:
+                documents[key] = Document(document.id, document.url, document.title, list(document.chunks or []))
+    return [documents[key] for key in sorted(documents, key=scores.__getitem__, reverse=True)]
+
+
+def tag_resource(resource: Resource, provider: str) -> Resource:
+    """Return ``resource`` with the name of its provider in the uri."""
+    parts = urlsplit(resource.uri)
+    query = urlencode([*parse_qsl(parts.query), (_PROVIDER_PARAM, provider)])
+    return resource.model_copy(update={"uri": urlunsplit(parts._replace(query=query))})
+
+
+def untag_resource(resource: Resource) -> tuple[str | None, Resource]:
+    """Split a resource tagged by :func:`tag_resource` into its provider and original resource."""
+    parts = urlsplit(resource.uri)
+    params = parse_qsl(parts.query)
+    provider = next((value for key, value in params if key == _PROVIDER_PARAM), None)
+    query = urlencode([(key, value) for key, value in params if key != _PROVIDER_PARAM])
+    return provider, resource.model_copy(update={"uri": urlunsplit(parts._replace(query=query))})
+
+
+class HybridRetriever(Retriever):
+    """HybridRetriever queries several providers concurrently and merges their results.
+
+    Resource uris carry the name of the provider serving them. Documents are fused with
+    reciprocal-rank fusion and near-duplicate chunks are dropped, so the same passage
+    indexed by two providers reaches the agent once. A failing provider is skipped unless
+    every provider fails.
+    """
+
+    def __init__(
+        self,
+        providers: Mapping[str, Retriever],
+        rrf_k: int = DEFAULT_RRF_K,
+        dedup_max_distance: int = DEFAULT_DEDUP_MAX_DISTANCE,
+    ) -> None:
+        if not providers:
+            msg = "HybridRetriever needs at least one provider"
+            raise ValueError(msg)
+        self.providers = dict(providers)
+        self.rrf_k = rrf_k
+        self.dedup_max_distance = dedup_max_distance
+
+    def list_resources(self, query: str | None = None) -> list[Resource]:
+        results = _call_concurrently(
+            {name: partial(provider.list_resources, query) for name, provider in self.providers.items()}
+        )
+        return self._tag_resources(results)
+
+    async def alist_resources(self, query: str | None = None) -> list[Resource]:
+        results = await _acall_concurrently(
+            {name: provider.alist_resources(query) for name, provider in self.providers.items()}
+        )
+        return self._tag_resources(results)
+
+    def query_relevant_documents(self, query: str, resources: list[Resource] | None = None) -> list[Document]:
+        results = _call_concurrently(
+            {
+                name: partial(self.providers[name].query_relevant_documents, query, selected)
+                for name, selected in self._route(resources).items()
+            }
+        )
+        return self._merge(results)
+
+    async def aquery_relevant_documents(
+        self,
+        query: str,
+        resources: list[Resource] | None = None,
+    ) -> list[Document]:
+        results = await _acall_concurrently(
+            {
+                name: self.providers[name].aquery_relevant_documents(query, selected)
+                for name, selected in self._route(resources).items()
+            }
+        )
+        return self._merge(results)
+
+    def _route(self, resources: list[Resource] | None) -> dict[str, list[Resource] | None]:
+        if not resources:
+            return dict.fromkeys(self.providers)
+        routed: dict[str, list[Resource] | None] = {}
+        for resource in resources:
+            provider, original = untag_resource(resource)
+            # A resource without a provider is offered to every provider
+            for name in [provider] if provider else self.providers:
+                if name in self.providers:
+                    routed.setdefault(name, []).append(original)
+        return routed
+
+    def _tag_resources(self, results: dict[str, list[Resource]]) -> list[Resource]:
+        return [tag_resource(resource, name) for name, resources in results.items() for resource in resources]
+
+    def _merge(self, results: dict[str, list[Document]]) -> list[Document]:
+        return dedup_chunks(fuse_documents(results, self.rrf_k), self.dedup_max_distance)
+
+
+def _call_concurrently[T](calls: dict[str, Callable[[], T]]) -> dict[str, T]:
+    if not calls:
+        return {}
+    with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+        futures = {name: executor.submit(call) for name, call in calls.items()}
+        outcomes = {}
+        for name, future in futures.items():
+            try:
+                outcomes[name] = future.result()
+            except Exception as e:
+                outcomes[name] = e
+    return _collect(outcomes)
+
+
+async def _acall_concurrently[T](calls: dict[str, Awaitable[T]]) -> dict[str, T]:
+    outcomes = await asyncio.gather(*calls.values(), return_exceptions=True)
+    return _collect(dict(zip(calls, outcomes, strict=True)))
+
+
+def _collect[T](outcomes: dict[str, T | BaseException]) -> dict[str, T]:
+    results = {name: outcome for name, outcome in outcomes.items() if not isinstance(outcome, BaseException)}
+    errors = {name: outcome for name, outcome in outcomes.items() if isinstance(outcome, BaseException)}
+    for name, error in errors.items():
+        logger.warning(f"RAG provider {name} failed, skipping it: {error!r}")
+    if errors and not results:
+        raise next(iter(errors.values()))
+    return results
@@ -0,0 +1,288 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+"""Parallel ingestion of local files into a :class:`LocalIndex`."""
+
+import hashlib
+import logging
+import re
+import time
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+import numpy as np
+
+from deerflowx.libs.crawler.passages import split_passages
+from deerflowx.utils.bm25 import tokenize
+
+from .local_index import Embedder, LocalDataset, LocalDocument, LocalIndex
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DATASET = "default"
+TEXT_SUFFIXES = (".md", ".markdown", ".txt")
+HTML_SUFFIXES = (".html", ".htm")
+PDF_SUFFIXES = (".pdf",)
+SOURCE_SUFFIXES = TEXT_SUFFIXES + HTML_SUFFIXES + PDF_SUFFIXES
+CHUNK_MAX_CHARS = 1000
+
+_HEADING = re.compile(r"^#{1,6}\s+(.+)$", re.MULTILINE)
+
+
+def litellm_embedder(model: str, batch_size: int = 64) -> Embedder:
+    """Return an embedder backed by ``litellm.embedding``."""
+    import litellm  # noqa: PLC0415
+
+    def embed(texts: list[str]) -> np.ndarray:
+        rows = []
+        for start in range(0, len(texts), batch_size):
+            response = litellm.embedding(model=model, input=texts[start : start + batch_size])
+            rows.extend(item["embedding"] if isinstance(item, dict) else item.embedding for item in response.data)
+        return np.asarray(rows, dtype=np.float32)
+
+    return embed
+
+
+def document_id(dataset_id: str, relative_path: str) -> str:
+    """Return the stable id of a local document, used as the fragment of its ``rag://`` uri."""
+    return hashlib.sha1(f"{dataset_id}/{relative_path}".encode()).hexdigest()[:16]  # noqa: S324
+
+
+def content_hash(path: Path) -> str:
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+@dataclass
+class ParsedFile:
+    """Output of the parse, chunk and tokenize stages for one file."""
+
+    title: str
+    chunks: list[str]
+    chunk_terms: list[dict[str, int]]
+
+
+@dataclass
+class IngestStats:
+    files: int = 0
+    parsed: int = 0
+    reused: int = 0
+    removed: int = 0
+    failed: int = 0
+    chunks: int = 0
+    seconds: float = 0.0
+
+    @property
+    def files_per_second(self) -> float:
+        return self.files / self.seconds if self.seconds else 0.0
+
+    @property
+    def chunks_per_second(self) -> float:
+        return self.chunks / self.seconds if self.seconds else 0.0
+
+
+def parse_file(path: str | Path) -> ParsedFile:
+    """Parse a markdown, text, HTML or PDF file into tokenized chunks."""
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix in HTML_SUFFIXES:
+        title, text = _parse_html(path)
+    elif suffix in PDF_SUFFIXES:
+        title, text = _parse_pdf(path)
+    else:
+        text = path.read_text(encoding="utf-8", errors="replace")
+        heading = _HEADING.search(text)
+        title = heading.group(1).strip() if heading else None
+    chunks = split_passages(text, CHUNK_MAX_CHARS)
+    return ParsedFile(
+        title=title or path.stem,
+        chunks=chunks,
+        chunk_terms=[dict(Counter(tokenize(chunk))) for chunk in chunks],
+    )
+
+
+def _parse_html(path: Path) -> tuple[str | None, str]:
+    from deerflowx.libs.crawler.readability_extractor import ReadabilityExtractor  # noqa: PLC0415
+
+    article = ReadabilityExtractor().extract_article(path.read_text(encoding="utf-8", errors="replace"))
+    return article.title, article.to_markdown(including_title=False)
+
+
+def _parse_pdf(path: Path) -> tuple[str | None, str]:
+    try:
+        from pypdf import PdfReader  # noqa: PLC0415
+    except ImportError:
+        msg = "Ingesting PDF files requires the pypdf package"
+        raise ValueError(msg) from None
+
+    reader = PdfReader(path)
+    title = reader.metadata.title if reader.metadata else None
+    return title, "\n\n".join(page.extract_text() or "" for page in reader.pages)
+
+
+def ingest_local_documents(
+    source_dir: str | Path,
+    index_dir: str | Path,
+    *,
+    embedding_model: str | None = None,
+    workers: int = 1,
+    incremental: bool = True,
+) -> IngestStats:
+    """Index the files under ``source_dir`` into ``index_dir``.
+
+    Every top-level directory is a dataset; files directly under ``source_dir`` belong to
+    the ``default`` dataset. Files stream through parsing, chunking and tokenization in
+    ``workers`` processes while the main process collects them for indexing. With
+    ``incremental``, files whose content hash matches the existing index reuse its chunks,
+    term frequencies and embeddings, and the index is left untouched when nothing changed.
+    The new index replaces the old one atomically, so servers keep reading the old index
+    until the build completes.
+    """
+    started = time.perf_counter()
+    source_dir = Path(source_dir)
+    previous = _load_previous(index_dir, embedding_model) if incremental else None
+    previous_documents = {document.doc_id: i for i, document in enumerate(previous.documents)} if previous else {}
+
+    stats = IngestStats()
+    datasets, reused, jobs = _scan(source_dir, previous, stats)
+    stats.reused = len(reused)
+    stats.removed = len(previous_documents) - len(reused) - sum(job.doc_id in previous_documents for job in jobs)
+
+    if previous is not None and not jobs and not stats.removed:
+        stats.chunks = previous.num_chunks
+        stats.seconds = time.perf_counter() - started
+        logger.info(f"Local RAG index at {index_dir} is up to date")
+        return stats
+
+    documents: list[LocalDocument] = []
+    chunk_terms: dict[str, list[dict[str, int]]] = {}
+    vectors: dict[str, list[np.ndarray | None]] = {}
+    if reused:
+        all_chunk_terms = previous.chunk_terms()
+        document_chunks = previous.document_chunks()
+        for document in reused:
+            chunk_ids = document_chunks[previous_documents[document.doc_id]]
+            documents.append(replace(document, chunks=[previous.chunk(i) for i in chunk_ids]))
+            chunk_terms[document.doc_id] = [all_chunk_terms[i] for i in chunk_ids]
+            vectors[document.doc_id] = [previous.vector(i) for i in chunk_ids]
+
+    for document, result in _parse_files(source_dir, jobs, workers):
+        if isinstance(result, Exception):
+            stats.failed += 1
+            logger.warning(f"Failed to ingest {document.path}: {result!r}")
+            continue
+        stats.parsed += 1
+        documents.append(replace(document, title=result.title, chunks=result.chunks))
+        chunk_terms[document.doc_id] = result.chunk_terms
+        vectors[document.doc_id] = [None] * len(result.chunks)
+
+    documents.sort(key=lambda document: document.path or "")
+    embedder = litellm_embedder(embedding_model) if embedding_model else None
+    index = LocalIndex.build(
+        [datasets[dataset_id] for dataset_id in sorted(datasets)],
+        documents,
+        embedder,
+        embedding_model,
+        chunk_terms=[terms for document in documents for terms in chunk_terms[document.doc_id]],
+        vectors=[vector for document in documents for vector in vectors[document.doc_id]],
+    )
+    index.save(index_dir)
+    stats.chunks = index.num_chunks
+    stats.seconds = time.perf_counter() - started
+    logger.info(
+        f"Indexed {stats.files} files ({stats.parsed} parsed, {stats.reused} unchanged, {stats.failed} failed) "
+        f"into {stats.chunks} chunks in {stats.seconds:.2f}s"
+    )
+    return stats
+
+
+def build_local_index(
+    source_dir: str | Path,
+    index_dir: str | Path,
+    embedding_model: str | None = None,
+) -> LocalIndex:
+    """Index the files under ``source_dir`` into ``index_dir`` in-process and return the index."""
+    ingest_local_documents(source_dir, index_dir, embedding_model=embedding_model)
+    return LocalIndex.load(index_dir)
+
+
+def _scan(
+    source_dir: Path,
+    previous: LocalIndex | None,
+    stats: IngestStats,
+) -> tuple[dict[str, LocalDataset], list[LocalDocument], list[LocalDocument]]:
+    """Return the datasets, the unchanged documents of ``previous`` and the files to parse."""
+    previous_documents = {document.doc_id: document for document in previous.documents} if previous else {}
+    datasets: dict[str, LocalDataset] = {}
+    reused: list[LocalDocument] = []
+    jobs: list[LocalDocument] = []
+    for file in sorted(source_dir.rglob("*")):
+        if not file.is_file() or file.suffix.lower() not in SOURCE_SUFFIXES:
+            continue
+        stats.files += 1
+        relative = file.relative_to(source_dir)
+        dataset_id = relative.parts[0] if len(relative.parts) > 1 else DEFAULT_DATASET
+        datasets.setdefault(dataset_id, LocalDataset(dataset_id, dataset_id))
+        document = LocalDocument(
+            doc_id=document_id(dataset_id, relative.as_posix()),
+            dataset_id=dataset_id,
+            title=file.stem,
+            path=relative.as_posix(),
+            content_hash=content_hash(file),
+        )
+        old = previous_documents.get(document.doc_id)
+        if old is not None and old.content_hash == document.content_hash:
+            reused.append(old)
+        else:
+            jobs.append(document)
+    return datasets, reused, jobs
+
+
+def _load_previous(index_dir: str | Path, embedding_model: str | None) -> LocalIndex | None:
+    if not (Path(index_dir) / "meta.json").exists():
+        return None
+    previous = LocalIndex.load(index_dir)
+    if previous.embedding_model != embedding_model:
+        # Vectors of another model cannot be mixed with new ones
+        logger.info("Embedding model changed, re-indexing all files")
+        return None
+    return previous
+
+
+def _parse_files(
+    source_dir: Path,
+    documents: list[LocalDocument],
+    workers: int,
+) -> Iterator[tuple[LocalDocument, ParsedFile | Exception]]:
+    """Yield the parsed files as they complete, keeping a bounded number in flight."""
+    if workers <= 1 or len(documents) <= 1:
+        for document in documents:
+            try:
+                yield document, parse_file(source_dir / document.path)
+            except Exception as e:
+                yield document, e
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: dict[Future, LocalDocument] = {}
+        queue: Iterable[LocalDocument] = iter(documents)
+        for document in queue:
+            pending[executor.submit(parse_file, source_dir / document.path)] = document
+            # Enough queued work to keep every worker busy without holding every result
+            if len(pending) < workers * 4:
+                continue
+            yield from _collect(pending, wait(pending, return_when=FIRST_COMPLETED).done)
+        while pending:
+            yield from _collect(pending, wait(pending, return_when=FIRST_COMPLETED).done)
+
+
+def _collect(
+    pending: dict[Future, LocalDocument],
+    done: set[Future],
+) -> Iterator[tuple[LocalDocument, ParsedFile | Exception]]:
+    for future in done:
+        document = pending.pop(future)
+        error = future.exception()
+        yield document, error if error is not None else future.result()
@@ -0,0 +1,160 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import os
+import threading
+from pathlib import Path
+from urllib.parse import urlparse
+
+from deerflowx.libs.rag.ingest import litellm_embedder
+from deerflowx.libs.rag.local_index import LocalIndex
+from deerflowx.libs.rag.retriever import Chunk, Document, Resource, Retriever
+
+# Indexes by path, with the version directory and metadata mtime they were opened from
+_indexes: dict[Path, tuple[tuple[Path, int], LocalIndex]] = {}
+_indexes_lock = threading.Lock()
+
+
+def _current_version(path: Path) -> tuple[Path, int]:
+    # ``path`` links to the directory of the current version. It is resolved once, so the
+    # whole index is read from one version even if a re-ingest swaps the link meanwhile.
+    directory = path.resolve()
+    return directory, (directory / "meta.json").stat().st_mtime_ns
+
+
+def _load(path: Path) -> LocalIndex:
+    version = _current_version(path)
+    with _indexes_lock:
+        cached = _indexes.get(path)
+        if cached is None or cached[0] != version:
+            cached = (version, LocalIndex.load(version[0]))
+            _indexes[path] = cached
+        return cached[1]
+
+
+def load_local_index(path: str | Path) -> LocalIndex:
+    """Return the index saved at ``path``, reopening it only after it has been rebuilt."""
+    path = Path(path).absolute()
+    try:
+        return _load(path)
+    except FileNotFoundError:
+        # Re-ingests deleted the version resolved a moment ago; the link now points to a newer one
+        return _load(path)
+
+
+async def aload_local_index(path: str | Path) -> LocalIndex:
+    """Like :func:`load_local_index`, opening the index in a thread so the event loop is not blocked."""
+    path = Path(path).absolute()
+    try:
+        version = _current_version(path)
+    except FileNotFoundError:
+        version = None
+    with _indexes_lock:
+        cached = _indexes.get(path)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    # Memory-mapping the arrays and parsing the metadata take a while on a cold start
+    return await asyncio.to_thread(load_local_index, path)
+
+
+class LocalIndexProvider(Retriever):
+    """LocalIndexProvider retrieves documents from an in-process index of local files."""
+
+    index_path: str
+    retrieval_size: int = 10
+    dense_weight: float = 0.5
+
+    def __init__(self) -> None:
+        index_path = os.getenv("LOCAL_RAG_INDEX_PATH")
+        if not index_path:
+            msg = "LOCAL_RAG_INDEX_PATH is not set"
+            raise ValueError(msg)
+        if not (Path(index_path) / "meta.json").exists():
+            msg = f"No local RAG index found at {index_path}"
+            raise ValueError(msg)
+        self.index_path = index_path
+
+        retrieval_size = os.getenv("LOCAL_RAG_RETRIEVAL_SIZE")
+        if retrieval_size:
+            self.retrieval_size = int(retrieval_size)
+
+        dense_weight = os.getenv("LOCAL_RAG_DENSE_WEIGHT")
+        if dense_weight:
+            self.dense_weight = float(dense_weight)
+
+    @property
+    def index(self) -> LocalIndex:
+        return load_local_index(self.index_path)
+
+    def query_relevant_documents(self, query: str, resources: list[Resource] | None = None) -> list[Document]:
+        index = self.index
+        dataset_ids: list[str] = []
+        doc_ids: list[str] = []
+        for resource in resources or []:
+            dataset_id, doc_id = parse_uri(resource.uri)
+            if doc_id:
+                doc_ids.append(doc_id)
+            else:
+                dataset_ids.append(dataset_id)
+        if resources and not dataset_ids and not doc_ids:
+            return []
+
+        query_vector = None
+        if index.embedding_model and index.has_vectors:
+            query_vector = litellm_embedder(index.embedding_model)([query])[0]
+        hits = index.search(
+            query,
+            self.retrieval_size,
+            dataset_ids=dataset_ids,
+            doc_ids=doc_ids,
+            query_vector=query_vector,
+            dense_weight=self.dense_weight,
+        )
+
+        documents: dict[str, Document] = {}
+        for hit in hits:
+            if hit.document.doc_id not in documents:
+                documents[hit.document.doc_id] = Document(
+                    doc_id=hit.document.doc_id,
+                    url=hit.document.url,
+                    title=hit.document.title,
+                    chunks=[],
+                )
+            documents[hit.document.doc_id].chunks.append(Chunk(content=hit.content, similarity=hit.score))
+        return list(documents.values())
+
+    async def aquery_relevant_documents(
+        self,
+        query: str,
+        resources: list[Resource] | None = None,
+    ) -> list[Document]:
+        index = await aload_local_index(self.index_path)
+        if index.embedding_model:
+            # Embedding the query is a network call
+            return await super().aquery_relevant_documents(query, resources)
+        # Lexical scoring takes well under a millisecond, cheaper than a thread hop
+        return self.query_relevant_documents(query, resources)
+
+    def list_resources(self, query: str | None = None) -> list[Resource]:
+        return [
+            Resource(
+                uri=f"rag://dataset/{dataset.dataset_id}",
+                title=dataset.title,
+                description=dataset.description,
+            )
+            for dataset in self.index.datasets
+            if not query or query.lower() in dataset.title.lower()
+        ]
+
+    async def alist_resources(self, query: str | None = None) -> list[Resource]:
+        await aload_local_index(self.index_path)
+        return self.list_resources(query)
+
+
+def parse_uri(uri: str) -> tuple[str, str]:
+    parsed = urlparse(uri)
+    if parsed.scheme != "rag":
+        msg = f"Invalid URI: {uri}"
+        raise ValueError(msg)
+    return parsed.path.split("/")[1], parsed.fragment
@@ -0,0 +1,336 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+"""On-disk BM25 and dense vector index of local documents."""
+
+import json
+import shutil
+import tempfile
+from collections import Counter
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import asdict, dataclass, field
+from itertools import pairwise
+from pathlib import Path
+
+import numpy as np
+
+from deerflowx.utils.bm25 import tokenize
+
+# Turns texts into embedding vectors, one row per text
+Embedder = Callable[[list[str]], np.ndarray]
+
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+_META_FILE = "meta.json"
+
+
+@dataclass
+class LocalDataset:
+    dataset_id: str
+    title: str
+    description: str = ""
+
+
+@dataclass
+class LocalDocument:
+    doc_id: str
+    dataset_id: str
+    title: str
+    url: str | None = None
+    chunks: list[str] = field(default_factory=list)
+    # Source file and content hash, for incremental re-indexing
+    path: str | None = None
+    content_hash: str | None = None
+
+
+@dataclass
+class ChunkHit:
+    """A chunk of the index matching a query."""
+
+    document: LocalDocument
+    content: str
+    score: float
+
+
+class LocalIndex:
+    """Index of document chunks for lexical (BM25) and optional dense retrieval.
+
+    The inverted index is stored as CSR arrays (per-term offsets into chunk ids and term
+    frequencies) and the chunk embeddings as one normalized matrix, all saved as ``.npy``
+    files and memory-mapped on load, so opening an index is cheap and scoring a query is
+    a handful of vectorized NumPy operations over the postings of its terms.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        datasets: list[LocalDataset],
+        documents: list[LocalDocument],
+        vocabulary: dict[str, int],
+        arrays: dict[str, np.ndarray],
+        chunk_text: np.ndarray,
+        embedding_model: str | None = None,
+    ) -> None:
+        self.datasets = datasets
+        self.documents = documents
+        self.vocabulary = vocabulary
+        self.embedding_model = embedding_model
+        self._arrays = arrays
+        self._chunk_text = chunk_text
+        self._dataset_index = {dataset.dataset_id: i for i, dataset in enumerate(datasets)}
+        self._document_index = {document.doc_id: i for i, document in enumerate(documents)}
+
+    @property
+    def num_chunks(self) -> int:
+        return len(self._arrays["chunk_doc"])
+
+    @property
+    def has_vectors(self) -> bool:
+        return "vectors" in self._arrays
+
+    @classmethod
+    def build(  # noqa: PLR0913
+        cls,
+        datasets: Sequence[LocalDataset],
+        documents: Sequence[LocalDocument],
+        embedder: Embedder | None = None,
+        embedding_model: str | None = None,
+        *,
+        chunk_terms: Sequence[Mapping[str, int]] | None = None,
+        vectors: Sequence[np.ndarray | None] | None = None,
+    ) -> "LocalIndex":
+        """Index the chunks of ``documents``, embedding them when an embedder is given.
+
+        ``chunk_terms`` and ``vectors`` optionally hold the term frequencies and embeddings
+        of the chunks, in document order, computed ahead of time; chunks without a vector
+        are embedded.
+        """
+        documents = [document for document in documents if document.chunks]
+        dataset_index = {dataset.dataset_id: i for i, dataset in enumerate(datasets)}
+        chunks = [chunk for document in documents for chunk in document.chunks]
+        for values in (chunk_terms, vectors):
+            if values is not None and len(values) != len(chunks):
+                msg = f"Expected {len(chunks)} per-chunk values, got {len(values)}"
+                raise ValueError(msg)
+        chunk_doc = np.fromiter(
+            (i for i, document in enumerate(documents) for _ in document.chunks), dtype=np.int32, count=len(chunks)
+        )
+        doc_dataset = np.array([dataset_index[document.dataset_id] for document in documents], dtype=np.int32)
+
+        posting_terms_list: list[str] = []
+        term_freqs: list[int] = []
+        terms_per_chunk = np.zeros(len(chunks), dtype=np.int64)
+        lengths = np.zeros(len(chunks), dtype=np.float32)
+        for chunk_id, chunk in enumerate(chunks):
+            terms = chunk_terms[chunk_id] if chunk_terms is not None else Counter(tokenize(chunk))
+            terms_per_chunk[chunk_id] = len(terms)
+            lengths[chunk_id] = sum(terms.values())
+            posting_terms_list.extend(terms)
+            term_freqs.extend(terms.values())
+        vocabulary = {term: term_id for term_id, term in enumerate(dict.fromkeys(posting_terms_list))}
+
+        # Group the (term, chunk) pairs by term; the stable sort keeps chunk ids ascending
+        posting_terms = np.fromiter(
+            map(vocabulary.__getitem__, posting_terms_list), dtype=np.int64, count=len(posting_terms_list)
+        )
+        order = np.argsort(posting_terms, kind="stable")
+        posting_chunks = np.repeat(np.arange(len(chunks), dtype=np.int32), terms_per_chunk)[order]
+        posting_freqs = np.array(term_freqs, dtype=np.float32)[order]
+        offsets = np.zeros(len(vocabulary) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum(np.bincount(posting_terms, minlength=len(vocabulary)))
+        document_frequencies = np.diff(offsets).astype(np.float32)
+        n = len(chunks)
+        idf = np.log1p((n - document_frequencies + 0.5) / (document_frequencies + 0.5)).astype(np.float32)
+        avg_length = float(lengths.mean()) if n else 0.0
+        norms = (1 - BM25_B + BM25_B * lengths / (avg_length or 1)).astype(np.float32)
+
+        encoded = [chunk.encode() for chunk in chunks]
+        text_offsets = np.zeros(n + 1, dtype=np.int64)
+        text_offsets[1:] = np.cumsum([len(chunk) for chunk in encoded])
+        chunk_text = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+
+        arrays = {
+            "chunk_doc": chunk_doc,
+            "doc_dataset": doc_dataset,
+            "postings_offsets": offsets,
+            "postings_chunks": posting_chunks,
+            "postings_freqs": posting_freqs,
+            "idf": idf,
+            "chunk_norms": norms,
+            "text_offsets": text_offsets,
+        }
+        if embedder is not None and chunks:
+            arrays["vectors"] = _embed(chunks, embedder, vectors)
+        return cls(list(datasets), documents, vocabulary, arrays, chunk_text, embedding_model)
+
+    def save(self, path: str | Path) -> None:
+        """Write the index to the ``path`` directory, replacing an existing index atomically.
+
+        Every save writes a new version directory next to ``path`` and then repoints the
+        ``path`` symlink to it with one atomic rename, so readers always find a complete
+        index. The version it replaces is kept for readers that resolved ``path`` just
+        before the swap; older versions are deleted.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        version_prefix = f".{path.name}-v"
+        version = Path(tempfile.mkdtemp(prefix=version_prefix, dir=path.parent))
+        for name, array in self._arrays.items():
+            np.save(version / f"{name}.npy", array)
+        (version / "chunk_text.bin").write_bytes(np.asarray(self._chunk_text).tobytes())
+        meta = {
+            "datasets": [asdict(dataset) for dataset in self.datasets],
+            "documents": [{**asdict(document), "chunks": []} for document in self.documents],
+            "vocabulary": self.vocabulary,
+            "embedding_model": self.embedding_model,
+        }
+        (version / _META_FILE).write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+
+        if path.is_symlink():
+            previous = path.resolve()
+        elif path.exists():
+            # An index saved as a plain directory is moved aside once, to become a version
+            previous = Path(tempfile.mkdtemp(prefix=version_prefix, dir=path.parent))
+            previous.rmdir()
+            path.rename(previous)
+        else:
+            previous = None
+        link = version.with_name(f"{version.name}.link")
+        link.symlink_to(version.name, target_is_directory=True)
+        link.replace(path)
+
+        for stale in path.parent.glob(f"{version_prefix}*"):
+            if stale.is_symlink():
+                stale.unlink()
+            elif stale not in (version, previous):
+                shutil.rmtree(stale, ignore_errors=True)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "LocalIndex":
+        """Open the index saved in the ``path`` directory, memory-mapping its arrays."""
+        path = Path(path)
+        meta = json.loads((path / _META_FILE).read_text(encoding="utf-8"))
+        arrays = {file.stem: np.load(file, mmap_mode="r") for file in path.glob("*.npy")}
+        text_file = path / "chunk_text.bin"
+        if text_file.stat().st_size:
+            chunk_text = np.memmap(text_file, dtype=np.uint8, mode="r")
+        else:
+            chunk_text = np.zeros(0, dtype=np.uint8)
+        return cls(
+            [LocalDataset(**dataset) for dataset in meta["datasets"]],
+            [LocalDocument(**document) for document in meta["documents"]],
+            meta["vocabulary"],
+            arrays,
+            chunk_text,
+            meta.get("embedding_model"),
+        )
+
+    def chunk(self, chunk_id: int) -> str:
+        offsets = self._arrays["text_offsets"]
+        return bytes(self._chunk_text[offsets[chunk_id] : offsets[chunk_id + 1]]).decode()
+
+    def document_chunks(self) -> list[range]:
+        """Return the chunk ids of every document, in document order."""
+        # Chunks are laid out document by document
+        bounds = np.searchsorted(self._arrays["chunk_doc"], np.arange(len(self.documents) + 1)).tolist()
+        return [range(start, end) for start, end in pairwise(bounds)]
+
+    def chunk_terms(self) -> list[dict[str, int]]:
+        """Return the term frequencies of every chunk, recovered from the postings."""
+        terms = np.empty(len(self.vocabulary), dtype=object)
+        terms[list(self.vocabulary.values())] = list(self.vocabulary)
+        offsets = self._arrays["postings_offsets"]
+        posting_terms = np.repeat(np.arange(len(offsets) - 1), np.diff(offsets))
+        # Regroup the postings by chunk
+        order = np.argsort(self._arrays["postings_chunks"], kind="stable")
+        chunk_terms = terms[posting_terms[order]].tolist()
+        chunk_freqs = self._arrays["postings_freqs"][order].astype(np.int64).tolist()
+        bounds = np.searchsorted(self._arrays["postings_chunks"][order], np.arange(self.num_chunks + 1)).tolist()
+        return [
+            dict(zip(chunk_terms[start:end], chunk_freqs[start:end], strict=True)) for start, end in pairwise(bounds)
+        ]
+
+    def vector(self, chunk_id: int) -> np.ndarray | None:
+        return np.asarray(self._arrays["vectors"][chunk_id]) if self.has_vectors else None
+
+    def search(  # noqa: PLR0913
+        self,
+        query: str,
+        top_k: int,
+        *,
+        dataset_ids: Sequence[str] | None = None,
+        doc_ids: Sequence[str] | None = None,
+        query_vector: np.ndarray | None = None,
+        dense_weight: float = 0.5,
+    ) -> list[ChunkHit]:
+        """Return the ``top_k`` chunks most relevant to ``query``.
+
+        Results are restricted to the given datasets and documents when any are given. With
+        a query vector and an index with embeddings, the max-normalized BM25 score and the
+        cosine similarity are blended with ``dense_weight``.
+        """
+        if not self.num_chunks:
+            return []
+        scores = self._bm25_scores(query)
+        if query_vector is not None and self.has_vectors:
+            if scores.max() > 0:
+                scores /= scores.max()
+            similarity = self._arrays["vectors"] @ _normalize(np.asarray(query_vector, dtype=np.float32))
+            scores = (1 - dense_weight) * scores + dense_weight * similarity
+        else:
+            scores[scores <= 0] = -np.inf
+
+        mask = self._filter_mask(dataset_ids, doc_ids)
+        if mask is not None:
+            scores[~mask] = -np.inf
+        candidates = np.flatnonzero(np.isfinite(scores))
+        if len(candidates) > top_k:
+            candidates = candidates[np.argpartition(-scores[candidates], top_k - 1)[:top_k]]
+        ranked = candidates[np.argsort(-scores[candidates], kind="stable")]
+
+        chunk_doc = self._arrays["chunk_doc"]
+        return [
+            ChunkHit(self.documents[chunk_doc[chunk_id]], self.chunk(chunk_id), float(scores[chunk_id]))
+            for chunk_id in ranked
+        ]
+
+    def _bm25_scores(self, query: str) -> np.ndarray:
+        offsets = self._arrays["postings_offsets"]
+        posting_chunks = self._arrays["postings_chunks"]
+        posting_freqs = self._arrays["postings_freqs"]
+        norms = self._arrays["chunk_norms"]
+        idf = self._arrays["idf"]
+        scores = np.zeros(self.num_chunks, dtype=np.float32)
+        for term in set(tokenize(query)):
+            term_id = self.vocabulary.get(term)
+            if term_id is None:
+                continue
+            start, end = offsets[term_id], offsets[term_id + 1]
+            chunk_ids = posting_chunks[start:end]
+            freqs = posting_freqs[start:end]
+            # Chunk ids are unique within the postings of a term
+            scores[chunk_ids] += idf[term_id] * freqs * (BM25_K1 + 1) / (freqs + BM25_K1 * norms[chunk_ids])
+        return scores
+
+    def _filter_mask(self, dataset_ids: Sequence[str] | None, doc_ids: Sequence[str] | None) -> np.ndarray | None:
+        if not dataset_ids and not doc_ids:
+            return None
+        chunk_doc = self._arrays["chunk_doc"]
+        datasets = [self._dataset_index[d] for d in dataset_ids or [] if d in self._dataset_index]
+        documents = [self._document_index[d] for d in doc_ids or [] if d in self._document_index]
+        chunk_dataset = self._arrays["doc_dataset"][chunk_doc]
+        return np.isin(chunk_dataset, datasets) | np.isin(chunk_doc, documents)
+
+
+def _embed(chunks: list[str], embedder: Embedder, vectors: Sequence[np.ndarray | None] | None) -> np.ndarray:
+    vectors = list(vectors) if vectors is not None else [None] * len(chunks)
+    missing = [i for i, vector in enumerate(vectors) if vector is None]
+    if missing:
+        embedded = np.asarray(embedder([chunks[i] for i in missing]), dtype=np.float32)
+        for i, vector in zip(missing, embedded, strict=True):
+            vectors[i] = vector
+    return _normalize(np.stack(vectors).astype(np.float32))
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.where(norms == 0, 1, norms)
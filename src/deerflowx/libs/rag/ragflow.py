@@ -4,8 +4,7 @@
 import os
 from urllib.parse import urlparse
 
-import requests
-
+from deerflowx.libs.rag.http_client import get_rag_async_client, get_rag_session
 from deerflowx.libs.rag.retriever import Chunk, Document, Resource, Retriever
 
 # HTTP status codes
@@ -37,36 +36,95 @@ class RAGFlowProvider(Retriever):
             self.page_size = int(page_size)
 
     def query_relevant_documents(self, query: str, resources: list[Resource] | None = None) -> list[Document]:
-        if resources is None:
-            resources = []
-        headers = {
+        response = get_rag_session().post(
+            f"{self.api_url}/api/v1/retrieval",
+            headers=self._headers(),
+            json=self._retrieval_payload(query, resources),
+            timeout=30,
+        )
+
+        if response.status_code != HTTP_OK:
+            msg = f"Failed to query documents: {response.text}"
+            raise RuntimeError(msg)
+
+        return self._parse_documents(response.json())
+
+    async def aquery_relevant_documents(
+        self,
+        query: str,
+        resources: list[Resource] | None = None,
+    ) -> list[Document]:
+        response = await get_rag_async_client().post(
+            f"{self.api_url}/api/v1/retrieval",
+            headers=self._headers(),
+            json=self._retrieval_payload(query, resources),
+        )
+
+        if response.status_code != HTTP_OK:
+            msg = f"Failed to query documents: {response.text}"
+            raise RuntimeError(msg)
+
+        return self._parse_documents(response.json())
+
+    def list_resources(self, query: str | None = None) -> list[Resource]:
+        response = get_rag_session().get(
+            f"{self.api_url}/api/v1/datasets",
+            headers=self._headers(),
+            params=self._list_params(query),
+            timeout=30,
+        )
+
+        if response.status_code != HTTP_OK:
+            msg = f"Failed to list resources: {response.text}"
+            raise RuntimeError(msg)
+
+        return self._parse_resources(response.json())
+
+    async def alist_resources(self, query: str | None = None) -> list[Resource]:
+        response = await get_rag_async_client().get(
+            f"{self.api_url}/api/v1/datasets",
+            headers=self._headers(),
+            params=self._list_params(query),
+        )
+
+        if response.status_code != HTTP_OK:
+            msg = f"Failed to list resources: {response.text}"
+            raise RuntimeError(msg)
+
+        return self._parse_resources(response.json())
+
+    def _headers(self) -> dict[str, str]:
+        return {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
         }
 
+    def _retrieval_payload(self, query: str, resources: list[Resource] | None) -> dict:
         dataset_ids: list[str] = []
         document_ids: list[str] = []
 
-        for resource in resources:
+        for resource in resources or []:
             dataset_id, document_id = parse_uri(resource.uri)
             dataset_ids.append(dataset_id)
             if document_id:
                 document_ids.append(document_id)
 
-        payload = {
+        return {
             "question": query,
             "dataset_ids": dataset_ids,
             "document_ids": document_ids,
             "page_size": self.page_size,
         }
 
-        response = requests.post(f"{self.api_url}/api/v1/retrieval", headers=headers, json=payload, timeout=30)
-
-        if response.status_code != HTTP_OK:
-            msg = f"Failed to query documents: {response.text}"
-            raise RuntimeError(msg)
+    @staticmethod
+    def _list_params(query: str | None) -> dict[str, str]:
+        params = {}
+        if query:
+            params["name"] = query
+        return params
 
-        result = response.json()
+    @staticmethod
+    def _parse_documents(result: dict) -> list[Document]:
         data = result.get("data", {})
         doc_aggs = data.get("doc_aggs", [])
         docs: dict[str, Document] = {
@@ -90,23 +148,8 @@ class RAGFlowProvider(Retriever):
 
         return list(docs.values())
 
-    def list_resources(self, query: str | None = None) -> list[Resource]:
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
-
-        params = {}
-        if query:
-            params["name"] = query
-
-        response = requests.get(f"{self.api_url}/api/v1/datasets", headers=headers, params=params, timeout=30)
-
-        if response.status_code != HTTP_OK:
-            msg = f"Failed to list resources: {response.text}"
-            raise RuntimeError(msg)
-
-        result = response.json()
+    @staticmethod
+    def _parse_resources(result: dict) -> list[Resource]:
         resources = []
 
         for item_data in result.get("data", []):
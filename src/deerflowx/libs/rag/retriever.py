@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: MIT
 
 import abc
+import asyncio
 
 from pydantic import BaseModel, Field
 
@@ -68,3 +69,23 @@ class Retriever(abc.ABC):
     @abc.abstractmethod
     def query_relevant_documents(self, query: str, resources: list[Resource] | None = None) -> list[Document]:
         """Query relevant documents from the resources."""
+
+    async def alist_resources(self, query: str | None = None) -> list[Resource]:
+        """List resources from the rag provider without blocking the event loop.
+
+        Providers with an async client should override this; the default runs
+        ``list_resources`` in a worker thread.
+        """
+        return await asyncio.to_thread(self.list_resources, query)
+
+    async def aquery_relevant_documents(
+        self,
+        query: str,
+        resources: list[Resource] | None = None,
+    ) -> list[Document]:
+        """Query relevant documents from the resources without blocking the event loop.
+
+        Providers with an async client should override this; the default runs
+        ``query_relevant_documents`` in a worker thread.
+        """
+        return await asyncio.to_thread(self.query_relevant_documents, query, resources)
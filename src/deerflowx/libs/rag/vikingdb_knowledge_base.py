@@ -1,15 +1,17 @@
 # Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
 # SPDX-License-Identifier: MIT
 
+import asyncio
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
 
-import requests
 from volcengine.auth.SignerV4 import SignerV4
 from volcengine.base.Request import Request
 from volcengine.Credentials import Credentials
 
+from deerflowx.libs.rag.http_client import get_rag_async_client, get_rag_session
 from deerflowx.libs.rag.retriever import Chunk, Document, Resource, Retriever
 
 
@@ -20,6 +22,8 @@ class VikingDBKnowledgeBaseProvider(Retriever):
     api_ak: str
     api_sk: str
     retrieval_size: int = 10
+    # Number of resources searched concurrently
+    max_concurrency: int = 4
 
     def __init__(self) -> None:
         api_url = os.getenv("VIKINGDB_KNOWLEDGE_BASE_API_URL")
@@ -44,6 +48,13 @@ class VikingDBKnowledgeBaseProvider(Retriever):
         if retrieval_size:
             self.retrieval_size = int(retrieval_size)
 
+        max_concurrency = os.getenv("VIKINGDB_KNOWLEDGE_BASE_MAX_CONCURRENCY")
+        if max_concurrency:
+            self.max_concurrency = int(max_concurrency)
+
+        # Signatures cover each request's body and timestamp, but the credentials are reusable
+        self.credentials = Credentials(self.api_ak, self.api_sk, "air", "cn-north-1")
+
     def prepare_request(
         self,
         method: str,
@@ -76,71 +87,126 @@ class VikingDBKnowledgeBaseProvider(Retriever):
         if data is not None:
             r.set_body(json.dumps(data))
 
-        credentials = Credentials(self.api_ak, self.api_sk, "air", "cn-north-1")
-        SignerV4.sign(r, credentials)
+        SignerV4.sign(r, self.credentials)
         return r
 
-    def query_relevant_documents(self, query: str, resources: list[Resource] | None = None) -> list[Document]:  # noqa: C901
-        """Query relevant documents from the knowledge base."""
-        if resources is None:
-            resources = []
+    def query_relevant_documents(self, query: str, resources: list[Resource] | None = None) -> list[Document]:
+        """Query relevant documents from the knowledge base, searching the resources concurrently."""
         if not resources:
             return []
 
-        all_documents = {}
-        for resource in resources:
-            resource_id, document_id = parse_uri(resource.uri)
-            request_params = {
-                "resource_id": resource_id,
-                "query": query,
-                "limit": self.retrieval_size,
-                "dense_weight": 0.5,
-                "pre_processing": {
-                    "need_instruction": True,
-                    "rewrite": False,
-                    "return_token_usage": True,
-                },
-                "post_processing": {
-                    "rerank_switch": True,
-                    "chunk_diffusion_count": 0,
-                    "chunk_group": True,
-                    "get_attachment_link": True,
-                },
-            }
-            if document_id:
-                doc_filter = {"op": "must", "field": "doc_id", "conds": [document_id]}
-                query_param = {"doc_filter": doc_filter}
-                request_params["query_param"] = query_param
-
-            method = "POST"
-            path = "/api/knowledge/collection/search_knowledge"
-            info_req = self.prepare_request(method=method, path=path, data=request_params)
-            rsp = requests.request(
+        def search(resource: Resource) -> str:
+            info_req = self._search_request(query, resource)
+            rsp = get_rag_session().request(
                 method=info_req.method,
                 url=f"http://{self.api_url}{info_req.path}",
                 headers=info_req.headers,
                 data=info_req.body,
                 timeout=30,
             )
+            return rsp.text
+
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(resources))) as executor:
+            rsp_texts = list(executor.map(search, resources))
+        return self._merge_search_responses(rsp_texts)
+
+    async def aquery_relevant_documents(
+        self,
+        query: str,
+        resources: list[Resource] | None = None,
+    ) -> list[Document]:
+        """Query relevant documents from the knowledge base, searching the resources concurrently."""
+        if not resources:
+            return []
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def search(resource: Resource) -> str:
+            async with semaphore:
+                return await self._asend(self._search_request(query, resource))
+
+        # A failed search cancels the searches of the other resources
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(search(resource)) for resource in resources]
+        except ExceptionGroup as group:
+            # Raise the error itself, as the sync path does, not the group wrapping it
+            raise group.exceptions[0] from None
+        return self._merge_search_responses([task.result() for task in tasks])
+
+    def list_resources(self, query: str | None = None) -> list[Resource]:
+        """List resources (knowledge bases) from the knowledge base service."""
+        info_req = self.prepare_request(method="POST", path="/api/knowledge/collection/list")
+        rsp = get_rag_session().request(
+            method=info_req.method,
+            url=f"http://{self.api_url}{info_req.path}",
+            headers=info_req.headers,
+            data=info_req.body,
+            timeout=30,
+        )
+        return self._parse_resources(rsp.text, query)
+
+    async def alist_resources(self, query: str | None = None) -> list[Resource]:
+        """List resources (knowledge bases) from the knowledge base service."""
+        info_req = self.prepare_request(method="POST", path="/api/knowledge/collection/list")
+        return self._parse_resources(await self._asend(info_req), query)
+
+    async def _asend(self, info_req: Request) -> str:
+        rsp = await get_rag_async_client().request(
+            method=info_req.method,
+            url=f"http://{self.api_url}{info_req.path}",
+            headers=info_req.headers,
+            content=info_req.body,
+        )
+        return rsp.text
+
+    def _search_request(self, query: str, resource: Resource) -> Request:
+        resource_id, document_id = parse_uri(resource.uri)
+        request_params = {
+            "resource_id": resource_id,
+            "query": query,
+            "limit": self.retrieval_size,
+            "dense_weight": 0.5,
+            "pre_processing": {
+                "need_instruction": True,
+                "rewrite": False,
+                "return_token_usage": True,
+            },
+            "post_processing": {
+                "rerank_switch": True,
+                "chunk_diffusion_count": 0,
+                "chunk_group": True,
+                "get_attachment_link": True,
+            },
+        }
+        if document_id:
+            doc_filter = {"op": "must", "field": "doc_id", "conds": [document_id]}
+            query_param = {"doc_filter": doc_filter}
+            request_params["query_param"] = query_param
 
-            try:
-                response = json.loads(rsp.text)
-            except json.JSONDecodeError as e:
-                msg = f"Failed to parse JSON response: {e}"
-                raise ValueError(msg) from e
+        return self.prepare_request(
+            method="POST", path="/api/knowledge/collection/search_knowledge", data=request_params
+        )
 
+    @staticmethod
+    def _load_response(rsp_text: str) -> dict:
+        try:
+            return json.loads(rsp_text)
+        except json.JSONDecodeError as e:
+            msg = f"Failed to parse JSON response: {e}"
+            raise ValueError(msg) from e
+
+    def _merge_search_responses(self, rsp_texts: list[str]) -> list[Document]:
+        """Merge the per-resource search results into documents ranked by their best chunk."""
+        all_documents: dict[str, Document] = {}
+        for rsp_text in rsp_texts:
+            response = self._load_response(rsp_text)
             if response["code"] != 0:
                 msg = f"Failed to query documents from resource: {response['message']}"
                 raise ValueError(msg)
 
             rsp_data = response.get("data", {})
-
-            if "result_list" not in rsp_data:
-                continue
-
-            result_list = rsp_data["result_list"]
-
-            for item in result_list:
+            for item in rsp_data.get("result_list", []):
                 doc_info = item.get("doc_info", {})
                 doc_id = doc_info.get("doc_id")
 
@@ -153,26 +219,17 @@ class VikingDBKnowledgeBaseProvider(Retriever):
                 chunk = Chunk(content=item.get("content", ""), similarity=item.get("score", 0.0))
                 all_documents[doc_id].chunks.append(chunk)
 
-        return list(all_documents.values())
-
-    def list_resources(self, query: str | None = None) -> list[Resource]:
-        """List resources (knowledge bases) from the knowledge base service."""
-        method = "POST"
-        path = "/api/knowledge/collection/list"
-        info_req = self.prepare_request(method=method, path=path)
-        rsp = requests.request(
-            method=info_req.method,
-            url=f"http://{self.api_url}{info_req.path}",
-            headers=info_req.headers,
-            data=info_req.body,
-            timeout=30,
+        # The reranker scores the results of every resource on the same scale, so rank across them
+        for document in all_documents.values():
+            document.chunks.sort(key=lambda chunk: chunk.similarity, reverse=True)
+        return sorted(
+            all_documents.values(),
+            key=lambda document: max((chunk.similarity for chunk in document.chunks), default=0.0),
+            reverse=True,
         )
-        try:
-            response = json.loads(rsp.text)
-        except json.JSONDecodeError as e:
-            msg = f"Failed to parse JSON response: {e}"
-            raise ValueError(msg) from e
 
+    def _parse_resources(self, rsp_text: str, query: str | None) -> list[Resource]:
+        response = self._load_response(rsp_text)
         if response["code"] != 0:
             msg = f"Failed to list resources: {response['message']}"
             raise RuntimeError(msg)
@@ -0,0 +1,31 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+"""Search result caching and orchestration shared by the web search tools."""
+
+from .cache import SearchCache, SearchCacheMetrics, get_search_cache, normalize_query
+from .fusion import SearchEngineFn, canonicalize_url, fan_out_search, reciprocal_rank_fusion
+from .resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    ProviderResilience,
+    SearchProviderError,
+    get_search_resilience,
+    parse_retry_after,
+)
+
+__all__ = [
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "ProviderResilience",
+    "SearchCache",
+    "SearchCacheMetrics",
+    "SearchEngineFn",
+    "SearchProviderError",
+    "canonicalize_url",
+    "fan_out_search",
+    "get_search_cache",
+    "get_search_resilience",
+    "normalize_query",
+    "parse_retry_after",
+    "reciprocal_rank_fusion",
+]
@@ -0,0 +1,169 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from deerflowx.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS search_cache (
+    key TEXT PRIMARY KEY,
+    engine TEXT NOT NULL,
+    query TEXT NOT NULL,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS search_cache_accessed_at ON search_cache (accessed_at);
+"""
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a query so that trivially different spellings share a cache entry."""
+    query = unicodedata.normalize("NFKC", query).casefold()
+    return re.sub(r"\s+", " ", query).strip(" ?!.")
+
+
+@dataclass
+class SearchCacheMetrics:
+    """Counters of the search cache since startup, and its current size."""
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    entries: int = 0
+    size_bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class SearchCache:
+    """SQLite cache of search tool results, keyed by engine, normalized query and parameters.
+
+    Entries expire after ``ttl_seconds``, and the least recently used entries are evicted
+    once the stored results exceed ``max_bytes``.
+    """
+
+    def __init__(self, path: str | Path, *, ttl_seconds: float, max_bytes: int) -> None:
+        self.path = str(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA busy_timeout = 5000")
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._metrics = SearchCacheMetrics()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def make_key(engine: str, query: str, params: dict[str, Any]) -> str:
+        payload = json.dumps(
+            {"engine": engine, "query": normalize_query(query), "params": params},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        """Return ``(True, result)`` on a fresh hit and ``(False, None)`` otherwise."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT value, created_at FROM search_cache WHERE key = ?", (key,)).fetchone()
+            if row is None or now - row[1] >= self.ttl_seconds:
+                if row is not None:
+                    self._conn.execute("DELETE FROM search_cache WHERE key = ?", (key,))
+                self._metrics.misses += 1
+                return False, None
+            self._conn.execute("UPDATE search_cache SET accessed_at = ? WHERE key = ?", (now, key))
+            self._metrics.hits += 1
+        return True, _loads(row[0])
+
+    def put(self, key: str, engine: str, query: str, result: Any) -> None:
+        value = _dumps(result)
+        size = len(value.encode())
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO search_cache (key, engine, query, value, size, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, engine, normalize_query(query), value, size, now, now),
+            )
+            self._metrics.stores += 1
+            self._evict()
+
+    def metrics(self) -> SearchCacheMetrics:
+        with self._lock:
+            entries, size_bytes = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM search_cache"
+            ).fetchone()
+            m = self._metrics
+            return SearchCacheMetrics(m.hits, m.misses, m.stores, m.evictions, entries, size_bytes)
+
+    def _evict(self) -> None:
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM search_cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute("SELECT key, size FROM search_cache ORDER BY accessed_at").fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM search_cache WHERE key = ?", (key,))
+            self._metrics.evictions += 1
+            total -= size
+
+
+def _dumps(result: Any) -> str:
+    # Tools with the content_and_artifact response format return a tuple, which must survive
+    # the JSON round trip.
+    if isinstance(result, tuple):
+        return json.dumps({"tuple": True, "value": list(result)}, default=str)
+    return json.dumps({"tuple": False, "value": result}, default=str)
+
+
+def _loads(value: str) -> Any:
+    data = json.loads(value)
+    return tuple(data["value"]) if data["tuple"] else data["value"]
+
+
+_search_cache: SearchCache | None = None
+
+
+def get_search_cache() -> SearchCache | None:
+    """Return the process-wide search cache, or None when caching is disabled."""
+    global _search_cache  # noqa: PLW0603
+    if not settings.search_cache.enabled:
+        return None
+    if _search_cache is None:
+        _search_cache = SearchCache(
+            settings.search_cache.path,
+            ttl_seconds=settings.search_cache.ttl_seconds,
+            max_bytes=settings.search_cache.max_bytes,
+        )
+        logger.info(f"Search cache initialized at {settings.search_cache.path}")
+    return _search_cache
@@ -0,0 +1,99 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Mapping
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+logger = logging.getLogger(__name__)
+
+# An engine searches a query for at most ``max_results`` results, in the page shape of
+# ``EnhancedTavilySearchAPIWrapper.clean_results_with_images``.
+SearchEngineFn = Callable[[str, int], Awaitable[list[dict]]]
+
+DEFAULT_RRF_K = 60
+
+# Query parameters that only track the visit: any ``utm_`` parameter and these exact names
+_TRACKING_PARAM_PREFIX = "utm_"
+_TRACKING_PARAMS = frozenset({"fbclid", "gclid", "mc_cid", "mc_eid", "ref"})
+
+
+def _is_tracking_param(name: str) -> bool:
+    return name.startswith(_TRACKING_PARAM_PREFIX) or name in _TRACKING_PARAMS
+
+
+def canonicalize_url(url: str) -> str:
+    """Return the identity of a url for deduplication across engines."""
+    parts = urlsplit(url.strip())
+    host = (parts.hostname or "").lower().removeprefix("www.")
+    query = urlencode(
+        sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if not _is_tracking_param(k))
+    )
+    path = parts.path.rstrip("/")
+    # http and https versions of a page are the same result
+    return urlunsplit(("", host, path, query, ""))
+
+
+def reciprocal_rank_fusion(results_by_engine: Mapping[str, list[dict]], k: int = DEFAULT_RRF_K) -> list[dict]:
+    """Merge ranked result lists with reciprocal-rank fusion.
+
+    Pages are deduplicated by canonical url and scored with ``sum(1 / (k + rank))`` over
+    the engines that returned them; the best ranked copy is kept, completed with the
+    raw content of another engine when it has none. Images are deduplicated and appended
+    after the pages.
+    """
+    pages: dict[str, dict] = {}
+    scores: dict[str, float] = {}
+    images: dict[str, dict] = {}
+    for results in results_by_engine.values():
+        rank = 0
+        for result in results:
+            if result.get("type") == "image":
+                images.setdefault(result["image_url"], result)
+                continue
+            rank += 1
+            key = canonicalize_url(result["url"])
+            scores[key] = scores.get(key, 0.0) + 1 / (k + rank)
+            if key not in pages:
+                pages[key] = dict(result)
+            elif result.get("raw_content") and not pages[key].get("raw_content"):
+                pages[key]["raw_content"] = result["raw_content"]
+
+    fused = sorted(pages, key=lambda key: scores[key], reverse=True)
+    return [{**pages[key], "score": round(scores[key], 6)} for key in fused] + list(images.values())
+
+
+async def fan_out_search(
+    query: str,
+    engines: Mapping[str, SearchEngineFn],
+    max_results: int,
+    timeout_seconds: float,
+    k: int = DEFAULT_RRF_K,
+) -> list[dict]:
+    """Query the engines concurrently and fuse the results they return before the deadline.
+
+    Engines that fail or are still running at the deadline are dropped.
+    """
+    tasks = {asyncio.create_task(search(query, max_results)): name for name, search in engines.items()}
+    done, pending = await asyncio.wait(tasks, timeout=timeout_seconds)
+    for task in pending:
+        logger.warning(f"Search engine {tasks[task]} missed the {timeout_seconds}s deadline, dropping it")
+        task.cancel()
+    # Let the cancelled engines unwind, so they release their connections before we return
+    await asyncio.gather(*pending, return_exceptions=True)
+
+    results_by_engine: dict[str, list[dict]] = {}
+    # Iterate in engine order so that ties in the fused ranking are stable
+    for task, name in tasks.items():
+        if task not in done:
+            continue
+        if task.exception() is not None:
+            logger.warning(f"Search engine {name} failed: {task.exception()!r}")
+            continue
+        results_by_engine[name] = task.result()
+
+    fused = reciprocal_rank_fusion(results_by_engine, k)
+    pages = [result for result in fused if result.get("type") != "image"]
+    images = [result for result in fused if result.get("type") == "image"]
+    return pages[:max_results] + images
@@ -0,0 +1,272 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from email.utils import parsedate_to_datetime
+
+import aiohttp
+import requests
+
+from deerflowx.config.settings import SearchResilienceSettings, settings
+
+logger = logging.getLogger(__name__)
+
+HTTP_TOO_MANY_REQUESTS = 429
+HTTP_SERVER_ERROR = 500
+
+
+class CircuitOpenError(ConnectionError):
+    """Raised instead of calling a provider whose circuit breaker is open."""
+
+
+class SearchProviderError(RuntimeError):
+    """An HTTP error response of a search provider."""
+
+    def __init__(self, message: str, status: int, retry_after: float | None = None) -> None:
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header, given in seconds or as an HTTP date, into seconds."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def _error_status(error: BaseException) -> tuple[int | None, float | None]:
+    if isinstance(error, SearchProviderError):
+        return error.status, error.retry_after
+    response = getattr(error, "response", None)
+    if isinstance(response, requests.Response):
+        return response.status_code, parse_retry_after(response.headers.get("Retry-After"))
+    return None, None
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Whether an error is a transient provider failure, as opposed to a bad request."""
+    status, _ = _error_status(error)
+    if status is not None:
+        return status == HTTP_TOO_MANY_REQUESTS or status >= HTTP_SERVER_ERROR
+    return isinstance(
+        error,
+        ConnectionError | TimeoutError | requests.ConnectionError | requests.Timeout | aiohttp.ClientConnectionError,
+    )
+
+
+class LatencyTracker:
+    """Rolling window of successful request latencies."""
+
+    def __init__(self, window: int, min_samples: int) -> None:
+        self.min_samples = min_samples
+        self._samples: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, q: float) -> float | None:
+        """Return the ``q`` quantile of the window, or None until it has enough samples."""
+        with self._lock:
+            if len(self._samples) < self.min_samples:
+                return None
+            samples = sorted(self._samples)
+        return samples[min(int(q * len(samples)), len(samples) - 1)]
+
+
+class CircuitBreaker:
+    """Stop calling a provider after consecutive failures, probing it again after a cooldown.
+
+    The breaker opens after ``failure_threshold`` consecutive failures. Once
+    ``reset_timeout_seconds`` have passed, a single probe request is let through: its
+    success closes the breaker and its failure opens it for another cooldown.
+    """
+
+    def __init__(self, name: str, failure_threshold: int, reset_timeout_seconds: float) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_seconds = reset_timeout_seconds
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if self._probing or time.monotonic() - self._opened_at >= self.reset_timeout_seconds:
+                return "half_open"
+            return "open"
+
+    def before_call(self) -> bool:
+        """Raise ``CircuitOpenError`` unless the provider may be called; return whether the call is the probe."""
+        with self._lock:
+            if self._opened_at is None:
+                return False
+            remaining = self.reset_timeout_seconds - (time.monotonic() - self._opened_at)
+            if remaining > 0 or self._probing:
+                msg = f"Search provider {self.name} is unavailable, retry in {max(remaining, 0):.0f}s"
+                raise CircuitOpenError(msg)
+            self._probing = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._opened_at is not None:
+                logger.info(f"Circuit breaker of {self.name} closed")
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._probing or self._failures >= self.failure_threshold:
+                if self._opened_at is None or self._probing:
+                    logger.warning(f"Circuit breaker of {self.name} opened after {self._failures} failures")
+                self._opened_at = time.monotonic()
+                self._probing = False
+
+
+class ProviderResilience:
+    """Hedging, retries and a circuit breaker around the requests to one search provider.
+
+    Async requests still running after the p95 latency of the provider get a second,
+    hedged request, and the first response wins. Transient failures are retried with
+    jittered exponential backoff, waiting for Retry-After when the provider sends one; a
+    Retry-After longer than ``backoff_max_seconds`` fails the request instead of stalling
+    the step. Sync requests get retries and the circuit breaker, but no hedging.
+    """
+
+    def __init__(self, name: str, resilience_settings: SearchResilienceSettings) -> None:
+        self.name = name
+        self.settings = resilience_settings
+        self.latency = LatencyTracker(resilience_settings.latency_window, resilience_settings.hedge_min_samples)
+        self.breaker = CircuitBreaker(
+            name,
+            resilience_settings.failure_threshold,
+            resilience_settings.reset_timeout_seconds,
+        )
+        self.hedged_requests = 0
+
+    def call[T](self, fn: Callable[[], T]) -> T:
+        attempt = 0
+        while True:
+            probe = self.breaker.before_call()
+            start = time.monotonic()
+            try:
+                result = fn()
+            except Exception as e:
+                delay = self._on_error(e, attempt)
+                time.sleep(delay)
+                attempt += 1
+                continue
+            except BaseException:
+                self._on_abort(probe)
+                raise
+            self.latency.record(time.monotonic() - start)
+            self.breaker.record_success()
+            return result
+
+    async def acall[T](self, fn: Callable[[], Awaitable[T]]) -> T:
+        attempt = 0
+        while True:
+            probe = self.breaker.before_call()
+            try:
+                result = await self._hedged(fn)
+            except Exception as e:
+                delay = self._on_error(e, attempt)
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+            except BaseException:
+                # Cancelled, for example by the deadline of a fused search
+                self._on_abort(probe)
+                raise
+            self.breaker.record_success()
+            return result
+
+    def _on_abort(self, probe: bool) -> None:
+        """Record an attempt that ended without an outcome, such as a cancelled one."""
+        if probe:
+            # Count the probe as failed, or the breaker would wait for its outcome forever
+            self.breaker.record_failure()
+
+    def _on_error(self, error: Exception, attempt: int) -> float:
+        """Record a failed attempt and return the delay before the next one, or re-raise."""
+        if not is_retryable(error):
+            # The provider answered, it just rejected this request
+            self.breaker.record_success()
+            raise error
+        self.breaker.record_failure()
+        if attempt >= self.settings.max_retries:
+            raise error
+        _, retry_after = _error_status(error)
+        if retry_after is not None:
+            if retry_after > self.settings.backoff_max_seconds:
+                raise error
+            delay = retry_after
+        else:
+            cap = min(self.settings.backoff_max_seconds, self.settings.backoff_base_seconds * 2**attempt)
+            delay = random.uniform(0, cap)  # noqa: S311
+        logger.warning(f"Search provider {self.name} failed with {error!r}, retrying in {delay:.2f}s")
+        return delay
+
+    async def _hedged[T](self, fn: Callable[[], Awaitable[T]]) -> T:
+        async def timed() -> T:
+            start = time.monotonic()
+            result = await fn()
+            self.latency.record(time.monotonic() - start)
+            return result
+
+        hedge_delay = self.latency.percentile(self.settings.hedge_percentile) if self.settings.hedge_enabled else None
+        pending = {asyncio.ensure_future(timed())}
+        try:
+            if hedge_delay is not None:
+                done, _ = await asyncio.wait(pending, timeout=hedge_delay)
+                if not done:
+                    logger.debug(f"Search provider {self.name} slower than {hedge_delay:.2f}s, hedging the request")
+                    self.hedged_requests += 1
+                    pending.add(asyncio.ensure_future(timed()))
+            error: BaseException | None = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+            raise error  # type: ignore[misc]
+        finally:
+            for task in pending:
+                task.cancel()
+
+
+_providers: dict[str, ProviderResilience] = {}
+_providers_lock = threading.Lock()
+
+
+def get_search_resilience(provider: str) -> ProviderResilience | None:
+    """Return the process-wide resilience state of a provider, or None when disabled."""
+    if not settings.search_resilience.enabled:
+        return None
+    with _providers_lock:
+        if provider not in _providers:
+            _providers[provider] = ProviderResilience(provider, settings.search_resilience)
+        return _providers[provider]
@@ -1,3 +1,4 @@
+from .http_client import aclose_tavily_sessions
 from .tavily_search_results_with_images import TavilySearchResultsWithImages
 
-__all__ = ["TavilySearchResultsWithImages"]
+__all__ = ["TavilySearchResultsWithImages", "aclose_tavily_sessions"]
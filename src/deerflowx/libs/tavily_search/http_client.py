@@ -0,0 +1,46 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+"""Shared keep-alive HTTP sessions used by the Tavily search client."""
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+
+from deerflowx.config.settings import settings
+from deerflowx.utils.http_pool import aclose_clients, get_async_client, get_session
+
+_CLIENT_NAME = "tavily"
+
+
+def _create_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_maxsize=settings.tavily.max_connections)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _create_async_session() -> aiohttp.ClientSession:
+    return aiohttp.ClientSession(
+        trust_env=True,
+        connector=aiohttp.TCPConnector(
+            limit=settings.tavily.max_connections,
+            keepalive_timeout=settings.tavily.keepalive_seconds,
+        ),
+        timeout=aiohttp.ClientTimeout(total=settings.tavily.timeout_seconds),
+    )
+
+
+def get_tavily_session() -> requests.Session:
+    """Return the process-wide ``requests`` session for sync searches."""
+    return get_session(_CLIENT_NAME, _create_session)
+
+
+def get_tavily_async_session() -> aiohttp.ClientSession:
+    """Return the pooled aiohttp session of the running event loop."""
+    return get_async_client(_CLIENT_NAME, _create_async_session)
+
+
+async def aclose_tavily_sessions() -> None:
+    """Close the shared Tavily sessions."""
+    await aclose_clients(_CLIENT_NAME)
@@ -2,17 +2,23 @@
 # Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
 # SPDX-License-Identifier: MIT
 
+import functools
 import json
 from dataclasses import dataclass
 
-import aiohttp
-import requests
 from langchain_community.utilities.tavily_search import (
     TavilySearchAPIWrapper as OriginalTavilySearchAPIWrapper,
 )
 
+from deerflowx.config.settings import settings
+from deerflowx.libs.search.resilience import SearchProviderError, get_search_resilience, parse_retry_after
+
+from .http_client import get_tavily_async_session, get_tavily_session
+
 TAVILY_API_URL = "https://api.tavily.com"
 HTTP_OK = 200
+HTTP_TOO_MANY_REQUESTS = 429
+HTTP_SERVICE_UNAVAILABLE = 503
 
 
 @dataclass
@@ -54,7 +60,10 @@ class EnhancedTavilySearchAPIWrapper(OriginalTavilySearchAPIWrapper):
             include_image_descriptions=include_image_descriptions,
         )
 
-        return self._raw_results_internal(query, params)
+        resilience = get_search_resilience("tavily")
+        if resilience is None:
+            return self._raw_results_internal(query, params)
+        return resilience.call(functools.partial(self._raw_results_internal, query, params))
 
     def _raw_results_internal(
         self,
@@ -76,11 +85,11 @@ class EnhancedTavilySearchAPIWrapper(OriginalTavilySearchAPIWrapper):
             "include_images": params.include_images,
             "include_image_descriptions": params.include_image_descriptions,
         }
-        response = requests.post(
+        response = get_tavily_session().post(
             # type: ignore[arg-type]
             f"{TAVILY_API_URL}/search",
             json=request_params,
-            timeout=30,
+            timeout=settings.tavily.timeout_seconds,
         )
         response.raise_for_status()
         return response.json()
@@ -94,7 +103,10 @@ class EnhancedTavilySearchAPIWrapper(OriginalTavilySearchAPIWrapper):
         if params is None:
             params = SearchParams()
 
-        return await self._raw_results_async_internal(query, params)
+        resilience = get_search_resilience("tavily")
+        if resilience is None:
+            return await self._raw_results_async_internal(query, params)
+        return await resilience.acall(functools.partial(self._raw_results_async_internal, query, params))
 
     async def _raw_results_async_internal(
         self,
@@ -119,14 +131,14 @@ class EnhancedTavilySearchAPIWrapper(OriginalTavilySearchAPIWrapper):
                 "include_images": params.include_images,
                 "include_image_descriptions": params.include_image_descriptions,
             }
-            async with (
-                aiohttp.ClientSession(trust_env=True) as session,
-                session.post(f"{TAVILY_API_URL}/search", json=request_params) as res,
-            ):
+            async with get_tavily_async_session().post(f"{TAVILY_API_URL}/search", json=request_params) as res:
                 if res.status == HTTP_OK:
                     return await res.text()
                 msg = f"Error {res.status}: {res.reason}"
-                raise RuntimeError(msg)
+                retry_after = None
+                if res.status in {HTTP_TOO_MANY_REQUESTS, HTTP_SERVICE_UNAVAILABLE}:
+                    retry_after = parse_retry_after(res.headers.get("Retry-After"))
+                raise SearchProviderError(msg, res.status, retry_after)
 
         results_json_str = await fetch()
         return json.loads(results_json_str)
@@ -4,7 +4,7 @@
 from enum import Enum
 from typing import ClassVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 
 class StepType(str, Enum):
@@ -18,6 +18,10 @@ class Step(BaseModel):
     description: str = Field(..., description="Specify exactly what data to collect")
     step_type: StepType = Field(..., description="Indicates the nature of the step")
     execution_res: str | None = Field(default=None, description="The Step execution result")
+    depends_on: list[int] | None = Field(
+        default=None,
+        description="Zero-based indices of earlier steps whose results this step needs, [] if independent",
+    )
 
 
 # Example data as module-level constant
@@ -34,6 +38,7 @@ PLAN_EXAMPLES = [
                     "Collect data on market size, growth rates, major players, and investment trends in AI sector."
                 ),
                 "step_type": "research",
+                "depends_on": [],
             },
         ],
     },
@@ -50,6 +55,14 @@ class Plan(BaseModel):
         description="Research & Processing steps to get more context",
     )
 
+    @model_validator(mode="after")
+    def drop_invalid_dependencies(self) -> "Plan":
+        """Keep only references to earlier steps so the dependency graph is always acyclic."""
+        for index, step in enumerate(self.steps):
+            if step.depends_on is not None:
+                step.depends_on = sorted({dep for dep in step.depends_on if 0 <= dep < index})
+        return self
+
     class Config:
         json_schema_extra: ClassVar = {
             "examples": PLAN_EXAMPLES,
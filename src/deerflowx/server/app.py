@@ -5,7 +5,9 @@
 import importlib.metadata
 import json
 import logging
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import asdict
 from typing import Annotated, Any
 from uuid import uuid4
 
@@ -17,7 +19,10 @@ from deerflowx.config.report_style import ReportStyle
 from deerflowx.config.tools import SELECTED_RAG_PROVIDER
 from deerflowx.graphs.prompt_enhancer.graph.builder import build_graph as build_prompt_enhancer_graph
 from deerflowx.graphs.prose.graph.builder import build_graph as build_prose_graph
-from deerflowx.libs.rag.builder import build_retriever
+from deerflowx.libs.crawler import aclose_crawl_prefetcher, aclose_http_clients, shutdown_extraction_pool
+from deerflowx.libs.rag import aclose_rag_http_clients, aclose_resource_catalog, get_resource_catalog
+from deerflowx.libs.search import get_search_cache
+from deerflowx.libs.tavily_search import aclose_tavily_sessions
 from deerflowx.server.chat_request import (
     DEFAULT_CHAT_REQUEST_THREAD_ID_VALUE,
     ChatRequest,
@@ -32,17 +37,40 @@ from deerflowx.server.rag_request import (
     RAGResourceRequest,
     RAGResourcesResponse,
 )
+from deerflowx.server.search_request import SearchCacheMetricsResponse
+from deerflowx.server.thread_request import ThreadMetricsResponse
+from deerflowx.tools.search import shutdown_fusion_search_loop
 from deerflowx.utils.llms.llm import get_configured_llm_models
+from deerflowx.utils.mcp_session_pool import mcp_session_pool
 from deerflowx.utils.workflow_executor import workflow_executor
 
 logger = logging.getLogger(__name__)
 
 INTERNAL_SERVER_ERROR_DETAIL = "Internal Server Error"
 
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """Start background maintenance, and release process-wide resources on shutdown."""
+    workflow_executor.thread_lifecycle.start()
+    yield
+    await workflow_executor.aclose()
+    await mcp_session_pool.close()
+    await aclose_crawl_prefetcher()
+    await aclose_http_clients()
+    shutdown_extraction_pool()
+    await aclose_tavily_sessions()
+    await aclose_resource_catalog()
+    await aclose_rag_http_clients()
+    # Last, since the clients above close their connections of sync searches on this loop
+    shutdown_fusion_search_loop()
+
+
 app = FastAPI(
     title="DeerFlow API",
     description="API for Deer",
     version=importlib.metadata.version("deerflowx"),
+    lifespan=lifespan,
 )
 
 # Add CORS middleware
@@ -85,6 +113,8 @@ async def _execute_workflow_with_unified_executor(
         enable_background_investigation=request.enable_background_investigation,
         report_style=request.report_style,
         enable_deep_thinking=request.enable_deep_thinking,
+        enable_parallel_steps=request.enable_parallel_steps,
+        max_parallel_steps=request.max_parallel_steps,
     ):
         # Convert unified executor event format to server event format
         if event.get("type") == "interrupt":
@@ -213,12 +243,29 @@ async def rag_config() -> RAGConfigResponse:
 @app.get("/api/rag/resources")
 async def rag_resources(request: Annotated[RAGResourceRequest, Query()]) -> RAGResourcesResponse:
     """Get the resources of the RAG."""
-    retriever = build_retriever()
-    if retriever:
-        return RAGResourcesResponse(resources=retriever.list_resources(request.query))
+    catalog = get_resource_catalog()
+    if catalog:
+        return RAGResourcesResponse(resources=await catalog.search(request.query))
     return RAGResourcesResponse(resources=[])
 
 
+@app.get("/api/threads/metrics")
+async def thread_metrics() -> ThreadMetricsResponse:
+    """Get the checkpoint memory held by conversation threads."""
+    metrics = await workflow_executor.thread_lifecycle.metrics()
+    return ThreadMetricsResponse(**asdict(metrics))
+
+
+@app.get("/api/search/cache/metrics")
+async def search_cache_metrics() -> SearchCacheMetricsResponse:
+    """Get the hit/miss metrics of the search cache."""
+    cache = get_search_cache()
+    if cache is None:
+        return SearchCacheMetricsResponse(enabled=False)
+    metrics = cache.metrics()
+    return SearchCacheMetricsResponse(enabled=True, hit_rate=metrics.hit_rate, **asdict(metrics))
+
+
 @app.get("/api/config")
 async def config() -> ConfigResponse:
     """Get the config of the server."""
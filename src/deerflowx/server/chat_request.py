@@ -48,6 +48,11 @@ class ChatRequest(BaseModel):
     )
     report_style: ReportStyle = Field(ReportStyle.ACADEMIC, description="The style of the report")
     enable_deep_thinking: bool = Field(default=False, description="Whether to enable deep thinking")
+    enable_parallel_steps: bool = Field(
+        default=False,
+        description="Whether to execute independent plan steps concurrently",
+    )
+    max_parallel_steps: int = Field(3, description="The maximum number of plan steps executed concurrently")
 
 
 class GenerateProseRequest(BaseModel):
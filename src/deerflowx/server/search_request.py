@@ -0,0 +1,18 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+"""Search request models and responses."""
+
+from pydantic import BaseModel, Field
+
+
+class SearchCacheMetricsResponse(BaseModel):
+    """Response model for search cache metrics."""
+
+    enabled: bool = Field(..., description="Whether the search cache is enabled")
+    hits: int = Field(0, description="The number of searches served from the cache since startup")
+    misses: int = Field(0, description="The number of searches sent to the engine since startup")
+    hit_rate: float = Field(0.0, description="The share of searches served from the cache")
+    stores: int = Field(0, description="The number of results stored since startup")
+    evictions: int = Field(0, description="The number of results evicted since startup")
+    entries: int = Field(0, description="The number of cached results")
+    size_bytes: int = Field(0, description="The total size of the cached results in bytes")
@@ -0,0 +1,16 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+"""Thread lifecycle request models and responses."""
+
+from pydantic import BaseModel, Field
+
+
+class ThreadMetricsResponse(BaseModel):
+    """Response model for thread lifecycle metrics."""
+
+    thread_count: int = Field(..., description="The number of threads with stored checkpoints")
+    active_threads: int = Field(..., description="The number of threads with a running workflow")
+    resident_bytes: int = Field(..., description="The total size of the stored checkpoints in bytes")
+    largest_threads: dict[str, int] = Field(..., description="The largest threads and their size in bytes")
+    evicted_threads: int = Field(..., description="The number of threads evicted since startup")
+    pruned_checkpoints: int = Field(..., description="The number of checkpoints pruned since startup")
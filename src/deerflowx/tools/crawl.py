@@ -5,26 +5,73 @@
 import logging
 from typing import Annotated
 
-from langchain_core.tools import tool
+from langchain_core.tools import StructuredTool
 
-from deerflowx.libs.crawler import Crawler
+from deerflowx.config.settings import settings
+from deerflowx.libs.crawler import Article, Crawler, get_crawl_cache, get_crawl_prefetcher, get_extraction_pool
+from deerflowx.libs.crawler.passages import PASSAGE_SEPARATOR, select_passages, split_passages
+from deerflowx.utils.tokenizer import get_agent_tokenizer
 
 from .decorators import log_io
 
 logger = logging.getLogger(__name__)
 
 
-@tool
+def _to_result(url: str, article: Article, query: str | None) -> dict:
+    markdown = article.to_markdown()
+    if settings.crawler.content_mode == "truncate":
+        return {"url": url, "crawled_content": markdown[:1000]}
+    # Return the passages most relevant to the query rather than the head of the page
+    passages = split_passages(markdown, settings.crawler.passage_max_chars)
+    selected = select_passages(
+        passages, query, settings.crawler.passage_token_budget, get_agent_tokenizer("researcher")
+    )
+    return {"url": url, "crawled_content": PASSAGE_SEPARATOR.join(selected)}
+
+
+def _to_error(e: BaseException) -> str:
+    error_msg = f"Failed to crawl. Error: {e!r}"
+    logger.exception(error_msg)
+    return error_msg
+
+
 @log_io
-def crawl_tool(
+def crawl(
     url: Annotated[str, "The url to crawl."],
+    query: Annotated[str | None, "What you are looking for on the page."] = None,
 ) -> str:
-    """Use this to crawl a url and get a readable content in markdown format."""
+    """Use this to crawl a url and get a readable content in markdown format.
+
+    When a query is given, the passages of the page most relevant to it are returned.
+    """
     try:
-        crawler = Crawler()
+        crawler = Crawler(cache=get_crawl_cache(), extraction_pool=get_extraction_pool())
         article = crawler.crawl(url)
-        return {"url": url, "crawled_content": article.to_markdown()[:1000]}
+        return _to_result(url, article, query)
     except BaseException as e:
-        error_msg = f"Failed to crawl. Error: {e!r}"
-        logger.exception(error_msg)
-        return error_msg
+        return _to_error(e)
+
+
+@log_io
+async def acrawl(
+    url: Annotated[str, "The url to crawl."],
+    query: Annotated[str | None, "What you are looking for on the page."] = None,
+) -> str:
+    """Use this to crawl a url and get a readable content in markdown format.
+
+    When a query is given, the passages of the page most relevant to it are returned.
+    """
+    try:
+        if prefetcher := get_crawl_prefetcher():
+            # Join a speculative crawl of this url instead of fetching it a second time
+            await prefetcher.wait_for(url)
+        crawler = Crawler(cache=get_crawl_cache(), extraction_pool=get_extraction_pool())
+        article = await crawler.acrawl(url)
+        return _to_result(url, article, query)
+    except Exception as e:
+        return _to_error(e)
+
+
+# Agents run tools asynchronously, so several crawl calls issued in one model turn are
+# fetched concurrently over the shared connection pool.
+crawl_tool = StructuredTool.from_function(func=crawl, coroutine=acrawl, name="crawl_tool")
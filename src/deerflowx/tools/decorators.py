@@ -1,10 +1,17 @@
 # Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
 # SPDX-License-Identifier: MIT
 
+import asyncio
 import functools
+import inspect
 import logging
+from abc import ABC, abstractmethod
 from collections.abc import Callable
-from typing import TypeVar
+from typing import Any, ClassVar, TypeVar
+
+from langchain_core.tools import BaseTool
+
+from deerflowx.libs.search import SearchCache, get_search_cache, get_search_resilience
 
 logger = logging.getLogger(__name__)
 
@@ -22,12 +29,27 @@ def log_io(func: Callable) -> Callable:
 
     """
 
+    func_name = func.__name__
+
+    def log_input(args: tuple, kwargs: dict) -> None:
+        params = ", ".join([*(str(arg) for arg in args), *(f"{k}={v}" for k, v in kwargs.items())])
+        logger.info(f"Tool {func_name} called with parameters: {params}")
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            log_input(args, kwargs)
+            result = await func(*args, **kwargs)
+            logger.info(f"Tool {func_name} returned: {result}")
+            return result
+
+        return async_wrapper
+
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
         # Log input parameters
-        func_name = func.__name__
-        params = ", ".join([*(str(arg) for arg in args), *(f"{k}={v}" for k, v in kwargs.items())])
-        logger.info(f"Tool {func_name} called with parameters: {params}")
+        log_input(args, kwargs)
 
         # Execute the function
         result = func(*args, **kwargs)
@@ -74,3 +96,140 @@ def create_logged_tool[T](base_tool_class: type[T]) -> type[T]:
     # Set a more descriptive name for the class
     LoggedTool.__name__ = f"Logged{base_tool_class.__name__}"
     return LoggedTool
+
+
+class CachedSearchToolMixin(ABC):
+    """A mixin class that serves repeated searches from the search cache."""
+
+    cache_engine: ClassVar[str]
+
+    @abstractmethod
+    def _cache_params(self) -> dict[str, Any]:
+        """Return the tool options that change its results, to include in the cache key."""
+
+    def _cache_key(self, query: str) -> str:
+        return SearchCache.make_key(self.cache_engine, query, self._cache_params())
+
+    def _run(self, query: str, *args, **kwargs):
+        """Override _run method to serve cached results."""
+        cache = get_search_cache()
+        if cache is None:
+            return super()._run(query, *args, **kwargs)
+        key = self._cache_key(query)
+        hit, result = cache.get(key)
+        if hit:
+            logger.debug(f"Search cache hit for {self.cache_engine} query: {query}")
+            return result
+        result = super()._run(query, *args, **kwargs)
+        if _is_cacheable(result):
+            cache.put(key, self.cache_engine, query, result)
+        return result
+
+    async def _arun(self, query: str, *args, **kwargs):
+        """Override _arun method to serve cached results."""
+        cache = get_search_cache()
+        if cache is None or not self._has_native_arun():
+            # The default _arun runs _run in a thread, which already goes through the cache
+            return await super()._arun(query, *args, **kwargs)
+        key = self._cache_key(query)
+        hit, result = await asyncio.to_thread(cache.get, key)
+        if hit:
+            logger.debug(f"Search cache hit for {self.cache_engine} query: {query}")
+            return result
+        result = await super()._arun(query, *args, **kwargs)
+        if _is_cacheable(result):
+            await asyncio.to_thread(cache.put, key, self.cache_engine, query, result)
+        return result
+
+    def _has_native_arun(self) -> bool:
+        mro = type(self).__mro__
+        for cls in mro[mro.index(CachedSearchToolMixin) + 1 :]:
+            if "_arun" in cls.__dict__:
+                return cls is not BaseTool
+        return False
+
+
+def _is_cacheable(result: object) -> bool:
+    # Failed searches come back as an error string with an empty artifact, or an empty result
+    if isinstance(result, tuple):
+        return bool(result[-1])
+    return bool(result)
+
+
+def create_cached_search_tool[T](
+    base_tool_class: type[T],
+    engine: str,
+    cache_params: Callable[[T], dict[str, Any]],
+) -> type[T]:
+    """Factory function to create a version of a search tool backed by the search cache.
+
+    Args:
+        base_tool_class: The original search tool class
+        engine: The name of the search engine, part of the cache key
+        cache_params: Returns the tool settings that change its results, part of the cache key
+
+    Returns:
+        A new class that inherits from both CachedSearchToolMixin and the base tool class
+
+    """
+
+    class CachedSearchTool(CachedSearchToolMixin, base_tool_class):
+        cache_engine: ClassVar[str] = engine
+
+        def _cache_params(self) -> dict[str, Any]:
+            return cache_params(self)
+
+    CachedSearchTool.__name__ = f"Cached{base_tool_class.__name__}"
+    return CachedSearchTool
+
+
+class ResilientSearchToolMixin:
+    """A mixin class that sends searches through the hedging, retry and circuit breaker layer."""
+
+    resilience_provider: ClassVar[str]
+
+    def _run(self, query: str, *args, **kwargs):
+        """Override _run method to retry transient provider failures."""
+        resilience = get_search_resilience(self.resilience_provider)
+        run = functools.partial(super()._run, query, *args, **kwargs)
+        if resilience is None:
+            return run()
+        return resilience.call(run)
+
+    async def _arun(self, query: str, *args, **kwargs):
+        """Override _arun method to hedge slow requests and retry transient provider failures."""
+        resilience = get_search_resilience(self.resilience_provider)
+        if self._has_native_arun():
+            arun = functools.partial(super()._arun, query, *args, **kwargs)
+        else:
+            # Run the blocking search in a thread per attempt, so a hedged request can race it
+            arun = functools.partial(asyncio.to_thread, super()._run, query, *args, **kwargs)
+        if resilience is None:
+            return await arun()
+        return await resilience.acall(arun)
+
+    def _has_native_arun(self) -> bool:
+        mro = type(self).__mro__
+        for cls in mro[mro.index(ResilientSearchToolMixin) + 1 :]:
+            if "_arun" in cls.__dict__:
+                return cls is not BaseTool
+        return False
+
+
+def create_resilient_search_tool[T](base_tool_class: type[T], provider: str) -> type[T]:
+    """Factory function to create a version of a search tool with hedged and retried requests.
+
+    Args:
+        base_tool_class: The original search tool class
+        provider: The name of the search provider, which owns the latency and circuit breaker state
+
+    Returns:
+        A new class that inherits from both ResilientSearchToolMixin and the base tool class
+
+    """
+
+    class ResilientSearchTool(ResilientSearchToolMixin, base_tool_class):
+        resilience_provider: ClassVar[str] = provider
+
+    ResilientSearchTool.__name__ = f"Resilient{base_tool_class.__name__}"
+    return ResilientSearchTool
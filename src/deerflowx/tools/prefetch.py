@@ -0,0 +1,64 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+"""Speculative crawling of the results returned by the web search tool."""
+
+import json
+import logging
+from typing import Any
+
+from langchain_core.callbacks import AsyncCallbackHandler
+from langchain_core.messages import ToolMessage
+from langchain_core.tools import BaseTool
+
+from deerflowx.config.settings import settings
+from deerflowx.libs.crawler import get_crawl_prefetcher
+
+logger = logging.getLogger(__name__)
+
+
+def search_result_urls(output: Any) -> list[str]:
+    """Return the page urls of a search tool output, in result order."""
+    if isinstance(output, ToolMessage):
+        output = output.content
+    if isinstance(output, str):
+        try:
+            output = json.loads(output)
+        except ValueError:
+            return []
+    if not isinstance(output, list):
+        return []
+    urls = []
+    for result in output:
+        if not isinstance(result, dict) or result.get("type", "page") != "page":
+            continue
+        url = result.get("url") or result.get("link")
+        if isinstance(url, str) and url.startswith(("http://", "https://")):
+            urls.append(url)
+    return urls
+
+
+class SearchPrefetchHandler(AsyncCallbackHandler):
+    """Start crawling the top results of a search as soon as the search returns.
+
+    Agents usually crawl some of the results one model round-trip later, by which time the
+    articles are waiting in the crawl cache.
+    """
+
+    def __init__(self, top_k: int) -> None:
+        self.top_k = top_k
+
+    async def on_tool_end(self, output: Any, **_kwargs: Any) -> None:
+        prefetcher = get_crawl_prefetcher()
+        if prefetcher is None:
+            return
+        urls = search_result_urls(output)[: self.top_k]
+        if urls:
+            scheduled = prefetcher.prefetch(urls)
+            logger.debug(f"Prefetching {scheduled} of the top {len(urls)} search results")
+
+
+def attach_search_prefetch(tool: BaseTool) -> BaseTool:
+    """Prefetch the top results of ``tool`` when prefetching is enabled."""
+    if settings.crawler.prefetch_enabled:
+        tool.callbacks = [*(tool.callbacks or []), SearchPrefetchHandler(settings.crawler.prefetch_top_k)]
+    return tool
@@ -46,9 +46,13 @@ class RetrieverTool(BaseTool):
     async def _arun(
         self,
         keywords: str,
-        run_manager: AsyncCallbackManagerForToolRun | None = None,
+        _run_manager: AsyncCallbackManagerForToolRun | None = None,
     ) -> list[Document]:
-        return self._run(keywords, run_manager.get_sync())
+        logger.info(f"Retriever tool query: {keywords}", extra={"resources": self.resources})
+        documents = await self.retriever.aquery_relevant_documents(keywords, self.resources)
+        if not documents:
+            return "No results found from the local knowledge base."
+        return [doc.to_dict() for doc in documents]
 
 
 def get_retriever_tool(resources: list[Resource]) -> RetrieverTool | None:
@@ -2,8 +2,11 @@
 # SPDX-License-Identifier: MIT
 """Web search tools and utilities for different search engines."""
 
+import asyncio
+import json
 import logging
 import os
+import threading
 
 from langchain_community.tools import BraveSearch, DuckDuckGoSearchResults
 from langchain_community.tools.arxiv import ArxivQueryRun
@@ -11,22 +14,171 @@ from langchain_community.utilities import ArxivAPIWrapper, BraveSearchWrapper
 from langchain_core.tools import BaseTool
 
 from deerflowx.config import SELECTED_SEARCH_ENGINE, SearchEngine
+from deerflowx.config.settings import settings
+from deerflowx.libs.search import SearchEngineFn, fan_out_search
 from deerflowx.libs.tavily_search.tavily_search_results_with_images import (
     TavilySearchResultsWithImages,
 )
-from deerflowx.tools.decorators import create_logged_tool
+from deerflowx.tools.decorators import (
+    create_cached_search_tool,
+    create_logged_tool,
+    create_resilient_search_tool,
+)
+from deerflowx.tools.prefetch import attach_search_prefetch
 
 logger = logging.getLogger(__name__)
 
+# Tavily requests are made resilient in EnhancedTavilySearchAPIWrapper, below the tool's error handling
+ResilientDuckDuckGoSearch: type[DuckDuckGoSearchResults] = create_resilient_search_tool(
+    DuckDuckGoSearchResults,
+    SearchEngine.DUCKDUCKGO.value,
+)
+ResilientBraveSearch: type[BraveSearch] = create_resilient_search_tool(BraveSearch, SearchEngine.BRAVE_SEARCH.value)
+
+# Search tools backed by the search cache; the params are the settings that change the results
+CachedTavilySearch: type[TavilySearchResultsWithImages] = create_cached_search_tool(
+    TavilySearchResultsWithImages,
+    SearchEngine.TAVILY.value,
+    lambda tool: {
+        "max_results": tool.max_results,
+        "search_depth": tool.search_depth,
+        "include_domains": tool.include_domains,
+        "exclude_domains": tool.exclude_domains,
+        "include_answer": tool.include_answer,
+        "include_raw_content": tool.include_raw_content,
+        "include_images": tool.include_images,
+        "include_image_descriptions": tool.include_image_descriptions,
+    },
+)
+CachedDuckDuckGoSearch: type[DuckDuckGoSearchResults] = create_cached_search_tool(
+    ResilientDuckDuckGoSearch,
+    SearchEngine.DUCKDUCKGO.value,
+    lambda tool: {"max_results": tool.max_results, "backend": tool.backend, "output_format": tool.output_format},
+)
+CachedBraveSearch: type[BraveSearch] = create_cached_search_tool(
+    ResilientBraveSearch,
+    SearchEngine.BRAVE_SEARCH.value,
+    lambda tool: {"search_kwargs": tool.search_wrapper.search_kwargs},
+)
+CachedArxivSearch: type[ArxivQueryRun] = create_cached_search_tool(
+    ArxivQueryRun,
+    SearchEngine.ARXIV.value,
+    lambda tool: {
+        "top_k_results": tool.api_wrapper.top_k_results,
+        "load_max_docs": tool.api_wrapper.load_max_docs,
+        "load_all_available_meta": tool.api_wrapper.load_all_available_meta,
+    },
+)
+
 # Create logged versions of the search tools with proper type annotations
-LoggedTavilySearch: type[TavilySearchResultsWithImages] = create_logged_tool(TavilySearchResultsWithImages)
-LoggedDuckDuckGoSearch: type[DuckDuckGoSearchResults] = create_logged_tool(DuckDuckGoSearchResults)
-LoggedBraveSearch: type[BraveSearch] = create_logged_tool(BraveSearch)
-LoggedArxivSearch: type[ArxivQueryRun] = create_logged_tool(ArxivQueryRun)
+LoggedTavilySearch: type[TavilySearchResultsWithImages] = create_logged_tool(CachedTavilySearch)
+LoggedDuckDuckGoSearch: type[DuckDuckGoSearchResults] = create_logged_tool(CachedDuckDuckGoSearch)
+LoggedBraveSearch: type[BraveSearch] = create_logged_tool(CachedBraveSearch)
+LoggedArxivSearch: type[ArxivQueryRun] = create_logged_tool(CachedArxivSearch)
+
+
+def _page(title: str, url: str, content: str) -> dict:
+    return {"type": "page", "title": title, "url": url, "content": content, "score": 0.0}
+
+
+async def _search_tavily(query: str, max_results: int) -> list[dict]:
+    results = await LoggedTavilySearch(max_results=max_results, include_raw_content=True).ainvoke(query)
+    if not isinstance(results, list):
+        msg = f"Tavily search failed: {results}"
+        raise RuntimeError(msg)  # noqa: TRY004
+    return results
+
+
+async def _search_duckduckgo(query: str, max_results: int) -> list[dict]:
+    results = await LoggedDuckDuckGoSearch(num_results=max_results, output_format="list").ainvoke(query)
+    return [_page(result["title"], result["link"], result["snippet"]) for result in results]
+
+
+async def _search_brave(query: str, max_results: int) -> list[dict]:
+    tool = LoggedBraveSearch(
+        search_wrapper=BraveSearchWrapper(
+            api_key=os.getenv("BRAVE_SEARCH_API_KEY", ""),
+            search_kwargs={"count": max_results},
+        ),
+    )
+    results = json.loads(await tool.ainvoke(query))
+    return [_page(result["title"], result["link"], result["snippet"]) for result in results]
+
+
+async def _search_arxiv(query: str, max_results: int) -> list[dict]:
+    api_wrapper = ArxivAPIWrapper(top_k_results=max_results, load_max_docs=max_results)
+    docs = await asyncio.to_thread(api_wrapper.get_summaries_as_docs, query)
+    # Failures are reported as a single document without metadata
+    if len(docs) == 1 and "Entry ID" not in docs[0].metadata:
+        raise RuntimeError(docs[0].page_content)
+    return [_page(doc.metadata["Title"], doc.metadata["Entry ID"], doc.page_content) for doc in docs]
+
+
+_FUSION_ENGINES: dict[str, SearchEngineFn] = {
+    SearchEngine.TAVILY.value: _search_tavily,
+    SearchEngine.DUCKDUCKGO.value: _search_duckduckgo,
+    SearchEngine.BRAVE_SEARCH.value: _search_brave,
+    SearchEngine.ARXIV.value: _search_arxiv,
+}
+
+
+_fusion_loop: asyncio.AbstractEventLoop | None = None
+_fusion_loop_lock = threading.Lock()
+
+
+def _get_fusion_loop() -> asyncio.AbstractEventLoop:
+    """Return the event loop of the daemon thread that runs sync fused searches."""
+    global _fusion_loop  # noqa: PLW0603
+    with _fusion_loop_lock:
+        if _fusion_loop is None:
+            _fusion_loop = asyncio.new_event_loop()
+            threading.Thread(target=_fusion_loop.run_forever, name="fusion-search-loop", daemon=True).start()
+        return _fusion_loop
+
+
+def shutdown_fusion_search_loop() -> None:
+    """Stop the event loop of sync fused searches."""
+    global _fusion_loop
+    with _fusion_loop_lock:
+        loop, _fusion_loop = _fusion_loop, None
+    if loop is not None:
+        loop.call_soon_threadsafe(loop.stop)
+
+
+class FusionSearchTool(BaseTool):
+    """Search several engines concurrently and merge their results with reciprocal-rank fusion.
+
+    Results are returned in the shape of ``TavilySearchResultsWithImages``. Engines that fail
+    or miss the ``timeout_seconds`` deadline are left out instead of stalling the search.
+    """
+
+    name: str = "web_search"
+    description: str = (
+        "A search engine optimized for comprehensive, accurate, and trusted results. "
+        "Useful for when you need to answer questions about current events. "
+        "Input should be a search query."
+    )
+    max_results: int = 5
+    engines: list[str]
+    timeout_seconds: float = 8
+    rrf_k: int = 60
+
+    def _run(self, query: str, *_args, **_kwargs) -> list[dict]:
+        # The sync path may be called from a thread that already runs an event loop, so the
+        # search runs on the long-lived fusion loop, which keeps its pooled HTTP clients
+        return asyncio.run_coroutine_threadsafe(self._arun(query), _get_fusion_loop()).result()
+
+    async def _arun(self, query: str, *_args, **_kwargs) -> list[dict]:
+        engines = {engine: _FUSION_ENGINES[engine] for engine in self.engines}
+        return await fan_out_search(query, engines, self.max_results, self.timeout_seconds, self.rrf_k)
 
 
 # Get the selected search tool
 def get_web_search_tool(max_search_results: int, /) -> BaseTool:
+    return attach_search_prefetch(_create_web_search_tool(max_search_results))
+
+
+def _create_web_search_tool(max_search_results: int) -> BaseTool:
     if SearchEngine.TAVILY.value == SELECTED_SEARCH_ENGINE:
         return LoggedTavilySearch(
             name="web_search",
@@ -57,5 +209,16 @@ def get_web_search_tool(max_search_results: int, /) -> BaseTool:
                 load_all_available_meta=True,
             ),
         )
+    if SearchEngine.FUSION.value == SELECTED_SEARCH_ENGINE:
+        engines = settings.fusion_search.engine_list
+        if unsupported := [engine for engine in engines if engine not in _FUSION_ENGINES]:
+            msg = f"Unsupported fusion search engines: {unsupported}"
+            raise ValueError(msg)
+        return FusionSearchTool(
+            max_results=max_search_results,
+            engines=engines,
+            timeout_seconds=settings.fusion_search.timeout_seconds,
+            rrf_k=settings.fusion_search.rrf_k,
+        )
     msg = f"Unsupported search engine: {SELECTED_SEARCH_ENGINE}"
     raise ValueError(msg)
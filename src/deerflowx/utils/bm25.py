@@ -0,0 +1,46 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+"""Okapi BM25 lexical scoring."""
+
+import math
+import re
+from collections import Counter
+from collections.abc import Sequence
+
+# Latin words and numbers are kept whole; CJK characters have no word separators, so each
+# character is scored as its own term.
+_TOKEN_PATTERN = re.compile(r"[一-鿿぀-ヿ가-힯]|[^\W_]+", re.UNICODE)
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase terms for lexical scoring."""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+class BM25:
+    """Score documents of a fixed corpus against a query with Okapi BM25."""
+
+    def __init__(self, corpus: Sequence[Sequence[str]], k1: float = 1.5, b: float = 0.75) -> None:
+        self.k1 = k1
+        self.b = b
+        self.term_frequencies = [Counter(doc) for doc in corpus]
+        self.doc_lengths = [len(doc) for doc in corpus]
+        self.avg_doc_length = sum(self.doc_lengths) / len(corpus) if corpus else 0.0
+        document_frequencies = Counter(term for tf in self.term_frequencies for term in tf)
+        n = len(corpus)
+        self.idf = {term: math.log(1 + (n - df + 0.5) / (df + 0.5)) for term, df in document_frequencies.items()}
+
+    def score(self, query: Sequence[str], index: int) -> float:
+        """Return the BM25 score of the document at ``index`` for the query terms."""
+        tf = self.term_frequencies[index]
+        length_norm = 1 - self.b + self.b * self.doc_lengths[index] / (self.avg_doc_length or 1)
+        total = 0.0
+        for term in set(query):
+            freq = tf.get(term)
+            if freq:
+                total += self.idf[term] * freq * (self.k1 + 1) / (freq + self.k1 * length_norm)
+        return total
+
+    def scores(self, query: Sequence[str]) -> list[float]:
+        """Return the BM25 score of every document for the query terms."""
+        return [self.score(query, index) for index in range(len(self.term_frequencies))]
@@ -1,12 +1,16 @@
 # Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
 # SPDX-License-Identifier: MIT
+import asyncio
 import logging
+import threading
 
 import litellm
 from langchain_core.messages import AIMessage, AnyMessage, BaseMessage, HumanMessage, ToolMessage
 
 from deerflowx.config.agents import AGENT_LLM_MAP
+from deerflowx.utils.extractive_compression import compress_text
 from deerflowx.utils.llms.llm import get_llm_by_type
+from deerflowx.utils.tokenizer import MESSAGE_OVERHEAD_TOKENS, get_tokenizer
 
 logger = logging.getLogger(__name__)
 
@@ -33,14 +37,40 @@ DEFAULT_CONTEXT_WINDOWS = {
 }
 
 
+# Expected size of a summary, used to plan how many messages to summarize at once
+SUMMARY_TOKENS_ESTIMATE = 512
+
+# Context windows reported by litellm, None for models it does not know
+_max_tokens_cache: dict[str, int | None] = {}
+# Compressors by model, override token limit and safety margin
+_compressor_cache: dict[tuple[str, int | None, float], "SmartContextCompressor"] = {}
+_compressor_cache_lock = threading.Lock()
+
+
+def _lookup_max_tokens(litellm_model_name: str) -> int | None:
+    """Return the context window litellm reports for a model, remembering failed lookups too."""
+    if litellm_model_name in _max_tokens_cache:
+        return _max_tokens_cache[litellm_model_name]
+    try:
+        max_tokens = litellm.get_max_tokens(litellm_model_name) or None  # type: ignore[attr-defined]
+    except Exception:
+        logger.debug(f"litellm.get_max_tokens failed for model '{litellm_model_name}'")
+        max_tokens = None
+    _max_tokens_cache[litellm_model_name] = max_tokens
+    return max_tokens
+
+
 class SmartContextCompressor:
     """A class to intelligently compress conversation history to fit within a model's token limit."""
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         model_name: str,
         override_token_limit: int | None = None,
         safety_margin: float = 0.8,
+        plan_summaries: bool = True,
+        max_concurrent_summaries: int = 4,
+        extractive: bool = True,
     ) -> None:
         """
         Initializes the SmartContextCompressor.
@@ -51,10 +81,19 @@ class SmartContextCompressor:
                                   ignoring the model's default and the safety margin.
             safety_margin: A factor to reduce the model's max tokens for a safer limit.
                            For example, 0.8 means using 80% of the model's context window.
+            plan_summaries: If True, each round picks every message that must be summarized to fit
+                            the limit and summarizes them concurrently; otherwise one message at a time.
+            max_concurrent_summaries: The maximum number of summaries requested at once.
+            extractive: If True, ToolMessages are first shrunk without an LLM by stripping
+                        boilerplate, pruning JSON and selecting relevant sentences.
         """
         self.model_name = model_name
-        # Get the litellm-compatible model name for token counting
+        self.plan_summaries = plan_summaries
+        self.max_concurrent_summaries = max_concurrent_summaries
+        self.extractive = extractive
+        # Get the litellm-compatible model name for the context window lookup
         self.litellm_model_name = MODEL_NAME_MAPPING.get(model_name, model_name)
+        self.tokenizer = get_tokenizer(model_name)
         self.summarizer_llm = get_llm_by_type(AGENT_LLM_MAP.get("basic", "basic"))  # Use a basic model for summaries
 
         if override_token_limit:
@@ -65,18 +104,14 @@ class SmartContextCompressor:
 
     def _get_model_token_limit(self, model_name: str, safety_margin: float) -> int:
         """Get the token limit for a model, with fallbacks for unsupported models."""
-        try:
-            # Try to get from litellm using the mapped model name
-            max_tokens = litellm.get_max_tokens(self.litellm_model_name)  # type: ignore[attr-defined]
-            if max_tokens:
-                token_limit = int(max_tokens * safety_margin)
-                logger.info(
-                    f"Model '{model_name}' (mapped to '{self.litellm_model_name}') max tokens: {max_tokens}. "
-                    f"Using {safety_margin * 100}% safety margin -> limit: {token_limit}"
-                )
-                return token_limit
-        except Exception:
-            logger.debug(f"litellm.get_max_tokens failed for model '{self.litellm_model_name}'")
+        max_tokens = _lookup_max_tokens(self.litellm_model_name)
+        if max_tokens:
+            token_limit = int(max_tokens * safety_margin)
+            logger.info(
+                f"Model '{model_name}' (mapped to '{self.litellm_model_name}') max tokens: {max_tokens}. "
+                f"Using {safety_margin * 100}% safety margin -> limit: {token_limit}"
+            )
+            return token_limit
 
         # Fallback to our predefined context windows
         if model_name in DEFAULT_CONTEXT_WINDOWS:
@@ -94,39 +129,26 @@ class SmartContextCompressor:
 
     def get_total_tokens(self, messages: list[AnyMessage]) -> int:
         """Calculate the total token count for a list of messages."""
-        try:
-            litellm_messages = []
-            for msg in messages:
-                if hasattr(msg, "content") and hasattr(msg, "type"):
-                    match msg.type:
-                        case "human":
-                            role = "user"
-                        case "ai":
-                            role = "assistant"
-                        case "system":
-                            role = "system"
-                        case "tool":
-                            role = "tool"
-                        case _:
-                            role = "user"
-
-                    litellm_messages.append({"role": role, "content": str(msg.content) if msg.content else ""})
-
-            return litellm.token_counter(model=self.litellm_model_name, messages=litellm_messages)  # type: ignore[attr-defined]
-        except Exception:
-            logger.debug(f"litellm.token_counter failed for model {self.litellm_model_name}. Text-based approx.")
-            text_content = " ".join([str(msg.content) for msg in messages if hasattr(msg, "content")])
-            return len(text_content) // 4
-
-    async def compress(self, messages: list[AnyMessage]) -> list[AnyMessage]:
+        return self.tokenizer.count_messages(messages)
+
+    def count_message_tokens(self, message: AnyMessage) -> int:
+        """Calculate the token count of one message."""
+        return self.tokenizer.count_messages([message])
+
+    async def compress(self, messages: list[AnyMessage], query: str | None = None) -> list[AnyMessage]:
         """
         Compresses the list of messages if its total token count exceeds the limit.
 
-        The method iteratively finds the longest ToolMessage and replaces it with a summary
-        until the total token count is within the specified limit.
+        With ``extractive``, the longest ToolMessages are first shrunk without an LLM, keeping
+        the content most relevant to ``query``. The method then replaces the longest
+        ToolMessages with summaries until the total token count is within the specified
+        limit. With ``plan_summaries``, each round plans the set of
+        messages to summarize from the expected summary size and summarizes them concurrently;
+        another round follows if the summaries turned out longer than expected.
 
         Args:
             messages: A list of messages to be compressed.
+            query: The task the messages serve, such as the title of the current step.
 
         Returns:
             A list of messages that is within the token limit.
@@ -134,47 +156,111 @@ class SmartContextCompressor:
         if not messages:
             return []
 
-        total_tokens = self.get_total_tokens(messages)
+        # Token counts are updated per replaced message instead of recounting the whole list
+        message_tokens = self.tokenizer.count_each_message(messages)
+        total_tokens = sum(message_tokens)
         logger.info(f"Initial token count: {total_tokens}, Token limit: {self.token_limit}")
 
+        if self.extractive and total_tokens > self.token_limit:
+            total_tokens = self._compress_extractively(messages, message_tokens, total_tokens, query)
+
         while total_tokens > self.token_limit:
-            longest_message_index, longest_message = self._find_longest_tool_message(messages)
+            if self.plan_summaries:
+                indexes = self._plan_summaries(messages, message_tokens, total_tokens)
+            else:
+                longest_message_index, _ = self._find_longest_tool_message(messages, message_tokens)
+                indexes = [longest_message_index] if longest_message_index != -1 else []
 
-            if longest_message_index == -1 or not longest_message:
+            if not indexes:
                 logger.warning(
                     "Token limit exceeded, but no compressible ToolMessage found. "
                     "The conversation history might be too long."
                 )
                 break
 
-            # Replace the longest message with a summary
-            summary_message = await self._create_summary_message(longest_message, longest_message_index, messages)
-
-            max_tokens = self.get_total_tokens([longest_message])
-            logger.info(
-                f"Compressing message at index {longest_message_index} "
-                f"from {max_tokens} tokens to {self.get_total_tokens([summary_message])} tokens."
+            # Replace the planned messages with their summaries at once
+            semaphore = asyncio.Semaphore(self.max_concurrent_summaries)
+            summary_messages = await asyncio.gather(
+                *(self._create_summary_message_limited(semaphore, index, messages) for index in indexes)
             )
-            messages[longest_message_index] = summary_message
-
-            total_tokens = self.get_total_tokens(messages)
+            for index, summary_message in zip(indexes, summary_messages, strict=True):
+                summary_tokens = self.count_message_tokens(summary_message)
+                logger.info(
+                    f"Compressing message at index {index} "
+                    f"from {message_tokens[index]} tokens to {summary_tokens} tokens."
+                )
+                messages[index] = summary_message
+                total_tokens += summary_tokens - message_tokens[index]
+                message_tokens[index] = summary_tokens
             logger.info(f"New token count: {total_tokens}")
 
         logger.info("Compression finished or was not needed.")
         return messages
 
-    def _find_longest_tool_message(self, messages: list[AnyMessage]) -> tuple[int, ToolMessage | None]:
+    def _compress_extractively(
+        self, messages: list[AnyMessage], message_tokens: list[int], total_tokens: int, query: str | None
+    ) -> int:
+        """Shrink the longest ToolMessages without an LLM and return the new total token count."""
+        candidates = sorted(
+            (i for i, message in enumerate(messages) if isinstance(message, ToolMessage) and message.content),
+            key=lambda i: message_tokens[i],
+            reverse=True,
+        )
+        for i in candidates:
+            if total_tokens <= self.token_limit:
+                break
+            if not isinstance(messages[i].content, str):
+                continue
+            # Shrink just enough to fit, but not below the size of a summary
+            budget = max(SUMMARY_TOKENS_ESTIMATE, message_tokens[i] - (total_tokens - self.token_limit))
+            content = compress_text(messages[i].content, query, budget, self.tokenizer)
+            if len(content) >= len(messages[i].content):
+                continue
+            compressed = messages[i].model_copy(update={"content": content})
+            compressed_tokens = self.count_message_tokens(compressed)
+            logger.info(
+                f"Extracted message at index {i} from {message_tokens[i]} tokens to {compressed_tokens} tokens."
+            )
+            messages[i] = compressed
+            total_tokens += compressed_tokens - message_tokens[i]
+            message_tokens[i] = compressed_tokens
+        logger.info(f"Token count after extractive compression: {total_tokens}")
+        return total_tokens
+
+    def _plan_summaries(self, messages: list[AnyMessage], message_tokens: list[int], total_tokens: int) -> list[int]:
+        """Pick the longest ToolMessages whose summaries are expected to bring the total within the limit."""
+        candidates = sorted(
+            (i for i, message in enumerate(messages) if isinstance(message, ToolMessage) and message.content),
+            key=lambda i: message_tokens[i],
+            reverse=True,
+        )
+        planned = []
+        for i in candidates:
+            if total_tokens <= self.token_limit:
+                break
+            planned.append(i)
+            total_tokens -= message_tokens[i] - min(message_tokens[i], SUMMARY_TOKENS_ESTIMATE)
+        return planned
+
+    async def _create_summary_message_limited(
+        self, semaphore: asyncio.Semaphore, index: int, messages: list[AnyMessage]
+    ) -> HumanMessage:
+        async with semaphore:
+            return await self._create_summary_message(messages[index], index, messages)
+
+    def _find_longest_tool_message(
+        self, messages: list[AnyMessage], message_tokens: list[int]
+    ) -> tuple[int, ToolMessage | None]:
         """Find the longest ToolMessage in the message list."""
         longest_message_index, longest_message = -1, None
-        max_tokens = 0
+        # Skip empty messages, which count only the message overhead
+        max_tokens = MESSAGE_OVERHEAD_TOKENS
 
         for i, message in enumerate(messages):
-            if isinstance(message, ToolMessage):
-                message_tokens = self.get_total_tokens([message])
-                if message_tokens > max_tokens:
-                    max_tokens = message_tokens
-                    longest_message_index = i
-                    longest_message = message
+            if isinstance(message, ToolMessage) and message_tokens[i] > max_tokens:
+                max_tokens = message_tokens[i]
+                longest_message_index = i
+                longest_message = message
 
         return longest_message_index, longest_message
 
@@ -200,7 +286,7 @@ class SmartContextCompressor:
             content=(
                 f"[Content summary from tool call "
                 f"`{tool_call_id}`{preceding_ai_message_info}, "
-                f"original length: {self.get_total_tokens([longest_message])} tokens]:\n{summary_content}"
+                f"original length: {self.count_message_tokens(longest_message)} tokens]:\n{summary_content}"
             ),
             name="system",
         )
@@ -218,3 +304,21 @@ class SmartContextCompressor:
             if preceding_ai_message_info:
                 break
         return preceding_ai_message_info
+
+
+def get_context_compressor(
+    model_name: str, override_token_limit: int | None = None, safety_margin: float = 0.8
+) -> SmartContextCompressor:
+    """Get the compressor for a model and token limit. Returns cached instance if available."""
+    key = (model_name, override_token_limit, safety_margin)
+    with _compressor_cache_lock:
+        if key not in _compressor_cache:
+            _compressor_cache[key] = SmartContextCompressor(model_name, override_token_limit, safety_margin)
+        return _compressor_cache[key]
+
+
+def clear_context_compressor_cache() -> None:
+    """Clear the compressors and model lookups. Useful for testing or when configuration changes."""
+    with _compressor_cache_lock:
+        _compressor_cache.clear()
+    _max_tokens_cache.clear()
@@ -0,0 +1,168 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+"""LLM-free compression of tool outputs: boilerplate stripping, deduplication and sentence selection."""
+
+import json
+import re
+from collections import Counter
+from typing import Any
+
+from deerflowx.utils.bm25 import BM25, tokenize
+from deerflowx.utils.tokenizer import Tokenizer, get_tokenizer, split_sentences
+
+# Terms standing in for the query when ranking sentences without one
+CENTROID_TERMS = 20
+ELISION = "..."
+
+# Fields of search results that carry no information for the agent
+NOISE_JSON_KEYS = frozenset({"score", "favicon", "images", "image_url", "thumbnail", "published_date"})
+
+_HTML_COMMENT = re.compile(r"<!--.*?-->", re.DOTALL)
+_HTML_TAG = re.compile(r"</?[a-zA-Z][^>]*>")
+_MARKDOWN_IMAGE = re.compile(r"!\[[^\]]*\]\([^)]*\)")
+_MARKDOWN_LINK = re.compile(r"\[([^\]]*)\]\(([^)]*)\)")
+_LINK_SEPARATORS = re.compile(r"[\s|·•*>/-]+")
+
+
+def compress_text(text: str, query: str | None, token_budget: int, tokenizer: Tokenizer | None = None) -> str:
+    """Shrink ``text`` towards ``token_budget`` tokens of ``tokenizer``, using the cheapest steps first.
+
+    JSON is pruned of noise fields, empty values and duplicate results; other text is
+    stripped of HTML remnants, images, navigation lines and repeated lines. Only if that
+    is not enough are the sentences most relevant to ``query`` selected. Tokens are counted
+    with the default tokenizer unless the tokenizer of the target model is given.
+    """
+    tokenizer = tokenizer or get_tokenizer()
+    data = _load_json(text)
+    if data is not None:
+        data = prune_json(data)
+        text = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+        if tokenizer.count(text) <= token_budget:
+            return text
+        text = json_to_text(data)
+    text = collapse_duplicate_lines(strip_boilerplate(text))
+    if tokenizer.count(text) <= token_budget:
+        return text
+    return select_sentences(text, query, token_budget, tokenizer)
+
+
+def strip_boilerplate(text: str) -> str:
+    """Remove HTML remnants, images and navigation lines made only of links."""
+    text = _HTML_COMMENT.sub("", text)
+    text = _MARKDOWN_IMAGE.sub("", text)
+    text = _HTML_TAG.sub("", text)
+    return "\n".join(line for line in text.splitlines() if not _is_navigation(line))
+
+
+def _is_navigation(line: str) -> bool:
+    links = _MARKDOWN_LINK.findall(line)
+    if not links or _LINK_SEPARATORS.sub("", _MARKDOWN_LINK.sub("", line)):
+        return False
+    # Menus and breadcrumbs: several links in a row, or links within the same site
+    return len(links) > 1 or all(url.startswith(("/", "#")) for _, url in links)
+
+
+def collapse_duplicate_lines(text: str) -> str:
+    """Drop lines repeating an earlier line, ignoring case and whitespace, and runs of blank lines."""
+    seen: set[str] = set()
+    lines: list[str] = []
+    for line in text.splitlines():
+        key = " ".join(line.split()).lower()
+        if not key:
+            if lines and lines[-1]:
+                lines.append("")
+            continue
+        if key in seen:
+            continue
+        seen.add(key)
+        lines.append(line.rstrip())
+    return "\n".join(lines).strip()
+
+
+def prune_json(value: Any) -> Any:
+    """Drop noise fields and empty values, and list entries repeating an earlier entry's url."""
+    if isinstance(value, dict):
+        pruned = {key: prune_json(item) for key, item in value.items() if key not in NOISE_JSON_KEYS}
+        return {key: item for key, item in pruned.items() if item not in (None, "", [], {})}
+    if isinstance(value, list):
+        items, urls = [], set()
+        for item in value:
+            url = item.get("url") if isinstance(item, dict) else None
+            if url is not None:
+                if url in urls:
+                    continue
+                urls.add(url)
+            items.append(prune_json(item))
+        return items
+    return value
+
+
+def json_to_text(value: Any) -> str:
+    """Render JSON as ``key: value`` lines, one paragraph per list entry."""
+    if isinstance(value, list):
+        return "\n\n".join(json_to_text(item) for item in value)
+    if isinstance(value, dict):
+        return "\n".join(
+            f"{key}: {item if isinstance(item, str) else json.dumps(item, ensure_ascii=False)}"
+            for key, item in value.items()
+        )
+    return str(value)
+
+
+def select_sentences(text: str, query: str | None, token_budget: int, tokenizer: Tokenizer | None = None) -> str:
+    """Keep the sentences most relevant to ``query`` that fit in ``token_budget`` tokens, in text order.
+
+    Sentences are ranked with BM25 against the query, or against the most distinctive terms
+    of the text itself when there is no query or nothing matches it. Gaps are marked with
+    an ellipsis line.
+    """
+    tokenizer = tokenizer or get_tokenizer()
+    sentences = [sentence for line in text.splitlines() for sentence in split_sentences(line)]
+    if not sentences:
+        return ""
+    corpus = [tokenize(sentence) for sentence in sentences]
+    bm25 = BM25(corpus)
+    scores = bm25.scores(tokenize(query)) if query else []
+    if not any(scores):
+        scores = bm25.scores(_centroid_terms(corpus, bm25.idf))
+
+    # Each sentence also costs the line break joining it to the next
+    costs = [tokens + 1 for tokens in tokenizer.count_batch(sentences)]
+    selected: list[int] = []
+    remaining = token_budget
+    for index in sorted(range(len(sentences)), key=lambda i: (-scores[i], i)):
+        cost = costs[index]
+        if cost <= remaining:
+            selected.append(index)
+            remaining -= cost
+    if not selected:
+        # Even the best sentence exceeds the budget
+        best = max(range(len(sentences)), key=lambda i: (scores[i], -i))
+        return tokenizer.split(sentences[best], chunk_size=max(token_budget, 1), overlap=0)[0]
+
+    lines: list[str] = []
+    previous = -1
+    for index in sorted(selected):
+        if index != previous + 1:
+            lines.append(ELISION)
+        lines.append(sentences[index])
+        previous = index
+    if previous != len(sentences) - 1:
+        lines.append(ELISION)
+    return "\n".join(lines)
+
+
+def _centroid_terms(corpus: list[list[str]], idf: dict[str, float]) -> list[str]:
+    frequencies = Counter(term for terms in corpus for term in terms)
+    ranked = sorted(frequencies, key=lambda term: frequencies[term] * idf[term], reverse=True)
+    return ranked[:CENTROID_TERMS]
+
+
+def _load_json(text: str) -> Any:
+    stripped = text.strip()
+    if not stripped.startswith(("{", "[")):
+        return None
+    try:
+        return json.loads(stripped)
+    except ValueError:
+        return None
@@ -0,0 +1,79 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+"""Process-wide keep-alive HTTP clients, shared by name.
+
+A ``requests`` session is kept per name. Async clients cannot be shared across event
+loops, so one is kept per name and event loop: a thread with its own loop, such as the
+loop of sync fused searches, gets its own client instead of rebinding, and dropping,
+the client of the server loop.
+"""
+
+import asyncio
+import logging
+import threading
+from collections.abc import Callable
+
+import aiohttp
+import httpx
+import requests
+
+logger = logging.getLogger(__name__)
+
+_sessions: dict[str, requests.Session] = {}
+_async_clients: dict[tuple[str, asyncio.AbstractEventLoop], httpx.AsyncClient | aiohttp.ClientSession] = {}
+_lock = threading.Lock()
+
+
+def get_session(name: str, factory: Callable[[], requests.Session]) -> requests.Session:
+    """Return the ``requests`` session of ``name``, created with ``factory`` on first use."""
+    with _lock:
+        if name not in _sessions:
+            _sessions[name] = factory()
+        return _sessions[name]
+
+
+def get_async_client[AsyncClient: (httpx.AsyncClient, aiohttp.ClientSession)](
+    name: str, factory: Callable[[], AsyncClient]
+) -> AsyncClient:
+    """Return the async client of ``name`` for the running event loop, created with ``factory``."""
+    loop = asyncio.get_running_loop()
+    with _lock:
+        # Clients of closed loops can no longer be used or closed; their sockets go with them
+        for key in [key for key in _async_clients if key[1].is_closed()]:
+            del _async_clients[key]
+        client = _async_clients.get((name, loop))
+        if client is None or _is_closed(client):
+            client = _async_clients[name, loop] = factory()
+        return client  # type: ignore[return-value]
+
+
+async def aclose_clients(name: str) -> None:
+    """Close the ``requests`` session and the async clients of ``name`` on every event loop."""
+    with _lock:
+        session = _sessions.pop(name, None)
+        clients = [(key[1], _async_clients.pop(key)) for key in list(_async_clients) if key[0] == name]
+    if session is not None:
+        session.close()
+    running = asyncio.get_running_loop()
+    for loop, client in clients:
+        try:
+            # A client must be closed on the loop it was used on
+            if loop is running:
+                await _aclose(client)
+            elif loop.is_running():
+                await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(_aclose(client), loop))
+            elif not loop.is_closed():
+                await asyncio.to_thread(loop.run_until_complete, _aclose(client))
+        except Exception:
+            logger.exception(f"Failed to close an HTTP client of {name}")
+
+
+def _is_closed(client: httpx.AsyncClient | aiohttp.ClientSession) -> bool:
+    return client.closed if isinstance(client, aiohttp.ClientSession) else client.is_closed
+
+
+async def _aclose(client: httpx.AsyncClient | aiohttp.ClientSession) -> None:
+    if isinstance(client, aiohttp.ClientSession):
+        await client.close()
+    else:
+        await client.aclose()
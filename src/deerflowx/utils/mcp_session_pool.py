@@ -0,0 +1,224 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+"""Process-wide pool of MCP server sessions shared by the research agents."""
+
+import asyncio
+import contextlib
+import hashlib
+import json
+import logging
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+from langchain_core.tools import BaseTool
+from langchain_mcp_adapters.client import MultiServerMCPClient
+from mcp import ClientSession
+
+from deerflowx.config.settings import MCPPoolSettings, settings
+
+logger = logging.getLogger(__name__)
+
+_SERVER_NAME = "server"
+_CLOSE_TIMEOUT_SECONDS = 5
+
+
+def get_connection_key(connection: dict[str, Any]) -> str:
+    """Return a stable hash of an MCP server connection config."""
+    payload = json.dumps(connection, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+@dataclass
+class _PooledSession:
+    key: str
+    session: ClientSession
+    tools: list[BaseTool]
+    task: asyncio.Task
+    stop: asyncio.Event
+    leases: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+    last_checked: float = field(default_factory=time.monotonic)
+
+    @property
+    def alive(self) -> bool:
+        return not self.task.done()
+
+
+class MCPSessionPool:
+    """Keep MCP server sessions open across research steps.
+
+    Sessions are keyed by the hash of their connection config, so every step that uses the
+    same server shares one process (stdio) or connection (sse) and its tool list. Sessions
+    idle for longer than the health check interval are pinged before reuse, idle sessions
+    are shut down after the idle timeout, and the least recently used idle sessions are
+    closed when the pool grows beyond ``max_sessions``. Sessions leased by a running step
+    are never closed, so the cap is exceeded temporarily rather than blocking a step.
+    """
+
+    def __init__(self, pool_settings: MCPPoolSettings) -> None:
+        self.settings = pool_settings
+        self._sessions: dict[str, _PooledSession] = {}
+        self._key_locks: dict[str, asyncio.Lock] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._reaper: asyncio.Task | None = None
+
+    @asynccontextmanager
+    async def lease(self, connections: dict[str, dict[str, Any]]) -> AsyncIterator[dict[str, list[BaseTool]]]:
+        """Lease sessions for the given servers and yield their tools keyed by server name."""
+        await self._bind_to_running_loop()
+        leased: list[_PooledSession] = []
+        try:
+            tools: dict[str, list[BaseTool]] = {}
+            for server_name, connection in connections.items():
+                pooled = await self._acquire(connection)
+                leased.append(pooled)
+                tools[server_name] = pooled.tools
+            yield tools
+        finally:
+            for pooled in leased:
+                pooled.leases -= 1
+                pooled.last_used = time.monotonic()
+            await self._enforce_max_sessions()
+
+    async def close(self) -> None:
+        """Shut down every pooled session and the reaper."""
+        await self._shutdown(*self._detach())
+
+    @property
+    def size(self) -> int:
+        """Return the number of open sessions."""
+        return len(self._sessions)
+
+    async def _bind_to_running_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        # Sessions live in tasks of the loop that opened them, so they are shut down there
+        detached = self._detach()
+        self._loop = loop
+        self._reaper = loop.create_task(self._reap_idle_sessions())
+        await self._shutdown(*detached)
+
+    def _detach(self) -> tuple[asyncio.AbstractEventLoop | None, list[_PooledSession], asyncio.Task | None]:
+        detached = (self._loop, list(self._sessions.values()), self._reaper)
+        self._sessions = {}
+        self._key_locks = {}
+        self._loop = None
+        self._reaper = None
+        return detached
+
+    async def _shutdown(
+        self,
+        loop: asyncio.AbstractEventLoop | None,
+        sessions: list[_PooledSession],
+        reaper: asyncio.Task | None,
+    ) -> None:
+        async def shutdown() -> None:
+            if reaper is not None:
+                reaper.cancel()
+                await asyncio.gather(reaper, return_exceptions=True)
+            for pooled in sessions:
+                await self._stop(pooled)
+
+        if loop is None or (reaper is None and not sessions):
+            return
+        if loop is asyncio.get_running_loop():
+            await shutdown()
+        elif loop.is_closed():
+            # Nothing can run on a closed loop; the transports are closed when collected
+            logger.warning(f"Dropped {len(sessions)} MCP sessions of a closed event loop")
+        elif loop.is_running():
+            await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(shutdown(), loop))
+        else:
+            await asyncio.to_thread(loop.run_until_complete, shutdown())
+
+    async def _acquire(self, connection: dict[str, Any]) -> _PooledSession:
+        key = get_connection_key(connection)
+        lock = self._key_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            pooled = self._sessions.get(key)
+            if pooled is not None and not await self._is_healthy(pooled):
+                logger.warning(f"MCP session {key[:8]} is unhealthy, reconnecting")
+                await self._close(key)
+                pooled = None
+            if pooled is None:
+                pooled = await self._open(key, connection)
+                self._sessions[key] = pooled
+            pooled.leases += 1
+            pooled.last_used = time.monotonic()
+            return pooled
+
+    async def _is_healthy(self, pooled: _PooledSession) -> bool:
+        if not pooled.alive:
+            return False
+        if pooled.leases or time.monotonic() - pooled.last_checked < self.settings.health_check_interval_seconds:
+            return True
+        try:
+            await asyncio.wait_for(pooled.session.send_ping(), self.settings.health_check_timeout_seconds)
+        except Exception:
+            return False
+        pooled.last_checked = time.monotonic()
+        return True
+
+    async def _open(self, key: str, connection: dict[str, Any]) -> _PooledSession:
+        ready: asyncio.Future[tuple[ClientSession, list[BaseTool]]] = asyncio.get_running_loop().create_future()
+        stop = asyncio.Event()
+
+        # The transports use anyio task groups, which must be entered and exited by the same
+        # task, so each session lives in its own task for its whole lifetime.
+        async def run() -> None:
+            try:
+                async with MultiServerMCPClient({_SERVER_NAME: connection}) as client:  # type: ignore[dict-item]
+                    ready.set_result((client.sessions[_SERVER_NAME], client.get_tools()))
+                    await stop.wait()
+            except Exception as e:
+                if not ready.done():
+                    ready.set_exception(e)
+                else:
+                    logger.exception(f"MCP session {key[:8]} terminated")
+            finally:
+                if not ready.done():
+                    ready.cancel()
+
+        task = asyncio.create_task(run(), name=f"mcp-session-{key[:8]}")
+        session, tools = await ready
+        logger.info(f"Opened pooled MCP session {key[:8]} with {len(tools)} tools")
+        return _PooledSession(key=key, session=session, tools=tools, task=task, stop=stop)
+
+    async def _close(self, key: str) -> None:
+        pooled = self._sessions.pop(key, None)
+        if pooled is not None:
+            await self._stop(pooled)
+
+    async def _stop(self, pooled: _PooledSession) -> None:
+        pooled.stop.set()
+        try:
+            await asyncio.wait_for(pooled.task, _CLOSE_TIMEOUT_SECONDS)
+        except TimeoutError:
+            logger.warning(f"MCP session {pooled.key[:8]} did not shut down in time and was cancelled")
+        logger.info(f"Closed pooled MCP session {pooled.key[:8]}")
+
+    async def _enforce_max_sessions(self) -> None:
+        idle = sorted((p for p in self._sessions.values() if not p.leases), key=lambda p: p.last_used)
+        excess = len(self._sessions) - self.settings.max_sessions
+        for pooled in idle[: max(excess, 0)]:
+            await self._close(pooled.key)
+
+    async def _reap_idle_sessions(self) -> None:
+        interval = max(1, min(self.settings.idle_timeout_seconds, 60))
+        while True:
+            await asyncio.sleep(interval)
+            await self._close_idle_sessions()
+
+    async def _close_idle_sessions(self) -> None:
+        deadline = time.monotonic() - self.settings.idle_timeout_seconds
+        for pooled in list(self._sessions.values()):
+            if not pooled.leases and (pooled.last_used < deadline or not pooled.alive):
+                with contextlib.suppress(Exception):
+                    await self._close(pooled.key)
+
+
+mcp_session_pool = MCPSessionPool(settings.mcp_pool)
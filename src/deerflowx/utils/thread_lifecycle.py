@@ -0,0 +1,180 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+"""Lifecycle management of conversation threads stored by the checkpointer."""
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator, Iterable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+
+from langgraph.checkpoint.base import BaseCheckpointSaver
+
+from deerflowx.config.settings import ThreadLifecycleSettings
+from deerflowx.libs.checkpoint import CheckpointRetention
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ThreadLifecycleMetrics:
+    """Counters describing the checkpoints held by the workflow executor."""
+
+    thread_count: int = 0
+    active_threads: int = 0
+    resident_bytes: int = 0
+    largest_threads: dict[str, int] = field(default_factory=dict)
+    evicted_threads: int = 0
+    pruned_checkpoints: int = 0
+
+
+class ThreadLifecycleManager:
+    """Bound the checkpoints kept for conversation threads.
+
+    After every run the thread is compacted to its latest checkpoints. Periodically, threads
+    idle for longer than the TTL are evicted, least recently used first. A thread was last
+    used when this process last ran it or when its newest checkpoint was written, whichever
+    is later, so threads kept alive by other workers sharing the checkpointer are not
+    evicted. Running threads and threads used within the TTL are never evicted, even when
+    the thread count or stored bytes exceed their limits; that is logged instead. Sweeps run
+    after runs and, once :meth:`start` is called, in a background task, so threads also
+    expire on a server without traffic.
+    """
+
+    def __init__(self, checkpointer: BaseCheckpointSaver | None, settings: ThreadLifecycleSettings) -> None:
+        self.checkpointer = checkpointer
+        self.settings = settings
+        # Wall-clock times, comparable with the times checkpoints were written
+        self._last_access: dict[str, float] = {}
+        self._active: dict[str, int] = {}
+        self._last_sweep = time.monotonic()
+        self._sweep_lock = asyncio.Lock()
+        self._sweeper: asyncio.Task | None = None
+        self._evicted_threads = 0
+        self._pruned_checkpoints = 0
+
+    @property
+    def _retention(self) -> CheckpointRetention | None:
+        return self.checkpointer if isinstance(self.checkpointer, CheckpointRetention) else None
+
+    def start(self) -> None:
+        """Start sweeping every ``sweep_interval_seconds`` in a background task."""
+        if self._sweeper is None or self._sweeper.done():
+            self._sweeper = asyncio.create_task(self._sweep_periodically(), name="thread-lifecycle-sweeper")
+
+    async def stop(self) -> None:
+        """Cancel the background sweeps."""
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            await asyncio.gather(self._sweeper, return_exceptions=True)
+            self._sweeper = None
+
+    @asynccontextmanager
+    async def track(self, thread_id: str) -> AsyncIterator[None]:
+        """Mark a thread as running for the duration of the block, then compact it."""
+        self._active[thread_id] = self._active.get(thread_id, 0) + 1
+        self._last_access[thread_id] = time.time()
+        try:
+            yield
+        finally:
+            self._active[thread_id] -= 1
+            if not self._active[thread_id]:
+                del self._active[thread_id]
+            self._last_access[thread_id] = time.time()
+            try:
+                await self.compact(thread_id)
+                if time.monotonic() - self._last_sweep >= self.settings.sweep_interval_seconds:
+                    await self.sweep()
+            except Exception:
+                logger.exception(f"Thread lifecycle maintenance failed after run of thread {thread_id}")
+
+    async def compact(self, thread_id: str) -> int:
+        """Drop all but the latest checkpoints of an idle thread."""
+        retention = self._retention
+        if retention is None or thread_id in self._active or self.settings.keep_last_checkpoints <= 0:
+            return 0
+        pruned = await retention.aprune_thread(thread_id, self.settings.keep_last_checkpoints)
+        if pruned:
+            logger.debug(f"Pruned {pruned} checkpoints of thread {thread_id}")
+        self._pruned_checkpoints += pruned
+        return pruned
+
+    async def evict(self, thread_id: str) -> None:
+        """Delete every checkpoint of a thread."""
+        if self.checkpointer is None:
+            return
+        await self.checkpointer.adelete_thread(thread_id)
+        self._last_access.pop(thread_id, None)
+        self._evicted_threads += 1
+        logger.info(f"Evicted checkpoints of thread {thread_id}")
+
+    async def sweep(self) -> None:
+        """Evict threads idle past the TTL, least recently used first, and report limits still exceeded."""
+        async with self._sweep_lock:
+            self._last_sweep = time.monotonic()
+            sizes = await self._thread_sizes()
+            last_access = await self._last_access_times(sizes)
+            now = time.time()
+
+            candidates = sorted(
+                (thread_id for thread_id in sizes if thread_id not in self._active),
+                key=lambda thread_id: last_access[thread_id],
+            )
+            total_threads = len(sizes)
+            total_bytes = sum(sizes.values())
+            for thread_id in candidates:
+                if now - last_access[thread_id] <= self.settings.idle_ttl_seconds:
+                    break
+                await self.evict(thread_id)
+                total_threads -= 1
+                total_bytes -= sizes[thread_id]
+
+            if total_threads > self.settings.max_threads or total_bytes > self.settings.max_bytes:
+                logger.warning(
+                    f"{total_threads} threads store {total_bytes} bytes, above the limits of "
+                    f"{self.settings.max_threads} threads and {self.settings.max_bytes} bytes, "
+                    "but every thread was used within the idle TTL"
+                )
+
+    async def _last_access_times(self, thread_ids: Iterable[str]) -> dict[str, float]:
+        retention = self._retention
+        now = time.time()
+        last_access = {}
+        for thread_id in thread_ids:
+            last_write = await retention.aget_thread_last_write(thread_id) if retention else None
+            # Threads without a known access or write count as accessed now
+            last_access[thread_id] = max(self._last_access.get(thread_id, 0), last_write or 0) or now
+        return last_access
+
+    async def _sweep_periodically(self) -> None:
+        while True:
+            # A sweep after a run also counts, so wait for the interval since the last sweep
+            await asyncio.sleep(max(self._last_sweep + self.settings.sweep_interval_seconds - time.monotonic(), 0))
+            if time.monotonic() - self._last_sweep < self.settings.sweep_interval_seconds:
+                continue
+            try:
+                await self.sweep()
+            except Exception:
+                logger.exception("Periodic thread lifecycle sweep failed")
+
+    async def metrics(self) -> ThreadLifecycleMetrics:
+        """Return the current resident checkpoint memory and lifecycle counters."""
+        sizes = await self._thread_sizes()
+        largest = dict(sorted(sizes.items(), key=lambda item: item[1], reverse=True)[:10])
+        return ThreadLifecycleMetrics(
+            thread_count=len(sizes),
+            active_threads=len(self._active),
+            resident_bytes=sum(sizes.values()),
+            largest_threads=largest,
+            evicted_threads=self._evicted_threads,
+            pruned_checkpoints=self._pruned_checkpoints,
+        )
+
+    async def _thread_sizes(self) -> dict[str, int]:
+        retention = self._retention
+        if retention is None:
+            return dict.fromkeys(self._last_access, 0)
+        return {
+            thread_id: await retention.aget_thread_size(thread_id) for thread_id in await retention.alist_thread_ids()
+        }
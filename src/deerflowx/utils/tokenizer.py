@@ -0,0 +1,180 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+"""Token counting and splitting with one encoder per model and a cache of recent counts."""
+
+import hashlib
+import logging
+import math
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+
+# Importing litellm's default encoding points tiktoken at the encodings bundled with litellm,
+# so cl100k_base and o200k_base load without network access
+import litellm.litellm_core_utils.default_encoding  # noqa: F401
+import tiktoken
+from langchain_core.messages import BaseMessage
+
+from deerflowx.utils.llms.llm import get_model_name_for_agent
+
+logger = logging.getLogger(__name__)
+
+# Encoding for models tiktoken does not know, such as deepseek and doubao
+DEFAULT_ENCODING = "cl100k_base"
+
+# Tokens a chat message adds to its content: the role and the message separators
+MESSAGE_OVERHEAD_TOKENS = 4
+
+# Token counts of recently counted texts per encoding, keyed by a hash of the text
+TOKEN_CACHE_MAX_ENTRIES = 4096
+
+# Approximation: about four ASCII characters per token, one token per other character (CJK)
+APPROX_CHARS_PER_TOKEN = 4
+# Estimated tokens of exactly counted text needed before the approximation is calibrated
+CALIBRATION_MIN_TOKENS = 1000
+
+# Sentences end at ., ! or ? followed by whitespace, or right after a CJK full stop, ! or ?
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+|(?<=[\u3002\uff01\uff1f])")
+
+_tokenizers: dict[str, "Tokenizer"] = {}
+_tokenizers_lock = threading.Lock()
+
+
+class Tokenizer:
+    """Counts and splits text in the tokens of one encoding.
+
+    Exact counts are cached by content hash, and texts missing from the cache are encoded
+    in one batch. Approximate counts estimate tokens from the character classes of the
+    text, scaled by the ratio of exact to estimated tokens over the texts counted exactly
+    so far. Without an encoding, for example when it could not be loaded, every count is
+    approximate.
+    """
+
+    def __init__(self, encoding: tiktoken.Encoding | None) -> None:
+        self.encoding = encoding
+        self._cache: OrderedDict[str, int] = OrderedDict()
+        self._lock = threading.Lock()
+        self._exact_tokens = 0
+        self._estimated_tokens = 0.0
+
+    def count(self, text: str, *, approximate: bool = False) -> int:
+        """Return the number of tokens in ``text``."""
+        return self.count_batch([text], approximate=approximate)[0]
+
+    def count_batch(self, texts: Sequence[str], *, approximate: bool = False) -> list[int]:
+        """Return the number of tokens in each of ``texts``."""
+        if approximate or self.encoding is None:
+            return [self._approximate(text) for text in texts]
+
+        keys = [hashlib.blake2b(text.encode(), digest_size=16).hexdigest() for text in texts]
+        counts: list[int | None] = []
+        with self._lock:
+            for key in keys:
+                count = self._cache.get(key)
+                if count is not None:
+                    self._cache.move_to_end(key)
+                counts.append(count)
+
+        missing = [i for i, count in enumerate(counts) if count is None]
+        if missing:
+            encoded = self.encoding.encode_ordinary_batch([texts[i] for i in missing])
+            with self._lock:
+                for i, tokens in zip(missing, encoded, strict=True):
+                    counts[i] = len(tokens)
+                    self._cache[keys[i]] = len(tokens)
+                    self._exact_tokens += len(tokens)
+                    self._estimated_tokens += _estimate(texts[i])
+                while len(self._cache) > TOKEN_CACHE_MAX_ENTRIES:
+                    self._cache.popitem(last=False)
+        return counts  # type: ignore[return-value]
+
+    def count_messages(self, messages: Sequence[BaseMessage], *, approximate: bool = False) -> int:
+        """Return the number of tokens of chat messages, including the overhead of each message."""
+        return sum(self.count_each_message(messages, approximate=approximate))
+
+    def count_each_message(self, messages: Sequence[BaseMessage], *, approximate: bool = False) -> list[int]:
+        """Return the number of tokens of each chat message, including its overhead."""
+        contents = [str(message.content) if message.content else "" for message in messages]
+        return [tokens + MESSAGE_OVERHEAD_TOKENS for tokens in self.count_batch(contents, approximate=approximate)]
+
+    def split(self, text: str, chunk_size: int, overlap: int) -> list[str]:
+        """Split ``text`` into chunks of at most ``chunk_size`` tokens, consecutive chunks sharing ``overlap``."""
+        if overlap >= chunk_size:
+            msg = f"overlap ({overlap}) must be smaller than chunk_size ({chunk_size})"
+            raise ValueError(msg)
+        if self.encoding is None:
+            size, step = chunk_size * APPROX_CHARS_PER_TOKEN, (chunk_size - overlap) * APPROX_CHARS_PER_TOKEN
+            return [text[start : start + size] for start in range(0, max(len(text) - size, 0) + step, step)]
+
+        tokens = self.encoding.encode_ordinary(text)
+        # Slice the original text at token starts, so no chunk cuts a multi-byte character
+        _, offsets = self.encoding.decode_with_offsets(tokens)
+        offsets.append(len(text))
+        step = chunk_size - overlap
+        return [
+            text[offsets[start] : offsets[min(start + chunk_size, len(tokens))]]
+            for start in range(0, max(len(tokens) - chunk_size, 0) + step, step)
+        ]
+
+    def _approximate(self, text: str) -> int:
+        estimate = _estimate(text)
+        with self._lock:
+            if self._estimated_tokens >= CALIBRATION_MIN_TOKENS:
+                estimate *= self._exact_tokens / self._estimated_tokens
+        return math.ceil(estimate)
+
+
+def split_sentences(text: str) -> list[str]:
+    """Split ``text`` into its non-empty sentences, stripped of surrounding whitespace."""
+    return [sentence.strip() for sentence in _SENTENCE_END.split(text) if sentence.strip()]
+
+
+def _estimate(text: str) -> float:
+    ascii_chars = len(text.encode("ascii", "ignore"))
+    return ascii_chars / APPROX_CHARS_PER_TOKEN + (len(text) - ascii_chars)
+
+
+def _encoding_name(model_name: str | None) -> str:
+    if not model_name:
+        return DEFAULT_ENCODING
+    try:
+        # Drop a provider prefix such as "deepseek/"
+        return tiktoken.encoding_name_for_model(model_name.rsplit("/", 1)[-1])
+    except KeyError:
+        return DEFAULT_ENCODING
+
+
+def _load_encoding(encoding_name: str) -> tiktoken.Encoding | None:
+    try:
+        return tiktoken.get_encoding(encoding_name)
+    except Exception as e:
+        logger.warning(f"Failed to load the {encoding_name} encoding, approximating token counts: {e!r}")
+        return None
+
+
+def get_tokenizer(model_name: str | None = None) -> Tokenizer:
+    """Get the tokenizer for a model. Returns cached instance if available.
+
+    Models sharing an encoding share a tokenizer, and with it the cache of counts.
+    """
+    encoding_name = _encoding_name(model_name)
+    with _tokenizers_lock:
+        if encoding_name not in _tokenizers:
+            _tokenizers[encoding_name] = Tokenizer(_load_encoding(encoding_name))
+        return _tokenizers[encoding_name]
+
+
+def get_agent_tokenizer(agent_type: str) -> Tokenizer:
+    """Get the tokenizer for the model configured for an agent type, or the default one."""
+    try:
+        model_name = get_model_name_for_agent(agent_type)
+    except ValueError:
+        model_name = None
+    return get_tokenizer(model_name)
+
+
+def clear_tokenizer_cache() -> None:
+    """Clear the tokenizers. Useful for testing or when configuration changes."""
+    with _tokenizers_lock:
+        _tokenizers.clear()
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: MIT
 """Unified workflow executor with Langfuse tracing support."""
 
+import asyncio
 import logging
 from collections.abc import AsyncGenerator
 from typing import Any, cast
@@ -12,13 +13,16 @@ from langchain_core.runnables import RunnableConfig
 from langgraph.types import Command
 
 from deerflowx.config.report_style import ReportStyle
+from deerflowx.config.settings import settings
 from deerflowx.graphs.research.graph.builder import build_graph_with_memory
+from deerflowx.libs.checkpoint import SQLiteCheckpointSaver
 from deerflowx.libs.rag.retriever import Resource
 from deerflowx.utils.langfuse_utils import (
     create_langfuse_callback_handler,
     get_langfuse_client,
     is_langfuse_enabled,
 )
+from deerflowx.utils.thread_lifecycle import ThreadLifecycleManager
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +33,14 @@ class WorkflowExecutor:
     def __init__(self) -> None:
         """Initialize the workflow executor."""
         self.graph = build_graph_with_memory()
+        self.thread_lifecycle = ThreadLifecycleManager(self.graph.checkpointer, settings.thread_lifecycle)
+
+    async def aclose(self) -> None:
+        """Stop the thread lifecycle sweeps and close the checkpointer."""
+        await self.thread_lifecycle.stop()
+        if isinstance(self.graph.checkpointer, SQLiteCheckpointSaver):
+            # Waits for pending checkpoint writes
+            await asyncio.to_thread(self.graph.checkpointer.close)
 
     async def execute_workflow(  # noqa: PLR0913
         self,
@@ -44,6 +56,8 @@ class WorkflowExecutor:
         enable_background_investigation: bool = True,
         report_style: ReportStyle = ReportStyle.ACADEMIC,
         enable_deep_thinking: bool = False,
+        enable_parallel_steps: bool = False,
+        max_parallel_steps: int = 3,
         user_id: str = "deerflow-user",
         tags: list[str] | None = None,
     ) -> AsyncGenerator[dict[str, Any], None]:
@@ -62,6 +76,8 @@ class WorkflowExecutor:
             enable_background_investigation: Whether to enable background investigation
             report_style: Report style to use
             enable_deep_thinking: Whether to enable deep thinking
+            enable_parallel_steps: Whether to execute independent plan steps concurrently
+            max_parallel_steps: Maximum number of plan steps executed concurrently
             user_id: User ID for tracing
             tags: Tags for tracing
 
@@ -116,6 +132,8 @@ class WorkflowExecutor:
                     enable_background_investigation=enable_background_investigation,
                     report_style=report_style,
                     enable_deep_thinking=enable_deep_thinking,
+                    enable_parallel_steps=enable_parallel_steps,
+                    max_parallel_steps=max_parallel_steps,
                 ):
                     yield event
 
@@ -134,6 +152,8 @@ class WorkflowExecutor:
                 enable_background_investigation=enable_background_investigation,
                 report_style=report_style,
                 enable_deep_thinking=enable_deep_thinking,
+                enable_parallel_steps=enable_parallel_steps,
+                max_parallel_steps=max_parallel_steps,
             ):
                 yield event
 
@@ -151,6 +171,8 @@ class WorkflowExecutor:
         enable_background_investigation: bool,
         report_style: ReportStyle,
         enable_deep_thinking: bool,
+        enable_parallel_steps: bool = False,
+        max_parallel_steps: int = 3,
     ) -> AsyncGenerator[dict[str, Any], None]:
         """Core workflow execution logic."""
         input_ = {
@@ -180,6 +202,8 @@ class WorkflowExecutor:
             "mcp_settings": mcp_settings,
             "report_style": report_style.value,
             "enable_deep_thinking": enable_deep_thinking,
+            "enable_parallel_steps": enable_parallel_steps,
+            "max_parallel_steps": max_parallel_steps,
         }
 
         # Create Langfuse CallbackHandler if enabled
@@ -189,63 +213,64 @@ class WorkflowExecutor:
         if langfuse_handler:
             config["callbacks"] = [langfuse_handler]
 
-        async for agent, _, event_data in self.graph.astream(
-            input_,
-            config=config,
-            stream_mode=["messages", "updates"],
-            subgraphs=True,
-        ):
-            if isinstance(event_data, dict):
-                if "__interrupt__" in event_data:
-                    yield {
-                        "type": "interrupt",
-                        "data": {
-                            "thread_id": thread_id,
-                            "id": event_data["__interrupt__"][0].ns[0],
-                            "role": "assistant",
-                            "content": event_data["__interrupt__"][0].value,
-                            "finish_reason": "interrupt",
-                            "options": [
-                                {"text": "Edit plan", "value": "edit_plan"},
-                                {"text": "Start research", "value": "accepted"},
-                            ],
-                        },
-                    }
-                continue
-
-            message_chunk, message_metadata = cast("tuple[BaseMessage, dict[str, Any]]", event_data)
-            event_stream_message: dict[str, Any] = {
-                "thread_id": thread_id,
-                "agent": agent[0].split(":")[0],
-                "id": message_chunk.id,
-                "role": "assistant",
-                "content": message_chunk.content,
-            }
-
-            if message_chunk.additional_kwargs.get("reasoning_content"):
-                event_stream_message["reasoning_content"] = message_chunk.additional_kwargs["reasoning_content"]
-
-            if message_chunk.response_metadata.get("finish_reason"):
-                event_stream_message["finish_reason"] = message_chunk.response_metadata.get("finish_reason")
-
-            if isinstance(message_chunk, ToolMessage):
-                # Tool Message - Return the result of the tool call
-                event_stream_message["tool_call_id"] = message_chunk.tool_call_id
-                yield {"type": "tool_call_result", "data": event_stream_message}
-            elif isinstance(message_chunk, AIMessageChunk):
-                # AI Message - Raw message tokens
-                if message_chunk.tool_calls:
-                    # AI Message - Tool Call
-                    event_stream_message["tool_calls"] = message_chunk.tool_calls
-                    event_stream_message["tool_call_chunks"] = message_chunk.tool_call_chunks
-                    yield {"type": "tool_calls", "data": event_stream_message}
-                elif message_chunk.tool_call_chunks:
-                    # AI Message - Tool Call Chunks
-                    event_stream_message["tool_call_chunks"] = message_chunk.tool_call_chunks
-                    yield {"type": "tool_call_chunks", "data": event_stream_message}
-                else:
+        async with self.thread_lifecycle.track(thread_id):
+            async for agent, _, event_data in self.graph.astream(
+                input_,
+                config=config,
+                stream_mode=["messages", "updates"],
+                subgraphs=True,
+            ):
+                if isinstance(event_data, dict):
+                    if "__interrupt__" in event_data:
+                        yield {
+                            "type": "interrupt",
+                            "data": {
+                                "thread_id": thread_id,
+                                "id": event_data["__interrupt__"][0].ns[0],
+                                "role": "assistant",
+                                "content": event_data["__interrupt__"][0].value,
+                                "finish_reason": "interrupt",
+                                "options": [
+                                    {"text": "Edit plan", "value": "edit_plan"},
+                                    {"text": "Start research", "value": "accepted"},
+                                ],
+                            },
+                        }
+                    continue
+
+                message_chunk, message_metadata = cast("tuple[BaseMessage, dict[str, Any]]", event_data)
+                event_stream_message: dict[str, Any] = {
+                    "thread_id": thread_id,
+                    "agent": agent[0].split(":")[0],
+                    "id": message_chunk.id,
+                    "role": "assistant",
+                    "content": message_chunk.content,
+                }
+
+                if message_chunk.additional_kwargs.get("reasoning_content"):
+                    event_stream_message["reasoning_content"] = message_chunk.additional_kwargs["reasoning_content"]
+
+                if message_chunk.response_metadata.get("finish_reason"):
+                    event_stream_message["finish_reason"] = message_chunk.response_metadata.get("finish_reason")
+
+                if isinstance(message_chunk, ToolMessage):
+                    # Tool Message - Return the result of the tool call
+                    event_stream_message["tool_call_id"] = message_chunk.tool_call_id
+                    yield {"type": "tool_call_result", "data": event_stream_message}
+                elif isinstance(message_chunk, AIMessageChunk):
                     # AI Message - Raw message tokens
-                    yield {"type": "message_chunk", "data": event_stream_message}
+                    if message_chunk.tool_calls:
+                        # AI Message - Tool Call
+                        event_stream_message["tool_calls"] = message_chunk.tool_calls
+                        event_stream_message["tool_call_chunks"] = message_chunk.tool_call_chunks
+                        yield {"type": "tool_calls", "data": event_stream_message}
+                    elif message_chunk.tool_call_chunks:
+                        # AI Message - Tool Call Chunks
+                        event_stream_message["tool_call_chunks"] = message_chunk.tool_call_chunks
+                        yield {"type": "tool_call_chunks", "data": event_stream_message}
+                    else:
+                        # AI Message - Raw message tokens
+                        yield {"type": "message_chunk", "data": event_stream_message}
 
 
 # Create a global instance for reuse
@@ -7,6 +7,8 @@ from unittest.mock import patch
 
 import pytest
 
+from deerflowx.config.settings import settings
+
 
 @pytest.fixture(autouse=True, scope="session")
 def mock_environment_variables():
@@ -18,3 +20,12 @@ def mock_environment_variables():
 
     with patch.dict(os.environ, test_env_vars):
         yield
+
+
+@pytest.fixture(autouse=True)
+def isolate_caches(monkeypatch):
+    """Keep tests from using the on-disk caches, shared search provider state or extraction workers."""
+    monkeypatch.setattr(settings.search_cache, "enabled", False)
+    monkeypatch.setattr(settings.search_resilience, "enabled", False)
+    monkeypatch.setattr(settings.crawler, "cache_enabled", False)
+    monkeypatch.setattr(settings.crawler, "extraction_mode", "inline")
@@ -0,0 +1,97 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+import operator
+from typing import Annotated
+from unittest.mock import patch
+
+import pytest
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import END, START, StateGraph
+from langgraph.types import Command, Send, interrupt
+from typing_extensions import TypedDict
+
+from deerflowx.libs.checkpoint import SQLiteCheckpointSaver, build_checkpointer
+
+
+class DemoState(TypedDict):
+    items: Annotated[list[str], operator.add]
+    feedback: str
+
+
+def _build_demo_graph(checkpointer):
+    def ask(state):
+        return {"feedback": interrupt("review")}
+
+    def fan_out(state):
+        return [Send("work", {"items": [], "feedback": f"{state['feedback']}-{i}"}) for i in range(3)]
+
+    def work(state):
+        return {"items": [state["feedback"]]}
+
+    builder = StateGraph(DemoState)
+    builder.add_node("ask", ask)
+    builder.add_node("work", work)
+    builder.add_edge(START, "ask")
+    builder.add_conditional_edges("ask", fan_out, ["work"])
+    builder.add_edge("work", END)
+    return builder.compile(checkpointer=checkpointer)
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return tmp_path / "checkpoints.sqlite"
+
+
+@pytest.mark.asyncio
+async def test_interrupt_and_resume_across_saver_instances(db_path):
+    config = {"configurable": {"thread_id": "thread-1"}}
+
+    first_worker = SQLiteCheckpointSaver(db_path)
+    await _build_demo_graph(first_worker).ainvoke({"items": []}, config)
+    first_worker.close()
+
+    # A second process opening the same database can resume the interrupted thread
+    second_worker = SQLiteCheckpointSaver(db_path)
+    result = await _build_demo_graph(second_worker).ainvoke(Command(resume="ok"), config)
+    assert sorted(result["items"]) == ["ok-0", "ok-1", "ok-2"]
+
+    history = [c async for c in second_worker.alist(config)]
+    assert len(history) >= 3
+    assert history[0].checkpoint["channel_values"]["feedback"] == "ok"
+    second_worker.close()
+
+
+def test_sync_api_matches_memory_saver(db_path):
+    config = {"configurable": {"thread_id": "thread-2"}}
+    saver = SQLiteCheckpointSaver(db_path)
+    memory = MemorySaver()
+
+    _build_demo_graph(saver).invoke({"items": []}, config)
+    _build_demo_graph(memory).invoke({"items": []}, config)
+
+    assert saver.get_tuple(config).checkpoint["channel_values"] == memory.get_tuple(config).checkpoint["channel_values"]
+    assert len(list(saver.list(config))) == len(list(memory.list(config)))
+    assert len(list(saver.list(config, limit=1))) == 1
+
+    saver.delete_thread("thread-2")
+    assert saver.get_tuple(config) is None
+    saver.close()
+
+
+def test_build_checkpointer_defaults_to_memory():
+    assert isinstance(build_checkpointer(), MemorySaver)
+
+
+def test_build_checkpointer_sqlite(db_path, monkeypatch):
+    monkeypatch.setenv("SQLITE_CHECKPOINTER_PATH", str(db_path))
+    with patch("deerflowx.libs.checkpoint.builder.SELECTED_CHECKPOINTER", "sqlite"):
+        saver = build_checkpointer()
+    assert isinstance(saver, SQLiteCheckpointSaver)
+    assert db_path.exists()
+    saver.close()
+
+
+def test_build_checkpointer_unsupported():
+    with patch("deerflowx.libs.checkpoint.builder.SELECTED_CHECKPOINTER", "redis"), pytest.raises(ValueError):
+        build_checkpointer()
@@ -34,6 +34,8 @@ def test_default_configuration():
     assert config.summarizer_chunk_size == 8000
     assert config.summarizer_chunk_overlap == 400
     assert config.summarizer_enable_second_pass is True
+    assert config.enable_parallel_steps is False
+    assert config.max_parallel_steps == 3
 
 
 def test_from_runnable_config_with_config_dict():
@@ -0,0 +1,121 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from deerflowx.libs.crawler import Article, Crawler, CrawlLimiter, JinaClient
+from deerflowx.tools.crawl import crawl_tool
+
+HTML = "<html><body><article><h1>Title</h1><p>Some readable content.</p></article></body></html>"
+
+
+class ConcurrencyProbe:
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.active = {}
+        self.peak = {}
+        self.peak_total = 0
+
+    async def acrawl(self, url, return_format="html"):
+        domain = url.split("/")[2]
+        if "fail" in url:
+            msg = f"cannot fetch {url}"
+            raise RuntimeError(msg)
+        self.active[domain] = self.active.get(domain, 0) + 1
+        self.peak[domain] = max(self.peak.get(domain, 0), self.active[domain])
+        self.peak_total = max(self.peak_total, sum(self.active.values()))
+        await asyncio.sleep(self.delay)
+        self.active[domain] -= 1
+        return HTML
+
+
+class DummyReadabilityExtractor:
+    def extract_article(self, html):
+        return Article(title="Title", html_content="<p>Some readable content.</p>")
+
+
+@pytest.fixture
+def probe(monkeypatch):
+    probe = ConcurrencyProbe()
+    monkeypatch.setattr("deerflowx.libs.crawler.crawler.JinaClient", lambda: probe)
+    monkeypatch.setattr("deerflowx.libs.crawler.crawler.ReadabilityExtractor", DummyReadabilityExtractor)
+    return probe
+
+
+@pytest.mark.asyncio
+async def test_acrawl_many_runs_concurrently(probe):
+    crawler = Crawler(CrawlLimiter(max_concurrency=6, max_concurrency_per_domain=6))
+    urls = [f"https://site{i}.example.com/page" for i in range(6)]
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    articles = await crawler.acrawl_many(urls)
+    elapsed = loop.time() - started
+
+    assert [article.url for article in articles] == urls
+    assert "readable content" in articles[0].to_markdown()
+    assert probe.peak_total == 6
+    assert elapsed < probe.delay * 3
+
+
+@pytest.mark.asyncio
+async def test_acrawl_many_respects_global_and_domain_limits(probe):
+    crawler = Crawler(CrawlLimiter(max_concurrency=3, max_concurrency_per_domain=1))
+    urls = [f"https://a.example.com/{i}" for i in range(3)] + [f"https://site{i}.example.com/" for i in range(4)]
+
+    await crawler.acrawl_many(urls)
+
+    assert probe.peak["a.example.com"] == 1
+    assert probe.peak_total == 3
+    assert crawler.limiter._domains == {}
+
+
+@pytest.mark.asyncio
+async def test_acrawl_many_reports_failures_per_url(probe):
+    crawler = Crawler(CrawlLimiter(max_concurrency=2, max_concurrency_per_domain=2))
+
+    ok, failed = await crawler.acrawl_many(["https://ok.example.com/", "https://fail.example.com/"])
+
+    assert ok.url == "https://ok.example.com/"
+    assert isinstance(failed, RuntimeError)
+
+
+@pytest.mark.asyncio
+async def test_crawl_tool_has_native_async_implementation(probe):
+    result = await crawl_tool.ainvoke({"url": "https://ok.example.com/"})
+
+    assert result["url"] == "https://ok.example.com/"
+    assert "readable content" in result["crawled_content"]
+
+
+@pytest.mark.asyncio
+async def test_crawl_tool_async_reports_errors(probe):
+    result = await crawl_tool.ainvoke({"url": "https://fail.example.com/"})
+
+    assert result.startswith("Failed to crawl")
+
+
+@pytest.mark.asyncio
+async def test_jina_client_acrawl_posts_to_reader(monkeypatch):
+    requests_seen = []
+
+    def handler(request):
+        requests_seen.append(request)
+        return httpx.Response(200, text=HTML)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr("deerflowx.libs.crawler.jina_client.get_async_http_client", lambda: client)
+    monkeypatch.setenv("JINA_API_KEY", "key")
+
+    html = await JinaClient().acrawl("https://example.com/", return_format="html")
+    await client.aclose()
+
+    assert html == HTML
+    (request,) = requests_seen
+    assert json.loads(request.content) == {"url": "https://example.com/"}
+    assert request.headers["Authorization"] == "Bearer key"
+    assert request.headers["X-Return-Format"] == "html"
@@ -0,0 +1,142 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+from unittest.mock import patch
+
+import pytest
+
+from deerflowx.libs.crawler import Article, CrawlCache, Crawler
+from deerflowx.libs.crawler.cache import normalize_url
+from deerflowx.libs.crawler.jina_client import CrawlResponse
+
+HTML = "<html><body><p>Some readable content.</p></body></html>"
+
+
+class FakeJinaClient:
+    def __init__(self, responses):
+        self.responses = responses
+        self.requests = []
+
+    def fetch(self, url, return_format="html", validators=None):
+        self.requests.append((url, validators))
+        return self.responses.pop(0)
+
+    async def afetch(self, url, return_format="html", validators=None):
+        return self.fetch(url, return_format, validators)
+
+
+class CountingExtractor:
+    calls = 0
+
+    def extract_article(self, html):
+        CountingExtractor.calls += 1
+        return Article(title="Title", html_content="<p>Some readable content.</p>")
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = CrawlCache(tmp_path / "crawl_cache.sqlite", ttl_seconds=60, max_bytes=1024 * 1024)
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def jina(monkeypatch):
+    client = FakeJinaClient([])
+    CountingExtractor.calls = 0
+    monkeypatch.setattr("deerflowx.libs.crawler.crawler.JinaClient", lambda: client)
+    monkeypatch.setattr("deerflowx.libs.crawler.crawler.ReadabilityExtractor", CountingExtractor)
+    return client
+
+
+def test_normalize_url():
+    assert normalize_url("HTTPS://Example.com:443/a?b=2&a=1#frag") == "https://example.com/a?a=1&b=2"
+    assert normalize_url("http://example.com") == "http://example.com/"
+    assert normalize_url("http://example.com:8080/") == "http://example.com:8080/"
+
+
+def test_cache_hit_skips_crawl_and_extraction(cache, jina):
+    jina.responses = [CrawlResponse(200, HTML)]
+    crawler = Crawler(cache=cache)
+
+    first = crawler.crawl("https://example.com/page#section")
+    second = crawler.crawl("https://EXAMPLE.com/page")
+
+    assert len(jina.requests) == 1
+    assert CountingExtractor.calls == 1
+    assert second.url == "https://EXAMPLE.com/page"
+    assert second.to_markdown() == first.to_markdown()
+
+
+def test_error_responses_are_not_cached(cache, jina):
+    jina.responses = [CrawlResponse(500, "error"), CrawlResponse(200, HTML)]
+    crawler = Crawler(cache=cache)
+
+    crawler.crawl("https://example.com/")
+    crawler.crawl("https://example.com/")
+
+    assert len(jina.requests) == 2
+
+
+def test_stale_entry_is_revalidated(cache, jina):
+    jina.responses = [
+        CrawlResponse(200, HTML, etag='"v1"', last_modified="Wed, 21 Oct 2015 07:28:00 GMT"),
+        CrawlResponse(304, ""),
+    ]
+    crawler = Crawler(cache=cache)
+    crawler.crawl("https://example.com/")
+
+    with patch(
+        "deerflowx.libs.crawler.cache.time.time",
+        return_value=cache.get("https://example.com/", "html").fetched_at + 120,
+    ):
+        article = crawler.crawl("https://example.com/")
+        assert cache.get("https://example.com/", "html").is_fresh
+
+    assert jina.requests[1][1] == {"If-None-Match": '"v1"', "If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT"}
+    assert CountingExtractor.calls == 1
+    assert "readable content" in article.to_markdown()
+
+
+def test_stale_entry_without_validators_is_refetched(cache, jina):
+    jina.responses = [CrawlResponse(200, HTML), CrawlResponse(200, HTML)]
+    crawler = Crawler(cache=cache)
+    crawler.crawl("https://example.com/")
+
+    with patch(
+        "deerflowx.libs.crawler.cache.time.time",
+        return_value=cache.get("https://example.com/", "html").fetched_at + 120,
+    ):
+        crawler.crawl("https://example.com/")
+
+    assert jina.requests[1][1] == {}
+    assert CountingExtractor.calls == 2
+
+
+def test_least_recently_accessed_entries_are_evicted(tmp_path):
+    article = Article(title="Title", html_content="x" * 100, markdown="x" * 100)
+    cache = CrawlCache(tmp_path / "crawl_cache.sqlite", ttl_seconds=60, max_bytes=450)
+    try:
+        cache.put("https://a.example.com/", "html", article)
+        cache.put("https://b.example.com/", "html", article)
+        cache.get("https://a.example.com/", "html")
+        cache.put("https://c.example.com/", "html", article)
+
+        assert cache.get("https://a.example.com/", "html") is not None
+        assert cache.get("https://b.example.com/", "html") is None
+        assert cache.get("https://c.example.com/", "html") is not None
+        assert cache.total_bytes <= 450
+    finally:
+        cache.close()
+
+
+@pytest.mark.asyncio
+async def test_async_crawl_uses_cache(cache, jina):
+    jina.responses = [CrawlResponse(200, HTML)]
+    crawler = Crawler(cache=cache)
+
+    await crawler.acrawl("https://example.com/")
+    article = await crawler.acrawl("https://example.com/")
+
+    assert len(jina.requests) == 1
+    assert "readable content" in article.to_markdown()
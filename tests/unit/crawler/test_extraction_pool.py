@@ -0,0 +1,126 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import os
+import time
+
+import pytest
+
+from deerflowx.libs.crawler import Article, Crawler, ExtractionPool
+from deerflowx.libs.crawler.extraction_pool import _Worker
+
+
+def fake_extract(html):
+    if "slow" in html:
+        time.sleep(5)
+    elif "medium" in html:
+        time.sleep(0.3)
+    elif "crash" in html:
+        os._exit(1)
+    article = Article(title=f"pid {os.getpid()}", html_content=f"<p>{html}</p>")
+    return article.title, article.html_content, article.to_markdown(including_title=False)
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    # Spawned workers receive the extractor by reference, so they run this module's fake
+    monkeypatch.setattr("deerflowx.libs.crawler.extraction_pool._extract", fake_extract)
+    pool = ExtractionPool(max_workers=2, timeout_seconds=1)
+    yield pool
+    pool.shutdown()
+
+
+def test_extraction_runs_in_worker_process(pool):
+    article = pool.extract("https://example.com/", "fast page")
+
+    assert article.url == "https://example.com/"
+    assert article.title != f"pid {os.getpid()}"
+    assert article.to_markdown(including_title=False).strip() == "fast page"
+
+
+@pytest.mark.asyncio
+async def test_async_crawler_dispatches_to_pool(pool, monkeypatch):
+    class FakeJinaClient:
+        async def acrawl(self, url, return_format="html"):
+            return f"content of {url}"
+
+    monkeypatch.setattr("deerflowx.libs.crawler.crawler.JinaClient", FakeJinaClient)
+    crawler = Crawler(extraction_pool=pool)
+
+    articles = await crawler.acrawl_many(["https://a.example.com/", "https://b.example.com/"])
+
+    assert [article.to_markdown(including_title=False).strip() for article in articles] == [
+        "content of https://a.example.com/",
+        "content of https://b.example.com/",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_timeout_restarts_workers(pool):
+    with pytest.raises(TimeoutError, match="exceeded"):
+        await pool.aextract("https://example.com/slow", "slow page")
+
+    # The pool recovers with fresh workers
+    article = await pool.aextract("https://example.com/", "fast page")
+    assert article.to_markdown(including_title=False).strip() == "fast page"
+
+
+@pytest.mark.asyncio
+async def test_timeout_spares_queued_and_running_documents(pool):
+    slow = asyncio.create_task(pool.aextract("https://example.com/slow", "slow page"))
+    # More work than the other worker finishes within the timeout, so most of it waits in the queue
+    others = [pool.aextract(f"https://example.com/{i}", f"medium page {i}") for i in range(8)]
+
+    articles = await asyncio.gather(*others)
+
+    with pytest.raises(TimeoutError, match="exceeded"):
+        await slow
+    assert [article.to_markdown(including_title=False).strip() for article in articles] == [
+        f"medium page {i}" for i in range(8)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_crashed_worker_is_replaced(pool):
+    with pytest.raises(RuntimeError, match="exited unexpectedly"):
+        await pool.aextract("https://example.com/crash", "crash page")
+
+    articles = await asyncio.gather(*(pool.aextract(f"https://example.com/{i}", "fast page") for i in range(4)))
+    assert all(article.to_markdown(including_title=False).strip() == "fast page" for article in articles)
+
+
+def test_worker_killed_between_documents_is_replaced(monkeypatch):
+    monkeypatch.setattr("deerflowx.libs.crawler.extraction_pool._extract", fake_extract)
+    worker = _Worker()
+    worker.start()
+    try:
+        worker._process.kill()
+        worker._process.join()
+
+        assert worker.run("fast page", timeout_seconds=5)[2].strip() == "fast page"
+    finally:
+        worker.stop()
+
+
+def test_failed_worker_start_fails_documents_instead_of_hanging(monkeypatch):
+    monkeypatch.setattr("deerflowx.libs.crawler.extraction_pool._extract", fake_extract)
+    start = _Worker.start
+    failures = iter([OSError("cannot start"), OSError("cannot start")])
+
+    def flaky_start(worker):
+        if (error := next(failures, None)) is not None:
+            raise error
+        start(worker)
+
+    monkeypatch.setattr(_Worker, "start", flaky_start)
+    pool = ExtractionPool(max_workers=1, timeout_seconds=5)
+    try:
+        with pytest.raises(OSError, match="cannot start"):
+            pool.extract("https://example.com/", "fast page")
+
+        assert pool.extract("https://example.com/", "fast page").to_markdown(including_title=False).strip() == (
+            "fast page"
+        )
+    finally:
+        pool.shutdown()
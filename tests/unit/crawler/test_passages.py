@@ -0,0 +1,70 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+from deerflowx.libs.crawler.passages import select_passages, split_passages
+from deerflowx.utils.tokenizer import get_tokenizer
+
+ARTICLE = """# Solar power
+
+Solar panels convert sunlight into electricity using photovoltaic cells.
+
+## History
+
+The photovoltaic effect was discovered in 1839 by Edmond Becquerel.
+
+## Costs
+
+Module prices fell by about 90 percent between 2010 and 2020.
+
+## Storage
+
+Batteries store surplus energy for use at night."""
+
+
+def test_split_keeps_headings_with_their_paragraph():
+    passages = split_passages(ARTICLE, max_chars=90)
+
+    assert passages[1] == "## History\n\nThe photovoltaic effect was discovered in 1839 by Edmond Becquerel."
+    assert all(len(passage) <= 90 for passage in passages)
+
+
+def test_split_breaks_long_paragraphs_on_sentences():
+    paragraph = "First sentence here. Second sentence here. Third sentence here."
+
+    assert split_passages(paragraph, max_chars=45) == [
+        "First sentence here. Second sentence here.",
+        "Third sentence here.",
+    ]
+
+
+def test_select_returns_most_relevant_passages_in_document_order():
+    passages = split_passages(ARTICLE, max_chars=90)
+    tokenizer = get_tokenizer()
+    budget = tokenizer.count(passages[2]) + tokenizer.count(passages[3]) + 5
+
+    selected = select_passages(passages, "battery storage at night and module prices", budget)
+
+    assert selected == [passages[2], passages[3]]
+
+
+def test_select_without_query_returns_leading_passages():
+    passages = split_passages(ARTICLE, max_chars=90)
+
+    selected = select_passages(passages, None, get_tokenizer().count(passages[0]) + 1)
+
+    assert selected == [passages[0]]
+
+
+def test_select_truncates_when_nothing_fits():
+    (selected,) = select_passages(["word " * 100], "word", token_budget=5)
+
+    assert selected == "word word word word word"
+    assert get_tokenizer().count(selected) == 5
+
+
+def test_select_counts_tokens_with_the_given_tokenizer():
+    passages = ["研究人工智能在教育领域的应用。" * 4, "Solar panels convert sunlight."]
+    tokenizer = get_tokenizer("gpt-4o")
+    budget = tokenizer.count(passages[0])
+
+    assert select_passages(passages, "研究", budget, tokenizer) == [passages[0]]
@@ -0,0 +1,124 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+import asyncio
+
+import pytest
+from langchain_core.messages import ToolMessage
+from langchain_core.tools import tool
+
+from deerflowx.config.settings import settings
+from deerflowx.libs.crawler import Article, CrawlCache, CrawlPrefetcher
+from deerflowx.libs.crawler.jina_client import CrawlResponse
+from deerflowx.tools.crawl import acrawl
+from deerflowx.tools.prefetch import attach_search_prefetch, search_result_urls
+
+HTML = "<html><body><p>Some readable content.</p></body></html>"
+
+
+class SlowJinaClient:
+    def __init__(self) -> None:
+        self.requests: list[str] = []
+
+    async def afetch(self, url, return_format="html", validators=None):
+        self.requests.append(url)
+        await asyncio.sleep(0.05)
+        return CrawlResponse(200, HTML)
+
+
+class DummyExtractor:
+    def extract_article(self, html):
+        return Article(title="Title", html_content="<p>Some readable content.</p>")
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = CrawlCache(tmp_path / "crawl_cache.sqlite", ttl_seconds=60, max_bytes=1024 * 1024)
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def jina(monkeypatch):
+    client = SlowJinaClient()
+    monkeypatch.setattr("deerflowx.libs.crawler.crawler.JinaClient", lambda: client)
+    monkeypatch.setattr("deerflowx.libs.crawler.crawler.ReadabilityExtractor", DummyExtractor)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_prefetch_parks_articles_in_cache(cache, jina):
+    prefetcher = CrawlPrefetcher(cache, max_concurrency=2, max_pending=8)
+
+    assert prefetcher.prefetch(["https://a.com/", "https://b.com/", "https://A.com"]) == 2
+    await prefetcher.wait_for("https://a.com/")
+    await prefetcher.wait_for("https://b.com/")
+
+    assert cache.get("https://a.com/", "html") is not None
+    assert cache.get("https://b.com/", "html") is not None
+    assert prefetcher.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_prefetch_is_capped(cache, jina):
+    prefetcher = CrawlPrefetcher(cache, max_concurrency=1, max_pending=2)
+
+    assert prefetcher.prefetch([f"https://example.com/{i}" for i in range(5)]) == 2
+    await prefetcher.close()
+
+
+@pytest.mark.asyncio
+async def test_fresh_cache_entries_are_not_refetched(cache, jina):
+    cache.put("https://a.com/", "html", DummyExtractor().extract_article(HTML))
+    prefetcher = CrawlPrefetcher(cache, max_concurrency=2, max_pending=8)
+
+    prefetcher.prefetch(["https://a.com/"])
+    await prefetcher.wait_for("https://a.com/")
+
+    assert jina.requests == []
+
+
+@pytest.mark.asyncio
+async def test_crawl_tool_joins_running_prefetch(cache, jina, monkeypatch):
+    prefetcher = CrawlPrefetcher(cache, max_concurrency=2, max_pending=8)
+    monkeypatch.setattr("deerflowx.tools.crawl.get_crawl_prefetcher", lambda: prefetcher)
+    monkeypatch.setattr("deerflowx.tools.crawl.get_crawl_cache", lambda: cache)
+
+    prefetcher.prefetch(["https://a.com/"])
+    result = await acrawl.__wrapped__("https://a.com/")
+
+    assert jina.requests == ["https://a.com/"]
+    assert "Some readable content." in result["crawled_content"]
+
+
+def test_search_result_urls():
+    results = [
+        {"type": "page", "url": "https://a.com"},
+        {"type": "image", "image_url": "https://a.com/x.png"},
+        {"title": "brave", "link": "https://b.com"},
+        {"type": "page", "url": "not a url"},
+    ]
+
+    assert search_result_urls(results) == ["https://a.com", "https://b.com"]
+    assert search_result_urls(ToolMessage(content=results, tool_call_id="1")) == ["https://a.com", "https://b.com"]
+    assert search_result_urls('[{"link": "https://c.com"}]') == ["https://c.com"]
+    assert search_result_urls("snippet: no json here") == []
+
+
+@pytest.mark.asyncio
+async def test_search_tool_triggers_prefetch(cache, jina, monkeypatch):
+    monkeypatch.setattr(settings.crawler, "prefetch_enabled", True)
+    monkeypatch.setattr(settings.crawler, "prefetch_top_k", 1)
+    prefetcher = CrawlPrefetcher(cache, max_concurrency=2, max_pending=8)
+    monkeypatch.setattr("deerflowx.tools.prefetch.get_crawl_prefetcher", lambda: prefetcher)
+
+    @tool
+    async def web_search(query: str) -> list[dict]:
+        """Search the web."""
+        return [{"type": "page", "url": "https://a.com/"}, {"type": "page", "url": "https://b.com/"}]
+
+    search = attach_search_prefetch(web_search)
+    await search.ainvoke({"type": "tool_call", "id": "1", "name": "web_search", "args": {"query": "q"}})
+    await prefetcher.wait_for("https://a.com/")
+
+    assert jina.requests == ["https://a.com/"]
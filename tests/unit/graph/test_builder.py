@@ -90,12 +90,12 @@ def test_build_base_graph_adds_nodes_and_edges(MockStateGraph):
 
 
 @patch("deerflowx.graphs.research.graph.builder._build_base_graph")
-@patch("deerflowx.graphs.research.graph.builder.MemorySaver")
-def test_build_graph_with_memory_uses_memory(MockMemorySaver, mock_build_base_graph):
+@patch("deerflowx.graphs.research.graph.builder.build_checkpointer")
+def test_build_graph_with_memory_uses_memory(mock_build_checkpointer, mock_build_base_graph):
     mock_builder = MagicMock()
     mock_build_base_graph.return_value = mock_builder
     mock_memory = MagicMock()
-    MockMemorySaver.return_value = mock_memory
+    mock_build_checkpointer.return_value = mock_memory
 
     builder_mod.build_graph_with_memory()
 
@@ -0,0 +1,222 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from langchain_core.messages import AIMessage
+from langgraph.graph import END, START, StateGraph
+from langgraph.types import Send
+
+from deerflowx.graphs.research.graph.builder import continue_to_running_research_team
+from deerflowx.graphs.research.graph.nodes._executor import _execute_agent_step
+from deerflowx.graphs.research.graph.nodes.research_team import research_team_node
+from deerflowx.graphs.research.graph.scheduler import get_ready_step_indices, get_step_dependencies
+from deerflowx.graphs.research.graph.state import State
+from deerflowx.prompts.planner_model import Plan, Step, StepType
+
+PARALLEL_CONFIG = {"configurable": {"enable_parallel_steps": True, "max_parallel_steps": 3}}
+
+
+def make_step(title, step_type=StepType.RESEARCH, execution_res=None, depends_on=None):
+    return Step(
+        need_search=step_type == StepType.RESEARCH,
+        title=title,
+        description=f"Describe {title}",
+        step_type=step_type,
+        execution_res=execution_res,
+        depends_on=depends_on,
+    )
+
+
+def make_plan(steps):
+    return Plan(locale="en-US", has_enough_context=False, thought="thought", title="title", steps=steps)
+
+
+class TestGetReadyStepIndices:
+    def test_independent_research_steps_are_ready_together(self):
+        plan = make_plan([make_step("a"), make_step("b"), make_step("c")])
+        assert get_ready_step_indices(plan, 5) == [0, 1, 2]
+
+    def test_respects_concurrency_cap(self):
+        plan = make_plan([make_step("a"), make_step("b"), make_step("c")])
+        assert get_ready_step_indices(plan, 2) == [0, 1]
+
+    def test_processing_step_waits_for_previous_steps(self):
+        plan = make_plan([make_step("a"), make_step("calc", StepType.PROCESSING), make_step("b")])
+        assert get_ready_step_indices(plan, 5) == [0]
+
+    def test_processing_step_runs_alone_once_unblocked(self):
+        plan = make_plan([make_step("a", execution_res="done"), make_step("calc", StepType.PROCESSING), make_step("b")])
+        assert get_ready_step_indices(plan, 5) == [1]
+
+    def test_no_ready_steps_when_all_executed(self):
+        plan = make_plan([make_step("a", execution_res="done")])
+        assert get_ready_step_indices(plan, 5) == []
+
+
+class TestStepDependencies:
+    def test_plan_drops_forward_and_self_references(self):
+        plan = make_plan([make_step("a", depends_on=[0, 1]), make_step("b", depends_on=[0, 0, 5, -1])])
+        assert plan.steps[0].depends_on == []
+        assert plan.steps[1].depends_on == [0]
+
+    def test_undeclared_dependencies_fall_back_to_step_type(self):
+        plan = make_plan([make_step("a"), make_step("calc", StepType.PROCESSING), make_step("b")])
+        assert get_step_dependencies(plan, 0) == []
+        assert get_step_dependencies(plan, 1) == [0]
+        assert get_step_dependencies(plan, 2) == [1]
+
+    def test_declared_dependencies_unblock_steps_early(self):
+        plan = make_plan(
+            [
+                make_step("a", depends_on=[]),
+                make_step("b", depends_on=[]),
+                make_step("calc a", StepType.PROCESSING, depends_on=[0]),
+                make_step("c", depends_on=[]),
+            ]
+        )
+        assert get_ready_step_indices(plan, 5) == [0, 1, 3]
+
+        plan.steps[0].execution_res = "result a"
+        assert get_ready_step_indices(plan, 5) == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_step_only_receives_context_of_its_dependencies(self):
+        plan = make_plan(
+            [
+                make_step("a", execution_res="result a", depends_on=[]),
+                make_step("b", execution_res="result b", depends_on=[]),
+                make_step("calc", StepType.PROCESSING, depends_on=[1]),
+            ]
+        )
+        agent = MagicMock()
+        agent.ainvoke = AsyncMock(return_value={"messages": [AIMessage(content="result calc")]})
+        state = {"current_plan": plan, "observations": ["result a", "result b"], "step_index": 2}
+
+        await _execute_agent_step(state, agent, "coder", {"configurable": {"enable_context_compression": False}})
+
+        prompt = agent.ainvoke.call_args.kwargs["input"]["messages"][0].content
+        assert "### Step 2: b" in prompt
+        assert "result b" in prompt
+        assert "result a" not in prompt
+
+
+class TestParallelRouting:
+    def test_fans_out_with_send(self):
+        plan = make_plan([make_step("a"), make_step("b"), make_step("calc", StepType.PROCESSING)])
+        result = continue_to_running_research_team({"current_plan": plan}, PARALLEL_CONFIG)
+
+        assert isinstance(result, list)
+        assert all(isinstance(send, Send) for send in result)
+        assert [send.node for send in result] == ["researcher", "researcher"]
+        assert [send.arg["step_index"] for send in result] == [0, 1]
+
+    def test_serial_mode_is_default(self):
+        plan = make_plan([make_step("a"), make_step("b")])
+        assert continue_to_running_research_team({"current_plan": plan}) == "researcher"
+
+
+@pytest.mark.asyncio
+async def test_research_team_merges_results_in_plan_order():
+    plan = make_plan([make_step("a"), make_step("b"), make_step("c")])
+    state = {
+        "current_plan": plan,
+        "observations": [],
+        "step_results": [
+            {"step_index": 2, "execution_res": "result c"},
+            {"step_index": 0, "execution_res": "result a"},
+        ],
+    }
+
+    update = await research_team_node(state)
+
+    assert update["observations"] == ["result a", "result c"]
+    assert [step.execution_res for step in update["current_plan"].steps] == ["result a", None, "result c"]
+    assert update["step_results"] == []
+    # The plan in the incoming state is left untouched
+    assert plan.steps[0].execution_res is None
+
+
+@pytest.mark.asyncio
+async def test_parallel_steps_run_concurrently_end_to_end():
+    delay = 0.2
+
+    async def fake_researcher(state, config):
+        agent = MagicMock()
+
+        async def ainvoke(input, config):  # noqa: A002
+            await asyncio.sleep(delay)
+            title = input["messages"][0].content.split("## Title\n\n")[1].split("\n")[0]
+            return {"messages": [AIMessage(content=f"result {title}")]}
+
+        agent.ainvoke = AsyncMock(side_effect=ainvoke)
+        return await _execute_agent_step(state, agent, "coder", {})
+
+    builder = StateGraph(State)
+    builder.add_node("research_team", research_team_node)
+    builder.add_node("researcher", fake_researcher)
+    builder.add_node("coder", fake_researcher)
+    builder.add_node("planner", lambda _state: {})
+    builder.add_node("tokens_evaluator", lambda _state: {})
+    builder.add_edge(START, "research_team")
+    builder.add_conditional_edges(
+        "research_team",
+        continue_to_running_research_team,
+        ["planner", "researcher", "coder", "tokens_evaluator"],
+    )
+    builder.add_edge("tokens_evaluator", END)
+    builder.add_edge("planner", END)
+    graph = builder.compile()
+
+    plan = make_plan([make_step("a"), make_step("b"), make_step("c"), make_step("d", StepType.PROCESSING)])
+    started = time.monotonic()
+    final_state = await graph.ainvoke(
+        {"current_plan": plan, "observations": [], "messages": [], "step_results": []},
+        config=PARALLEL_CONFIG,
+    )
+    elapsed = time.monotonic() - started
+
+    assert final_state["observations"] == ["result a", "result b", "result c", "result d"]
+    assert [step.execution_res for step in final_state["current_plan"].steps] == final_state["observations"]
+    # Three research steps in one batch, then the processing step: two rounds instead of four.
+    assert elapsed < delay * 4
+
+
+@pytest.mark.asyncio
+async def test_research_team_keeps_plan_order_for_out_of_order_results():
+    plan = make_plan(
+        [
+            make_step("a", execution_res="result a"),
+            make_step("b", depends_on=[0]),
+            make_step("c", execution_res="result c"),
+        ]
+    )
+    state = {
+        "current_plan": plan,
+        "observations": ["background", "result a", "result c"],
+        "step_results": [{"step_index": 1, "execution_res": "result b"}],
+    }
+
+    update = await research_team_node(state)
+
+    assert update["observations"] == ["background", "result a", "result b", "result c"]
+
+
+@pytest.mark.asyncio
+async def test_research_team_keeps_identical_step_outputs():
+    plan = make_plan([make_step("a", execution_res="no results"), make_step("b"), make_step("c")])
+    state = {
+        "current_plan": plan,
+        "observations": ["background", "no results"],
+        "step_results": [
+            {"step_index": 2, "execution_res": "no results"},
+            {"step_index": 1, "execution_res": "no results"},
+        ],
+    }
+
+    update = await research_team_node(state)
+
+    assert update["observations"] == ["background", "no results", "no results", "no results"]
@@ -59,15 +59,15 @@ class TestTokenEstimator:
     """测试Token估算器节点."""
 
     @pytest.mark.asyncio
-    @patch("deerflowx.graphs.research.graph.nodes.tokens_evaluator.get_llm_by_type")
-    async def test_small_observations_direct_route(self, mock_llm_get, mock_config, small_observations):
+    @patch("deerflowx.graphs.research.graph.nodes.tokens_evaluator.get_agent_tokenizer")
+    async def test_small_observations_direct_route(self, mock_tokenizer_get, mock_config, small_observations):
         """测试小型observations直接路由到reporter."""
 
         from unittest.mock import MagicMock
 
-        mock_llm = MagicMock()
-        mock_llm.get_num_tokens.return_value = 50
-        mock_llm_get.return_value = mock_llm
+        mock_tokenizer = MagicMock()
+        mock_tokenizer.count_batch.return_value = [50]
+        mock_tokenizer_get.return_value = mock_tokenizer
 
         state = {
             "observations": small_observations,
@@ -80,15 +80,15 @@ class TestTokenEstimator:
         assert "below threshold" in result["decision_reason"]
 
     @pytest.mark.asyncio
-    @patch("deerflowx.graphs.research.graph.nodes.tokens_evaluator.get_llm_by_type")
-    async def test_large_observations_compression_route(self, mock_llm_get, mock_config, large_observations):
+    @patch("deerflowx.graphs.research.graph.nodes.tokens_evaluator.get_agent_tokenizer")
+    async def test_large_observations_compression_route(self, mock_tokenizer_get, mock_config, large_observations):
         """测试大型observations路由到压缩."""
 
         from unittest.mock import MagicMock
 
-        mock_llm = MagicMock()
-        mock_llm.get_num_tokens.return_value = 100000
-        mock_llm_get.return_value = mock_llm
+        mock_tokenizer = MagicMock()
+        mock_tokenizer.count_batch.return_value = [100000]
+        mock_tokenizer_get.return_value = mock_tokenizer
 
         state = {
             "observations": large_observations,
@@ -101,13 +101,13 @@ class TestTokenEstimator:
         assert "exceeds threshold" in result["decision_reason"]
 
     @pytest.mark.asyncio
-    @patch("deerflowx.graphs.research.graph.nodes.tokens_evaluator.get_llm_by_type")
-    async def test_empty_observations(self, mock_llm_get, mock_config):
+    @patch("deerflowx.graphs.research.graph.nodes.tokens_evaluator.get_agent_tokenizer")
+    async def test_empty_observations(self, mock_tokenizer_get, mock_config):
         """测试空observations的处理."""
         from unittest.mock import MagicMock
 
-        mock_llm = MagicMock()
-        mock_llm_get.return_value = mock_llm
+        mock_tokenizer = MagicMock()
+        mock_tokenizer_get.return_value = mock_tokenizer
 
         state = {
             "observations": [],
@@ -119,7 +119,7 @@ class TestTokenEstimator:
         assert result["estimated_tokens"] == 0
         assert "No observations" in result["decision_reason"]
 
-        mock_llm.get_num_tokens.assert_not_called()
+        mock_tokenizer.count_batch.assert_not_called()
 
 
 class TestSummarizer:
@@ -170,8 +170,9 @@ class TestSummarizer:
         mock_llm.return_value.ainvoke.assert_not_called()
 
     @pytest.mark.asyncio
+    @patch("deerflowx.graphs.research.graph.nodes.summarizer.get_agent_tokenizer")
     @patch("deerflowx.graphs.research.graph.nodes.summarizer.get_llm_by_type")
-    async def test_reduce_summaries_with_second_pass(self, mock_llm, mock_config, test_plan):
+    async def test_reduce_summaries_with_second_pass(self, mock_llm, mock_tokenizer_get, mock_config, test_plan):
         """测试进行二次压缩的摘要合并."""
 
         mock_response = AsyncMock()
@@ -181,8 +182,8 @@ class TestSummarizer:
 
         from unittest.mock import MagicMock
 
-        mock_llm_instance.get_num_tokens = MagicMock(return_value=80000)
         mock_llm.return_value = mock_llm_instance
+        mock_tokenizer_get.return_value = MagicMock(count=MagicMock(return_value=80000))
 
         long_summaries = ["很长的摘要内容 " * 100] * 3
 
@@ -196,7 +197,7 @@ class TestSummarizer:
         assert "summarized_observations" in result
         assert result["summarized_observations"] == "最终整合的摘要"
 
-        mock_llm_instance.get_num_tokens.assert_called_once()
+        mock_tokenizer_get.return_value.count.assert_called_once()
         mock_llm_instance.ainvoke.assert_called_once()
 
     @pytest.mark.asyncio
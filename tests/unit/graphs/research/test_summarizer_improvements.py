@@ -3,7 +3,6 @@
 from unittest.mock import MagicMock, patch
 
 import pytest
-from langchain_text_splitters import TokenTextSplitter
 
 from deerflowx.graphs.research.graph.nodes.summarizer import (
     split_text_into_chunks,
@@ -14,7 +13,7 @@ class TestSummarizerImprovements:
     """测试摘要器的改进功能."""
 
     def test_split_text_into_chunks_with_langchain_splitter(self):
-        """测试使用 LangChain TokenTextSplitter 的文本分块."""
+        """测试按 token 的文本分块."""
 
         text = "This is a test text. " * 100  # 重复文本以确保分块
         chunk_size = 50
@@ -45,13 +44,13 @@ class TestSummarizerImprovements:
         if len(chunks) == 1:
             assert chunks[0] == short_text
 
-    @patch("deerflowx.graphs.research.graph.nodes.summarizer.TokenTextSplitter")
-    def test_split_text_with_mocked_splitter(self, mock_splitter_class):
-        """测试使用模拟的 TokenTextSplitter."""
+    @patch("deerflowx.graphs.research.graph.nodes.summarizer.get_agent_tokenizer")
+    def test_split_text_with_mocked_tokenizer(self, mock_tokenizer_get):
+        """测试使用模拟的 Tokenizer."""
 
-        mock_splitter = MagicMock()
-        mock_splitter.split_text.return_value = ["chunk1", "chunk2", "chunk3"]
-        mock_splitter_class.return_value = mock_splitter
+        mock_tokenizer = MagicMock()
+        mock_tokenizer.split.return_value = ["chunk1", "chunk2", "chunk3"]
+        mock_tokenizer_get.return_value = mock_tokenizer
 
         text = "Test text for splitting"
         chunk_size = 100
@@ -59,17 +58,17 @@ class TestSummarizerImprovements:
 
         result = split_text_into_chunks(text, chunk_size, overlap)
 
-        mock_splitter_class.assert_called_once_with(chunk_size=chunk_size, chunk_overlap=overlap)
-        mock_splitter.split_text.assert_called_once_with(text)
+        mock_tokenizer_get.assert_called_once_with("researcher")
+        mock_tokenizer.split.assert_called_once_with(text, chunk_size, overlap)
         assert result == ["chunk1", "chunk2", "chunk3"]
 
-    @patch("deerflowx.graphs.research.graph.nodes.summarizer.TokenTextSplitter")
-    def test_split_text_fallback_for_empty_result(self, mock_splitter_class):
-        """测试当 TokenTextSplitter 返回空结果时的回退逻辑."""
+    @patch("deerflowx.graphs.research.graph.nodes.summarizer.get_agent_tokenizer")
+    def test_split_text_fallback_for_empty_result(self, mock_tokenizer_get):
+        """测试当 Tokenizer 返回空结果时的回退逻辑."""
 
-        mock_splitter = MagicMock()
-        mock_splitter.split_text.return_value = []
-        mock_splitter_class.return_value = mock_splitter
+        mock_tokenizer = MagicMock()
+        mock_tokenizer.split.return_value = []
+        mock_tokenizer_get.return_value = mock_tokenizer
 
         text = "Test text"
         result = split_text_into_chunks(text, 100, 20)
@@ -0,0 +1,107 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+import asyncio
+
+import pytest
+
+from deerflowx.libs.rag import Resource, ResourceCatalog, Retriever
+
+RESOURCES = [
+    Resource(uri="rag://dataset/1", title="Deployment Guide"),
+    Resource(uri="rag://dataset/2", title="Database tuning"),
+    Resource(uri="rag://dataset/3", title="Release notes"),
+]
+
+
+class FakeRetriever(Retriever):
+    def __init__(self, resources):
+        self.resources = resources
+        self.calls = 0
+        self.error = None
+        self.release = asyncio.Event()
+        self.release.set()
+
+    def list_resources(self, query=None):
+        raise NotImplementedError
+
+    def query_relevant_documents(self, query, resources=None):
+        raise NotImplementedError
+
+    async def alist_resources(self, query=None):
+        self.calls += 1
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return list(self.resources)
+
+
+def titles(resources):
+    return [resource.title for resource in resources]
+
+
+@pytest.mark.asyncio
+async def test_prefix_filtering():
+    catalog = ResourceCatalog(FakeRetriever(RESOURCES), ttl_seconds=60)
+
+    assert titles(await catalog.search()) == ["Deployment Guide", "Database tuning", "Release notes"]
+    assert titles(await catalog.search("d")) == ["Deployment Guide", "Database tuning"]
+    assert titles(await catalog.search("GUI")) == ["Deployment Guide"]
+    assert titles(await catalog.search("deployment  gu")) == ["Deployment Guide"]
+    assert titles(await catalog.search("uide")) == []
+    assert catalog.retriever.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_first_requests_share_one_fetch():
+    retriever = FakeRetriever(RESOURCES)
+    retriever.release.clear()
+    catalog = ResourceCatalog(retriever, ttl_seconds=60)
+
+    searches = [asyncio.create_task(catalog.search("re")) for _ in range(3)]
+    await asyncio.sleep(0)
+    retriever.release.set()
+
+    assert [titles(result) for result in await asyncio.gather(*searches)] == [["Release notes"]] * 3
+    assert retriever.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_catalog_is_served_while_revalidating():
+    retriever = FakeRetriever(RESOURCES)
+    catalog = ResourceCatalog(retriever, ttl_seconds=0)
+    await catalog.search()
+
+    retriever.resources = [*RESOURCES, Resource(uri="rag://dataset/4", title="Roadmap")]
+    retriever.release.clear()
+    assert titles(await catalog.search("ro")) == []
+
+    retriever.release.set()
+    await catalog._refresh
+    assert titles(await catalog.search("ro")) == ["Roadmap"]
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_stale_catalog():
+    retriever = FakeRetriever(RESOURCES)
+    catalog = ResourceCatalog(retriever, ttl_seconds=0)
+    await catalog.search()
+
+    retriever.error = ConnectionError("down")
+    await catalog.search()
+    await catalog._refresh
+
+    assert len(await catalog.search()) == 3
+
+
+@pytest.mark.asyncio
+async def test_failed_first_fetch_raises_and_is_retried():
+    retriever = FakeRetriever(RESOURCES)
+    retriever.error = ConnectionError("down")
+    catalog = ResourceCatalog(retriever, ttl_seconds=60)
+
+    with pytest.raises(ConnectionError):
+        await catalog.search()
+
+    retriever.error = None
+    assert len(await catalog.search()) == 3
@@ -0,0 +1,152 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+import threading
+
+import pytest
+
+from deerflowx.libs.rag import Chunk, Document, HybridRetriever, Resource, Retriever
+from deerflowx.libs.rag.builder import build_retriever
+from deerflowx.libs.rag.hybrid import dedup_chunks, fuse_documents, simhash, tag_resource, untag_resource
+
+PASSAGE = "Deploy the server with docker compose and mount the data directory as a volume for the database."
+
+
+class FakeProvider(Retriever):
+    def __init__(self, documents=None, resources=None, error=None, barrier=None):
+        self.documents = documents or []
+        self.resources = resources or []
+        self.error = error
+        self.barrier = barrier
+        self.queries = []
+
+    def list_resources(self, query=None):
+        return self.resources
+
+    def query_relevant_documents(self, query, resources=None):
+        self.queries.append(resources)
+        if self.barrier is not None:
+            # Both providers must be running at once to pass the barrier
+            self.barrier.wait(timeout=5)
+        if self.error is not None:
+            raise self.error
+        return self.documents
+
+
+def test_simhash_near_duplicates():
+    assert (simhash(PASSAGE) ^ simhash(f"  {PASSAGE.upper()}\n")).bit_count() == 0
+    assert (simhash(PASSAGE) ^ simhash(PASSAGE.replace("database", "databases"))).bit_count() <= 20
+    assert (simhash(PASSAGE) ^ simhash("Tune the connection pool of the database server.")).bit_count() > 3
+
+
+def test_dedup_chunks():
+    documents = [
+        Document("a", chunks=[Chunk(PASSAGE, 0.9), Chunk("Other text about the scheduler.", 0.5)]),
+        Document("b", chunks=[Chunk(PASSAGE.lower(), 0.8)]),
+    ]
+
+    deduped = dedup_chunks(documents)
+
+    assert [doc.id for doc in deduped] == ["a"]
+    assert [chunk.content for chunk in deduped[0].chunks] == [PASSAGE, "Other text about the scheduler."]
+
+
+def test_fuse_documents():
+    fused = fuse_documents(
+        {
+            "ragflow": [Document("r1", url="https://docs.example.com/a"), Document("r2")],
+            "local": [Document("l1"), Document("l2", url="https://www.docs.example.com/a/", chunks=[Chunk("x", 1)])],
+        }
+    )
+
+    # The document both providers returned ranks first and pools their chunks
+    assert [doc.id for doc in fused] == ["r1", "l1", "r2"]
+    assert [chunk.content for chunk in fused[0].chunks] == ["x"]
+
+
+def test_resource_tags_round_trip():
+    resource = Resource(uri="rag://dataset/abc#doc", title="abc")
+
+    tagged = tag_resource(resource, "local")
+
+    assert tagged.uri == "rag://dataset/abc?provider=local#doc"
+    assert untag_resource(tagged) == ("local", resource)
+
+
+def test_list_resources_are_tagged():
+    retriever = HybridRetriever(
+        {
+            "ragflow": FakeProvider(resources=[Resource(uri="rag://dataset/1", title="one")]),
+            "local": FakeProvider(resources=[Resource(uri="rag://dataset/1", title="local one")]),
+        }
+    )
+
+    assert [resource.uri for resource in retriever.list_resources()] == [
+        "rag://dataset/1?provider=ragflow",
+        "rag://dataset/1?provider=local",
+    ]
+
+
+def test_query_routes_resources_and_runs_concurrently():
+    barrier = threading.Barrier(2)
+    ragflow = FakeProvider([Document("r", chunks=[Chunk(PASSAGE, 0.9)])], barrier=barrier)
+    local = FakeProvider([Document("l", chunks=[Chunk(PASSAGE, 0.7), Chunk("Local only.", 0.6)])], barrier=barrier)
+    retriever = HybridRetriever({"ragflow": ragflow, "local": local})
+    resources = [
+        Resource(uri="rag://dataset/1?provider=ragflow", title="one"),
+        Resource(uri="rag://dataset/2?provider=local", title="two"),
+    ]
+
+    documents = retriever.query_relevant_documents("docker", resources)
+
+    assert [resource.uri for resource in ragflow.queries[0]] == ["rag://dataset/1"]
+    assert [resource.uri for resource in local.queries[0]] == ["rag://dataset/2"]
+    assert [(doc.id, [chunk.content for chunk in doc.chunks]) for doc in documents] == [
+        ("r", [PASSAGE]),
+        ("l", ["Local only."]),
+    ]
+
+
+def test_unselected_providers_are_not_queried():
+    ragflow, local = FakeProvider(), FakeProvider()
+    retriever = HybridRetriever({"ragflow": ragflow, "local": local})
+
+    retriever.query_relevant_documents("docker", [Resource(uri="rag://dataset/2?provider=local", title="two")])
+
+    assert ragflow.queries == []
+    assert len(local.queries) == 1
+
+
+@pytest.mark.asyncio
+async def test_failing_provider_is_skipped():
+    retriever = HybridRetriever(
+        {
+            "ragflow": FakeProvider(error=ConnectionError("down")),
+            "local": FakeProvider([Document("l", chunks=[Chunk("Local only.", 0.6)])]),
+        }
+    )
+
+    assert [doc.id for doc in await retriever.aquery_relevant_documents("docker")] == ["l"]
+
+
+def test_all_providers_failing_raises():
+    retriever = HybridRetriever({"ragflow": FakeProvider(error=ConnectionError("down"))})
+
+    with pytest.raises(ConnectionError):
+        retriever.query_relevant_documents("docker")
+
+
+def test_build_hybrid_retriever(monkeypatch):
+    monkeypatch.setattr("deerflowx.libs.rag.builder.SELECTED_RAG_PROVIDER", "hybrid")
+    monkeypatch.setattr("deerflowx.libs.rag.builder.settings.hybrid_rag.providers", "ragflow, vikingdb_knowledge_base")
+    monkeypatch.setattr("deerflowx.libs.rag.builder.RAGFlowProvider", FakeProvider)
+    monkeypatch.setattr("deerflowx.libs.rag.builder.VikingDBKnowledgeBaseProvider", FakeProvider)
+
+    retriever = build_retriever()
+
+    assert isinstance(retriever, HybridRetriever)
+    assert list(retriever.providers) == ["ragflow", "vikingdb_knowledge_base"]
+
+    monkeypatch.setattr("deerflowx.libs.rag.builder.settings.hybrid_rag.providers", "ragflow,hybrid")
+    with pytest.raises(ValueError, match="Unsupported RAG provider: hybrid"):
+        build_retriever()
@@ -0,0 +1,106 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+import numpy as np
+import pytest
+
+from deerflowx.libs.rag.ingest import document_id, ingest_local_documents, parse_file
+from deerflowx.libs.rag.local_index import LocalIndex
+
+
+def embed(texts: list[str]) -> np.ndarray:
+    embed.calls.append(list(texts))
+    return np.array([[t.count("docker") + 0.1, t.count("pool") + 0.1] for t in texts], dtype=np.float32)
+
+
+@pytest.fixture
+def source(tmp_path):
+    source = tmp_path / "docs"
+    (source / "guides").mkdir(parents=True)
+    (source / "guides" / "deploy.md").write_text("# Deployment\n\nDeploy the server with docker compose.\n")
+    (source / "guides" / "tuning.md").write_text("# Tuning\n\nTune the database connection pool.\n")
+    (source / "readme.txt").write_text("Project overview and docker tips.\n")
+    (source / "image.png").write_bytes(b"\x89PNG")
+    return source
+
+
+@pytest.fixture
+def embedder(monkeypatch):
+    embed.calls = []
+    monkeypatch.setattr("deerflowx.libs.rag.ingest.litellm_embedder", lambda _model: embed)
+    return embed
+
+
+def test_parse_file(tmp_path):
+    path = tmp_path / "notes.md"
+    path.write_text("# Notes\n\nDocker docker compose.\n")
+
+    parsed = parse_file(path)
+
+    assert parsed.title == "Notes"
+    assert parsed.chunks == ["# Notes\n\nDocker docker compose."]
+    assert parsed.chunk_terms == [{"notes": 1, "docker": 2, "compose": 1}]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_ingest(source, tmp_path, workers):
+    stats = ingest_local_documents(source, tmp_path / "index", workers=workers)
+
+    assert (stats.files, stats.parsed, stats.reused, stats.failed, stats.chunks) == (3, 3, 0, 0, 3)
+    index = LocalIndex.load(tmp_path / "index")
+    assert [dataset.dataset_id for dataset in index.datasets] == ["default", "guides"]
+    assert {hit.document.title for hit in index.search("docker", top_k=10)} == {"Deployment", "readme"}
+
+
+def test_incremental_reindex(source, tmp_path):
+    index_path = tmp_path / "index"
+    ingest_local_documents(source, index_path)
+    version = (index_path / "meta.json").stat().st_mtime_ns
+
+    stats = ingest_local_documents(source, index_path)
+    assert (stats.parsed, stats.reused) == (0, 3)
+    assert (index_path / "meta.json").stat().st_mtime_ns == version
+
+    (source / "guides" / "tuning.md").write_text("# Tuning\n\nTune the kubernetes scheduler.\n")
+    (source / "readme.txt").unlink()
+    stats = ingest_local_documents(source, index_path)
+
+    assert (stats.parsed, stats.reused, stats.removed) == (1, 1, 1)
+    index = LocalIndex.load(index_path)
+    assert [hit.document.title for hit in index.search("docker", top_k=10)] == ["Deployment"]
+    assert [hit.document.doc_id for hit in index.search("kubernetes", top_k=10)] == [
+        document_id("guides", "guides/tuning.md")
+    ]
+    # Term frequencies of the unchanged document survive the round trip through the postings
+    assert index.search("compose", top_k=10)[0].document.title == "Deployment"
+
+
+def test_incremental_reindex_embeds_only_changed_chunks(source, tmp_path, embedder):
+    index_path = tmp_path / "index"
+    ingest_local_documents(source, index_path, embedding_model="test")
+    assert len(embedder.calls[0]) == 3
+
+    (source / "guides" / "tuning.md").write_text("# Tuning\n\nTune the database connection pool size.\n")
+    ingest_local_documents(source, index_path, embedding_model="test")
+
+    assert embedder.calls[1] == ["# Tuning\n\nTune the database connection pool size."]
+    index = LocalIndex.load(index_path)
+    hits = index.search("pool", top_k=1, query_vector=np.array([0.0, 1.0]), dense_weight=1.0)
+    assert hits[0].document.title == "Tuning"
+
+
+def test_changed_embedding_model_reindexes_everything(source, tmp_path, embedder):
+    ingest_local_documents(source, tmp_path / "index")
+
+    stats = ingest_local_documents(source, tmp_path / "index", embedding_model="test")
+
+    assert (stats.parsed, stats.reused) == (3, 0)
+    assert LocalIndex.load(tmp_path / "index").has_vectors
+
+
+def test_failed_files_are_skipped(source, tmp_path):
+    (source / "paper.pdf").write_bytes(b"not a pdf")
+
+    stats = ingest_local_documents(source, tmp_path / "index")
+
+    assert (stats.files, stats.parsed, stats.failed) == (4, 3, 1)
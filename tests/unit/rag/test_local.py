@@ -0,0 +1,124 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+import shutil
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from deerflowx.libs.rag import Resource
+from deerflowx.libs.rag.ingest import build_local_index, document_id
+from deerflowx.libs.rag.local import LocalIndexProvider
+from deerflowx.libs.rag.local_index import LocalIndex
+
+
+@pytest.fixture
+def index_path(tmp_path, monkeypatch):
+    source = tmp_path / "docs"
+    (source / "guides").mkdir(parents=True)
+    (source / "guides" / "deploy.md").write_text("# Deployment\n\nDeploy the server with docker compose.\n")
+    (source / "guides" / "tuning.md").write_text("# Tuning\n\nTune the database connection pool.\n")
+    (source / "readme.txt").write_text("Project overview and docker tips.\n")
+    (source / "image.png").write_bytes(b"\x89PNG")
+    index_path = tmp_path / "index"
+    build_local_index(source, index_path)
+    monkeypatch.setenv("LOCAL_RAG_INDEX_PATH", str(index_path))
+    return index_path
+
+
+def test_init_requires_index(tmp_path, monkeypatch):
+    monkeypatch.delenv("LOCAL_RAG_INDEX_PATH", raising=False)
+    with pytest.raises(ValueError, match="LOCAL_RAG_INDEX_PATH is not set"):
+        LocalIndexProvider()
+    monkeypatch.setenv("LOCAL_RAG_INDEX_PATH", str(tmp_path / "missing"))
+    with pytest.raises(ValueError, match="No local RAG index"):
+        LocalIndexProvider()
+
+
+def test_list_resources(index_path):
+    provider = LocalIndexProvider()
+
+    assert [resource.uri for resource in provider.list_resources()] == ["rag://dataset/default", "rag://dataset/guides"]
+    assert [resource.title for resource in provider.list_resources("GUI")] == ["guides"]
+
+
+def test_query_relevant_documents(index_path):
+    provider = LocalIndexProvider()
+
+    docs = provider.query_relevant_documents("docker", [Resource(uri="rag://dataset/guides", title="guides")])
+
+    assert [doc.title for doc in docs] == ["Deployment"]
+    assert docs[0].id == document_id("guides", "guides/deploy.md")
+    assert "docker compose" in docs[0].chunks[0].content
+
+
+def test_query_single_document(index_path):
+    provider = LocalIndexProvider()
+    doc_id = document_id("guides", "guides/tuning.md")
+
+    docs = provider.query_relevant_documents("the", [Resource(uri=f"rag://dataset/guides#{doc_id}", title="tuning")])
+
+    assert [doc.id for doc in docs] == [doc_id]
+
+
+@pytest.mark.asyncio
+async def test_aquery_relevant_documents_searches_all_datasets(index_path):
+    docs = await LocalIndexProvider().aquery_relevant_documents("docker")
+
+    assert {doc.title for doc in docs} == {"Deployment", "readme"}
+
+
+@pytest.mark.asyncio
+async def test_async_queries_load_the_index_off_the_event_loop(index_path):
+    loaded_in = []
+    load = LocalIndex.load
+
+    def recording_load(path):
+        loaded_in.append(threading.current_thread())
+        return load(path)
+
+    provider = LocalIndexProvider()
+    with patch("deerflowx.libs.rag.local.LocalIndex.load", side_effect=recording_load):
+        await provider.alist_resources()
+        await provider.aquery_relevant_documents("docker")
+
+    assert len(loaded_in) == 1
+    assert loaded_in[0] is not threading.main_thread()
+
+
+def test_rebuilt_index_is_reloaded(index_path, tmp_path):
+    provider = LocalIndexProvider()
+    assert provider.query_relevant_documents("kubernetes") == []
+
+    (tmp_path / "docs" / "k8s.md").write_text("# K8s\n\nRun it on kubernetes.\n")
+    build_local_index(tmp_path / "docs", index_path)
+
+    assert [doc.title for doc in provider.query_relevant_documents("kubernetes")] == ["K8s"]
+
+
+def test_queries_during_a_reingest_always_find_an_index(index_path, tmp_path):
+    provider = LocalIndexProvider()
+    found = []
+
+    def querying_after(change):
+        def wrapper(*args, **kwargs):
+            result = change(*args, **kwargs)
+            # Query between every step of swapping in the rebuilt index
+            found.append(len(provider.query_relevant_documents("docker")))
+            return result
+
+        return wrapper
+
+    with (
+        patch.object(Path, "rename", querying_after(Path.rename)),
+        patch.object(Path, "replace", querying_after(Path.replace)),
+        patch.object(shutil, "rmtree", querying_after(shutil.rmtree)),
+    ):
+        for i in range(3):
+            (tmp_path / "docs" / f"note-{i}.md").write_text(f"# Note {i}\n\nMore docker notes.\n")
+            build_local_index(tmp_path / "docs", index_path)
+
+    assert found
+    assert all(found)
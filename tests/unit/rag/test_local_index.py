@@ -0,0 +1,107 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+import numpy as np
+import pytest
+
+from deerflowx.libs.rag.local_index import LocalDataset, LocalDocument, LocalIndex
+
+DATASETS = [LocalDataset("guides", "Guides"), LocalDataset("notes", "Notes")]
+DOCUMENTS = [
+    LocalDocument(
+        "deploy",
+        "guides",
+        "Deployment",
+        chunks=["Deploy the server with docker compose.", "Configure the reverse proxy for the server."],
+    ),
+    LocalDocument("tuning", "guides", "Tuning", chunks=["Tune the database connection pool size."]),
+    LocalDocument("meeting", "notes", "Meeting", chunks=["We discussed the docker image size and the roadmap."]),
+    LocalDocument("empty", "notes", "Empty", chunks=[]),
+]
+
+
+def embed(texts: list[str]) -> np.ndarray:
+    # Two-dimensional "topics": containers and databases
+    return np.array([[t.count("docker") + 0.1, t.count("database") + 0.1] for t in texts], dtype=np.float32)
+
+
+@pytest.fixture(params=["memory", "disk"])
+def index(request, tmp_path):
+    index = LocalIndex.build(DATASETS, DOCUMENTS)
+    if request.param == "disk":
+        index.save(tmp_path / "index")
+        index = LocalIndex.load(tmp_path / "index")
+    return index
+
+
+def test_bm25_ranking(index):
+    hits = index.search("docker server", top_k=10)
+
+    # The chunk with both terms wins; longer chunks with one term rank lower
+    assert hits[0].content == "Deploy the server with docker compose."
+    assert sorted(hit.document.doc_id for hit in hits[1:]) == ["deploy", "meeting"]
+    assert hits[0].score > hits[1].score >= hits[2].score > 0
+
+
+def test_top_k(index):
+    assert len(index.search("the", top_k=2)) == 2
+
+
+def test_unknown_terms_match_nothing(index):
+    assert index.search("kubernetes", top_k=10) == []
+
+
+def test_dataset_and_document_filters(index):
+    assert {hit.document.doc_id for hit in index.search("docker", top_k=10, dataset_ids=["notes"])} == {"meeting"}
+    assert {hit.document.doc_id for hit in index.search("the", top_k=10, doc_ids=["tuning"])} == {"tuning"}
+    assert index.search("docker", top_k=10, dataset_ids=["missing"]) == []
+
+
+def test_empty_documents_are_skipped(index):
+    assert "empty" not in {document.doc_id for document in index.documents}
+
+
+def test_dense_vectors_blend_with_bm25(tmp_path):
+    LocalIndex.build(DATASETS, DOCUMENTS, embedder=embed, embedding_model="test").save(tmp_path / "index")
+    index = LocalIndex.load(tmp_path / "index")
+
+    assert index.has_vectors
+    assert index.embedding_model == "test"
+    # No lexical match, but the query vector points at the database chunk
+    hits = index.search("connections", top_k=1, query_vector=np.array([0.0, 1.0]), dense_weight=1.0)
+    assert hits[0].document.doc_id == "tuning"
+
+
+def test_save_replaces_existing_index(tmp_path):
+    LocalIndex.build(DATASETS, DOCUMENTS).save(tmp_path / "index")
+    LocalIndex.build(DATASETS, DOCUMENTS[1:2]).save(tmp_path / "index")
+
+    index = LocalIndex.load(tmp_path / "index")
+    assert [document.doc_id for document in index.documents] == ["tuning"]
+    assert (tmp_path / "index").is_symlink()
+
+
+def test_save_keeps_only_the_current_and_previous_versions(tmp_path):
+    for _ in range(4):
+        LocalIndex.build(DATASETS, DOCUMENTS).save(tmp_path / "index")
+    current = (tmp_path / "index").resolve()
+
+    versions = sorted(path for path in tmp_path.iterdir() if path.name != "index")
+    assert len(versions) == 2
+    assert current in versions
+
+
+def test_save_replaces_an_index_saved_as_a_directory(tmp_path):
+    LocalIndex.build(DATASETS, DOCUMENTS).save(tmp_path / "index")
+    legacy = (tmp_path / "index").resolve()
+    (tmp_path / "index").unlink()
+    legacy.rename(tmp_path / "index")
+
+    LocalIndex.build(DATASETS, DOCUMENTS[1:2]).save(tmp_path / "index")
+
+    assert [document.doc_id for document in LocalIndex.load(tmp_path / "index").documents] == ["tuning"]
+
+
+def test_empty_index(tmp_path):
+    LocalIndex.build(DATASETS, []).save(tmp_path / "index")
+    assert LocalIndex.load(tmp_path / "index").search("docker", top_k=5) == []
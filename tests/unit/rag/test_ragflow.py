@@ -1,8 +1,10 @@
 # Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
 # SPDX-License-Identifier: MIT
 
+import json
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 
 from deerflowx.libs.rag.ragflow import RAGFlowProvider, parse_uri
@@ -80,8 +82,9 @@ def test_init_missing_env(monkeypatch):
         RAGFlowProvider()
 
 
-@patch("deerflowx.libs.rag.ragflow.requests.post")
-def test_query_relevant_documents_success(mock_post, monkeypatch):
+@patch("deerflowx.libs.rag.ragflow.get_rag_session")
+def test_query_relevant_documents_success(mock_session, monkeypatch):
+    mock_post = mock_session.return_value.post
     monkeypatch.setenv("RAGFLOW_API_URL", "http://api")
     monkeypatch.setenv("RAGFLOW_API_KEY", "key")
     provider = RAGFlowProvider()
@@ -104,8 +107,9 @@ def test_query_relevant_documents_success(mock_post, monkeypatch):
     assert docs[0].chunks[0].similarity == 0.9
 
 
-@patch("deerflowx.libs.rag.ragflow.requests.post")
-def test_query_relevant_documents_error(mock_post, monkeypatch):
+@patch("deerflowx.libs.rag.ragflow.get_rag_session")
+def test_query_relevant_documents_error(mock_session, monkeypatch):
+    mock_post = mock_session.return_value.post
     monkeypatch.setenv("RAGFLOW_API_URL", "http://api")
     monkeypatch.setenv("RAGFLOW_API_KEY", "key")
     provider = RAGFlowProvider()
@@ -117,8 +121,9 @@ def test_query_relevant_documents_error(mock_post, monkeypatch):
         provider.query_relevant_documents("query", [])
 
 
-@patch("deerflowx.libs.rag.ragflow.requests.get")
-def test_list_resources_success(mock_get, monkeypatch):
+@patch("deerflowx.libs.rag.ragflow.get_rag_session")
+def test_list_resources_success(mock_session, monkeypatch):
+    mock_get = mock_session.return_value.get
     monkeypatch.setenv("RAGFLOW_API_URL", "http://api")
     monkeypatch.setenv("RAGFLOW_API_KEY", "key")
     provider = RAGFlowProvider()
@@ -141,8 +146,9 @@ def test_list_resources_success(mock_get, monkeypatch):
     assert resources[1].description == "desc2"
 
 
-@patch("deerflowx.libs.rag.ragflow.requests.get")
-def test_list_resources_success(mock_get, monkeypatch):
+@patch("deerflowx.libs.rag.ragflow.get_rag_session")
+def test_list_resources_success(mock_session, monkeypatch):
+    mock_get = mock_session.return_value.get
     monkeypatch.setenv("RAGFLOW_API_URL", "http://api")
     monkeypatch.setenv("RAGFLOW_API_KEY", "key")
     provider = RAGFlowProvider()
@@ -165,8 +171,9 @@ def test_list_resources_success(mock_get, monkeypatch):
     assert resources[1].description == "desc2"
 
 
-@patch("deerflowx.libs.rag.ragflow.requests.get")
-def test_list_resources_error(mock_get, monkeypatch):
+@patch("deerflowx.libs.rag.ragflow.get_rag_session")
+def test_list_resources_error(mock_session, monkeypatch):
+    mock_get = mock_session.return_value.get
     monkeypatch.setenv("RAGFLOW_API_URL", "http://api")
     monkeypatch.setenv("RAGFLOW_API_KEY", "key")
     provider = RAGFlowProvider()
@@ -176,3 +183,55 @@ def test_list_resources_error(mock_get, monkeypatch):
     mock_get.return_value = mock_response
     with pytest.raises(Exception):
         provider.list_resources()
+
+
+@pytest.fixture
+def async_client():
+    requests_seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(request)
+        if request.url.path == "/api/v1/retrieval":
+            return httpx.Response(
+                200,
+                json={
+                    "data": {
+                        "doc_aggs": [{"doc_id": "doc456", "doc_name": "Doc Title"}],
+                        "chunks": [{"document_id": "doc456", "content": "chunk text", "similarity": 0.9}],
+                    }
+                },
+            )
+        if request.url.params.get("name") == "broken":
+            return httpx.Response(500, text="error")
+        return httpx.Response(200, json={"data": [{"id": "123", "name": "Dataset", "description": "desc"}]})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    with patch("deerflowx.libs.rag.ragflow.get_rag_async_client", return_value=client):
+        yield requests_seen
+
+
+@pytest.mark.asyncio
+async def test_aquery_relevant_documents(async_client, monkeypatch):
+    monkeypatch.setenv("RAGFLOW_API_URL", "http://api")
+    monkeypatch.setenv("RAGFLOW_API_KEY", "key")
+    provider = RAGFlowProvider()
+
+    docs = await provider.aquery_relevant_documents("query", [DummyResource("rag://dataset/123#doc456")])
+
+    assert [doc.id for doc in docs] == ["doc456"]
+    assert docs[0].chunks[0].content == "chunk text"
+    assert async_client[0].headers["Authorization"] == "Bearer key"
+    assert json.loads(async_client[0].content)["dataset_ids"] == ["123"]
+
+
+@pytest.mark.asyncio
+async def test_alist_resources(async_client, monkeypatch):
+    monkeypatch.setenv("RAGFLOW_API_URL", "http://api")
+    monkeypatch.setenv("RAGFLOW_API_KEY", "key")
+    provider = RAGFlowProvider()
+
+    resources = await provider.alist_resources()
+    assert resources[0].uri == "rag://dataset/123"
+
+    with pytest.raises(RuntimeError, match="Failed to list resources"):
+        await provider.alist_resources("broken")
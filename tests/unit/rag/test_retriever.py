@@ -69,3 +69,19 @@ def test_retriever_abstract_methods():
 def test_retriever_cannot_instantiate():
     with pytest.raises(TypeError):
         Retriever()
+
+
+@pytest.mark.asyncio
+async def test_retriever_async_methods_default_to_sync_implementation():
+    class DummyRetriever(Retriever):
+        def list_resources(self, query=None):
+            return [Resource(uri="uri", title=query or "title", description="")]
+
+        def query_relevant_documents(self, query, resources=None):
+            return [Document(doc_id=query, chunks=[])]
+
+    retriever = DummyRetriever()
+    resources = await retriever.alist_resources("async")
+    assert resources[0].title == "async"
+    docs = await retriever.aquery_relevant_documents("query", resources)
+    assert docs[0].id == "query"
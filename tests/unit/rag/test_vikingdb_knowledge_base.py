@@ -1,10 +1,12 @@
 # Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
 # SPDX-License-Identifier: MIT
 
+import asyncio
 import json
 import os
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 
 from deerflowx.libs.rag.vikingdb_knowledge_base import VikingDBKnowledgeBaseProvider, parse_uri
@@ -224,7 +226,7 @@ class TestVikingDBKnowledgeBaseProviderQueryRelevantDocuments:
         result = provider.query_relevant_documents("test query", [])
         assert result == []
 
-    @patch("deerflowx.libs.rag.vikingdb_knowledge_base.requests.request")
+    @patch("deerflowx.libs.rag.http_client.requests.Session.request")
     def test_query_relevant_documents_success(self, mock_request, provider):
         """Test successful document query"""
         # Mock response
@@ -267,7 +269,7 @@ class TestVikingDBKnowledgeBaseProviderQueryRelevantDocuments:
             assert result[0].chunks[0].content == "Test content"
             assert result[0].chunks[0].similarity == 0.95
 
-    @patch("deerflowx.libs.rag.vikingdb_knowledge_base.requests.request")
+    @patch("deerflowx.libs.rag.http_client.requests.Session.request")
     def test_query_relevant_documents_with_document_filter(self, mock_request, provider):
         """Test document query with document ID filter"""
         mock_response = MagicMock()
@@ -292,7 +294,7 @@ class TestVikingDBKnowledgeBaseProviderQueryRelevantDocuments:
             assert doc_filter["field"] == "doc_id"
             assert doc_filter["conds"] == ["doc456"]
 
-    @patch("deerflowx.libs.rag.vikingdb_knowledge_base.requests.request")
+    @patch("deerflowx.libs.rag.http_client.requests.Session.request")
     def test_query_relevant_documents_api_error(self, mock_request, provider):
         """Test handling of API error response"""
         mock_response = MagicMock()
@@ -304,7 +306,7 @@ class TestVikingDBKnowledgeBaseProviderQueryRelevantDocuments:
             with pytest.raises(ValueError, match="Failed to query documents from resource: API Error"):
                 provider.query_relevant_documents("test query", resources)
 
-    @patch("deerflowx.libs.rag.vikingdb_knowledge_base.requests.request")
+    @patch("deerflowx.libs.rag.http_client.requests.Session.request")
     def test_query_relevant_documents_json_decode_error(self, mock_request, provider):
         """Test handling of JSON decode error"""
         mock_response = MagicMock()
@@ -316,7 +318,7 @@ class TestVikingDBKnowledgeBaseProviderQueryRelevantDocuments:
             with pytest.raises(ValueError, match="Failed to parse JSON response"):
                 provider.query_relevant_documents("test query", resources)
 
-    @patch("deerflowx.libs.rag.vikingdb_knowledge_base.requests.request")
+    @patch("deerflowx.libs.rag.http_client.requests.Session.request")
     def test_query_relevant_documents_multiple_resources(self, mock_request, provider):
         """Test querying multiple resources and merging results"""
         # Mock responses for different resources
@@ -387,7 +389,7 @@ class TestVikingDBKnowledgeBaseProviderListResources:
     def provider(self, env_vars):
         return VikingDBKnowledgeBaseProvider()
 
-    @patch("deerflowx.libs.rag.vikingdb_knowledge_base.requests.request")
+    @patch("deerflowx.libs.rag.http_client.requests.Session.request")
     def test_list_resources_success(self, mock_request, provider):
         """Test successful resource listing"""
         mock_response = MagicMock()
@@ -426,7 +428,7 @@ class TestVikingDBKnowledgeBaseProviderListResources:
             assert result[1].title == "Dataset 2"
             assert result[1].description == "Description 2"
 
-    @patch("deerflowx.libs.rag.vikingdb_knowledge_base.requests.request")
+    @patch("deerflowx.libs.rag.http_client.requests.Session.request")
     def test_list_resources_with_query_filter(self, mock_request, provider):
         """Test resource listing with query filter"""
         mock_response = MagicMock()
@@ -458,7 +460,7 @@ class TestVikingDBKnowledgeBaseProviderListResources:
             assert len(result) == 1
             assert result[0].title == "Test Dataset"
 
-    @patch("deerflowx.libs.rag.vikingdb_knowledge_base.requests.request")
+    @patch("deerflowx.libs.rag.http_client.requests.Session.request")
     def test_list_resources_api_error(self, mock_request, provider):
         """Test handling of API error in list_resources"""
         mock_response = MagicMock()
@@ -469,7 +471,7 @@ class TestVikingDBKnowledgeBaseProviderListResources:
             with pytest.raises(Exception, match="Failed to list resources: API Error"):
                 provider.list_resources()
 
-    @patch("deerflowx.libs.rag.vikingdb_knowledge_base.requests.request")
+    @patch("deerflowx.libs.rag.http_client.requests.Session.request")
     def test_list_resources_json_decode_error(self, mock_request, provider):
         """Test handling of JSON decode error in list_resources"""
         mock_response = MagicMock()
@@ -480,7 +482,7 @@ class TestVikingDBKnowledgeBaseProviderListResources:
             with pytest.raises(ValueError, match="Failed to parse JSON response"):
                 provider.list_resources()
 
-    @patch("deerflowx.libs.rag.vikingdb_knowledge_base.requests.request")
+    @patch("deerflowx.libs.rag.http_client.requests.Session.request")
     def test_list_resources_empty_response(self, mock_request, provider):
         """Test handling of empty response"""
         mock_response = MagicMock()
@@ -490,3 +492,113 @@ class TestVikingDBKnowledgeBaseProviderListResources:
         with patch.object(provider, "prepare_request"):
             result = provider.list_resources()
             assert result == []
+
+
+class TestVikingDBKnowledgeBaseProviderAsync:
+    @pytest.fixture
+    def provider(self, env_vars):
+        return VikingDBKnowledgeBaseProvider()
+
+    @pytest.fixture
+    def async_client(self):
+        requests_seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests_seen.append(request)
+            if request.url.path == "/api/knowledge/collection/list":
+                data = {"collection_list": [{"resource_id": "123", "collection_name": "Dataset", "description": ""}]}
+                return httpx.Response(200, json={"code": 0, "data": data})
+            resource_id = json.loads(request.content)["resource_id"]
+            item = {"doc_info": {"doc_id": f"doc{resource_id}", "doc_name": "Doc"}, "content": "text", "score": 0.5}
+            return httpx.Response(200, json={"code": 0, "data": {"result_list": [item]}})
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with patch("deerflowx.libs.rag.vikingdb_knowledge_base.get_rag_async_client", return_value=client):
+            yield requests_seen
+
+    @pytest.mark.asyncio
+    async def test_aquery_relevant_documents(self, provider, async_client):
+        resources = [MockResource("rag://dataset/1"), MockResource("rag://dataset/2")]
+
+        result = await provider.aquery_relevant_documents("test query", resources)
+
+        assert sorted(doc.id for doc in result) == ["doc1", "doc2"]
+        assert all(request.url.host == "api-test.example.com" for request in async_client)
+        assert "Authorization" in async_client[0].headers
+
+    @pytest.mark.asyncio
+    async def test_aquery_relevant_documents_empty_resources(self, provider, async_client):
+        assert await provider.aquery_relevant_documents("test query", []) == []
+        assert async_client == []
+
+    @pytest.mark.asyncio
+    async def test_alist_resources(self, provider, async_client):
+        result = await provider.alist_resources("data")
+
+        assert [resource.uri for resource in result] == ["rag://dataset/123"]
+
+    @pytest.mark.asyncio
+    async def test_aquery_relevant_documents_raises_the_failed_search_error(self, provider):
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if json.loads(request.content)["resource_id"] == "2":
+                raise httpx.ConnectError("refused")
+            await asyncio.sleep(0.02)
+            return httpx.Response(200, json={"code": 0, "data": {"result_list": []}})
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        resources = [MockResource(f"rag://dataset/{i}") for i in range(1, 4)]
+        with (
+            patch("deerflowx.libs.rag.vikingdb_knowledge_base.get_rag_async_client", return_value=client),
+            pytest.raises(httpx.ConnectError, match="refused"),
+        ):
+            await provider.aquery_relevant_documents("test query", resources)
+
+    @pytest.mark.asyncio
+    async def test_aquery_relevant_documents_is_concurrent_and_bounded(self, provider):
+        provider.max_concurrency = 2
+        in_flight = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.02)
+            in_flight -= 1
+            resource_id = json.loads(request.content)["resource_id"]
+            score = int(resource_id) / 10
+            item = {"doc_info": {"doc_id": f"doc{resource_id}", "doc_name": "Doc"}, "content": "text", "score": score}
+            return httpx.Response(200, json={"code": 0, "data": {"result_list": [item]}})
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        resources = [MockResource(f"rag://dataset/{i}") for i in range(1, 6)]
+        with patch("deerflowx.libs.rag.vikingdb_knowledge_base.get_rag_async_client", return_value=client):
+            result = await provider.aquery_relevant_documents("test query", resources)
+
+        assert peak == 2
+        # Documents of all resources are ranked by score
+        assert [doc.id for doc in result] == ["doc5", "doc4", "doc3", "doc2", "doc1"]
+
+
+class TestVikingDBKnowledgeBaseProviderRanking:
+    @pytest.fixture
+    def provider(self, env_vars):
+        return VikingDBKnowledgeBaseProvider()
+
+    def test_merged_results_are_sorted_by_score(self, provider):
+        def response(*items):
+            result_list = [
+                {"doc_info": {"doc_id": doc_id, "doc_name": doc_id}, "content": content, "score": score}
+                for doc_id, content, score in items
+            ]
+            return json.dumps({"code": 0, "data": {"result_list": result_list}})
+
+        result = provider._merge_search_responses(
+            [
+                response(("doc1", "low", 0.2)),
+                response(("doc2", "mid", 0.5), ("doc1", "high", 0.9)),
+            ]
+        )
+
+        assert [doc.id for doc in result] == ["doc1", "doc2"]
+        assert [chunk.content for chunk in result[0].chunks] == ["high", "low"]
@@ -1,7 +1,7 @@
 # Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
 # SPDX-License-Identifier: MIT
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi import HTTPException
@@ -10,6 +10,7 @@ from langchain_core.messages import AIMessageChunk, ToolMessage
 from langgraph.types import Command
 
 from deerflowx.config.report_style import ReportStyle
+from deerflowx.libs.rag import Resource
 from deerflowx.server.app import _make_event, app
 
 
@@ -151,24 +152,30 @@ class TestRAGEndpoints:
         assert response.status_code == 200
         assert response.json()["provider"] == "test_provider"
 
-    @patch("deerflowx.server.app.build_retriever")
+    @patch("deerflowx.libs.rag.catalog._resource_catalog", None)
+    @patch("deerflowx.libs.rag.catalog.build_retriever")
     def test_rag_resources_with_retriever(self, mock_build_retriever, client):
         mock_retriever = MagicMock()
-        mock_retriever.list_resources.return_value = [
-            {
-                "uri": "test_uri",
-                "title": "Test Resource",
-                "description": "Test Description",
-            }
-        ]
+        mock_retriever.alist_resources = AsyncMock(
+            return_value=[
+                Resource(uri="test_uri", title="Test Resource", description="Test Description"),
+                Resource(uri="other_uri", title="Other Resource"),
+            ]
+        )
         mock_build_retriever.return_value = mock_retriever
 
         response = client.get("/api/rag/resources?query=test")
-
         assert response.status_code == 200
-        assert len(response.json()["resources"]) == 1
+        assert [resource["uri"] for resource in response.json()["resources"]] == ["test_uri"]
+
+        # Later requests are answered from the cached catalog
+        response = client.get("/api/rag/resources?query=res")
+        assert len(response.json()["resources"]) == 2
+        mock_retriever.alist_resources.assert_awaited_once_with()
+        mock_build_retriever.assert_called_once()
 
-    @patch("deerflowx.server.app.build_retriever")
+    @patch("deerflowx.libs.rag.catalog._resource_catalog", None)
+    @patch("deerflowx.libs.rag.catalog.build_retriever")
     def test_rag_resources_without_retriever(self, mock_build_retriever, client):
         mock_build_retriever.return_value = None
 
@@ -249,3 +256,13 @@ class TestGenerateProseEndpoint:
         response = client.post("/api/prose/generate", json=request_data)
         assert response.status_code == 500
         assert response.json()["detail"] == "Internal Server Error"
+
+
+def test_lifespan_starts_sweeps_and_closes_executor():
+    with patch("deerflowx.server.app.workflow_executor") as executor:
+        executor.aclose = AsyncMock()
+        with TestClient(app):
+            executor.thread_lifecycle.start.assert_called_once()
+            executor.aclose.assert_not_called()
+
+    executor.aclose.assert_awaited_once()
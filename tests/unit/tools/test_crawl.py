@@ -1,6 +1,8 @@
 from unittest.mock import Mock, patch
 
+from deerflowx.config.settings import settings
 from deerflowx.tools.crawl import crawl_tool
+from deerflowx.utils.tokenizer import get_tokenizer
 
 
 class TestCrawlTool:
@@ -22,7 +24,7 @@ class TestCrawlTool:
         assert isinstance(result, dict)
         assert result["url"] == url
         assert "crawled_content" in result
-        assert len(result["crawled_content"]) <= 1000
+        assert get_tokenizer().count(result["crawled_content"]) <= settings.crawler.passage_token_budget
         mock_crawler_class.assert_called_once()
         mock_crawler.crawl.assert_called_once_with(url)
         mock_article.to_markdown.assert_called_once()
@@ -101,3 +103,22 @@ class TestCrawlTool:
         assert "Failed to crawl" in result
         assert "Markdown conversion error" in result
         mock_logger.exception.assert_called_once()
+
+    @patch("deerflowx.tools.crawl.Crawler")
+    def test_crawl_tool_returns_passages_relevant_to_query(self, mock_crawler_class):
+        # Arrange
+        mock_article = Mock()
+        mock_article.to_markdown.return_value = "\n\n".join(
+            [
+                *(f"Filler paragraph number {i} about nothing in particular." for i in range(30)),
+                "Pricing: $42 per seat.",
+            ]
+        )
+        mock_crawler_class.return_value.crawl.return_value = mock_article
+
+        # Act
+        result = crawl_tool.invoke({"url": "https://example.com", "query": "pricing per seat"})
+
+        # Assert
+        assert "Pricing: $42 per seat." in result["crawled_content"]
+        assert len(result["crawled_content"]) <= 1000
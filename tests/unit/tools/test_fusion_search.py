@@ -0,0 +1,176 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from deerflowx.config import SearchEngine
+from deerflowx.libs.search import canonicalize_url, fan_out_search, reciprocal_rank_fusion
+from deerflowx.tools.search import FusionSearchTool, get_web_search_tool
+
+
+def page(url: str, title: str = "title", **extra) -> dict:
+    return {"type": "page", "title": title, "url": url, "content": f"content of {url}", "score": 0.5, **extra}
+
+
+def engine(results: list[dict], delay: float = 0):
+    async def search(query: str, max_results: int) -> list[dict]:
+        await asyncio.sleep(delay)
+        return results[:max_results]
+
+    return search
+
+
+async def failing_engine(query: str, max_results: int) -> list[dict]:
+    msg = "engine is down"
+    raise RuntimeError(msg)
+
+
+class TestCanonicalizeUrl:
+    def test_equivalent_spellings_match(self):
+        assert canonicalize_url("https://www.Example.com/a/?utm_source=x#top") == canonicalize_url(
+            "http://example.com/a"
+        )
+
+    def test_meaningful_query_is_kept(self):
+        assert canonicalize_url("https://example.com/a?id=1") != canonicalize_url("https://example.com/a?id=2")
+        assert canonicalize_url("https://example.com/a?b=2&a=1") == canonicalize_url("https://example.com/a?a=1&b=2")
+
+    def test_only_exact_tracking_names_are_dropped(self):
+        assert canonicalize_url("https://example.com/a?ref=home&gclid=1") == canonicalize_url("https://example.com/a")
+        for name in ["refresh", "reference", "refid"]:
+            assert canonicalize_url(f"https://example.com/a?{name}=1") != canonicalize_url("https://example.com/a")
+
+
+class TestReciprocalRankFusion:
+    def test_results_found_by_several_engines_rank_first(self):
+        fused = reciprocal_rank_fusion(
+            {
+                "tavily": [page("https://a.com"), page("https://b.com")],
+                "duckduckgo": [page("https://c.com"), page("https://www.b.com/")],
+            },
+            k=60,
+        )
+
+        assert [result["url"] for result in fused] == ["https://b.com", "https://a.com", "https://c.com"]
+        assert fused[0]["score"] == pytest.approx(1 / 62 + 1 / 62, abs=1e-6)
+
+    def test_duplicates_keep_raw_content(self):
+        fused = reciprocal_rank_fusion(
+            {
+                "duckduckgo": [page("https://a.com")],
+                "tavily": [page("https://a.com", raw_content="full text")],
+            }
+        )
+
+        assert len(fused) == 1
+        assert fused[0]["raw_content"] == "full text"
+
+    def test_images_are_deduplicated_after_pages(self):
+        image = {"type": "image", "image_url": "https://a.com/x.png", "image_description": "x"}
+        fused = reciprocal_rank_fusion({"one": [image, page("https://a.com")], "two": [image]})
+
+        assert [result["type"] for result in fused] == ["page", "image"]
+
+
+class TestFanOutSearch:
+    @pytest.mark.asyncio
+    async def test_slow_and_failing_engines_are_dropped(self):
+        results = await fan_out_search(
+            "query",
+            {
+                "fast": engine([page("https://a.com")]),
+                "slow": engine([page("https://slow.com")], delay=5),
+                "broken": failing_engine,
+            },
+            max_results=5,
+            timeout_seconds=0.2,
+        )
+
+        assert [result["url"] for result in results] == ["https://a.com"]
+
+    @pytest.mark.asyncio
+    async def test_dropped_engines_finish_unwinding_before_return(self):
+        released = []
+
+        async def slow_engine(query: str, max_results: int) -> list[dict]:
+            try:
+                await asyncio.sleep(5)
+            finally:
+                await asyncio.sleep(0)
+                released.append(True)
+            return []
+
+        await fan_out_search("query", {"slow": slow_engine}, max_results=5, timeout_seconds=0.05)
+
+        assert released == [True]
+
+    @pytest.mark.asyncio
+    async def test_results_are_capped(self):
+        results = await fan_out_search(
+            "query",
+            {
+                "one": engine([page(f"https://one.com/{i}") for i in range(5)]),
+                "two": engine([page(f"https://two.com/{i}") for i in range(5)]),
+            },
+            max_results=3,
+            timeout_seconds=1,
+        )
+
+        assert len(results) == 3
+
+
+class TestFusionSearchTool:
+    @pytest.mark.asyncio
+    async def test_ainvoke_merges_engines(self):
+        engines = {"one": engine([page("https://a.com")]), "two": engine([page("https://b.com")])}
+        with patch.dict("deerflowx.tools.search._FUSION_ENGINES", engines):
+            tool = FusionSearchTool(engines=["one", "two"], max_results=5)
+            results = await tool.ainvoke("query")
+
+        assert {result["url"] for result in results} == {"https://a.com", "https://b.com"}
+
+    def test_invoke_runs_without_event_loop(self):
+        with patch.dict("deerflowx.tools.search._FUSION_ENGINES", {"one": engine([page("https://a.com")])}):
+            results = FusionSearchTool(engines=["one"]).invoke("query")
+
+        assert results[0]["url"] == "https://a.com"
+
+    def test_sync_searches_share_one_event_loop(self):
+        loops = []
+
+        async def search(query: str, max_results: int) -> list[dict]:
+            loops.append(asyncio.get_running_loop())
+            return [page("https://a.com")]
+
+        with patch.dict("deerflowx.tools.search._FUSION_ENGINES", {"one": search}):
+            FusionSearchTool(engines=["one"]).invoke("query")
+            FusionSearchTool(engines=["one"]).invoke("query")
+
+        assert loops[0] is loops[1]
+        assert loops[0].is_running()
+
+    @pytest.mark.asyncio
+    async def test_invoke_runs_inside_running_event_loop(self):
+        with patch.dict("deerflowx.tools.search._FUSION_ENGINES", {"one": engine([page("https://a.com")])}):
+            results = FusionSearchTool(engines=["one"]).invoke("query")
+
+        assert results[0]["url"] == "https://a.com"
+
+    @patch("deerflowx.tools.search.SELECTED_SEARCH_ENGINE", SearchEngine.FUSION.value)
+    def test_get_web_search_tool_fusion(self, monkeypatch):
+        monkeypatch.setattr("deerflowx.tools.search.settings.fusion_search.engines", "tavily, arxiv")
+        tool = get_web_search_tool(4)
+
+        assert isinstance(tool, FusionSearchTool)
+        assert tool.name == "web_search"
+        assert tool.max_results == 4
+        assert tool.engines == ["tavily", "arxiv"]
+
+    @patch("deerflowx.tools.search.SELECTED_SEARCH_ENGINE", SearchEngine.FUSION.value)
+    def test_get_web_search_tool_rejects_unknown_engine(self, monkeypatch):
+        monkeypatch.setattr("deerflowx.tools.search.settings.fusion_search.engines", "tavily,bing")
+        with pytest.raises(ValueError, match="bing"):
+            get_web_search_tool(4)
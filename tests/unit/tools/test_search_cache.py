@@ -0,0 +1,150 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+from typing import ClassVar
+from unittest.mock import patch
+
+import pytest
+from langchain_core.tools import BaseTool
+
+from deerflowx.config.settings import settings
+from deerflowx.libs.search import SearchCache, normalize_query
+from deerflowx.tools.decorators import CachedSearchToolMixin, create_cached_search_tool, create_logged_tool
+
+
+class FakeSearch(BaseTool):
+    name: str = "web_search"
+    description: str = "Fake search"
+    response_format: str = "content_and_artifact"
+    max_results: int = 5
+    calls: int = 0
+
+    def _run(self, query: str) -> tuple[list[dict], dict]:
+        self.calls += 1
+        if query == "fail":
+            return "error", {}
+        return [{"title": query}], {"query": query}
+
+
+class FakeAsyncSearch(FakeSearch):
+    async def _arun(self, query: str) -> tuple[list[dict], dict]:
+        return self._run(query)
+
+
+CachedFakeSearch = create_logged_tool(
+    create_cached_search_tool(FakeSearch, "fake", lambda tool: {"max_results": tool.max_results})
+)
+CachedFakeAsyncSearch = create_cached_search_tool(
+    FakeAsyncSearch, "fake", lambda tool: {"max_results": tool.max_results}
+)
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    cache = SearchCache(tmp_path / "search_cache.sqlite", ttl_seconds=60, max_bytes=1024 * 1024)
+    monkeypatch.setattr(settings.search_cache, "enabled", True)
+    monkeypatch.setattr("deerflowx.tools.decorators.get_search_cache", lambda: cache)
+    yield cache
+    cache.close()
+
+
+def test_normalize_query():
+    assert normalize_query("  What is   LangGraph? ") == "what is langgraph"
+    assert normalize_query("ＡＩ agents") == "ai agents"
+
+
+def test_repeated_queries_are_served_from_cache(cache):
+    tool = CachedFakeSearch()
+
+    first = tool.invoke({"query": "LangGraph checkpoints"})
+    second = tool.invoke({"query": "langgraph   checkpoints?"})
+
+    assert tool.calls == 1
+    assert first == second == [{"title": "LangGraph checkpoints"}]
+    metrics = cache.metrics()
+    assert (metrics.hits, metrics.misses, metrics.entries) == (1, 1, 1)
+    assert metrics.hit_rate == 0.5
+
+
+def test_results_keep_content_and_artifact_shape(cache):
+    tool = CachedFakeSearch()
+    tool_call = {"args": {"query": "q"}, "id": "1", "name": "web_search", "type": "tool_call"}
+
+    tool.invoke(tool_call)
+    message = tool.invoke(tool_call)
+
+    assert tool.calls == 1
+    assert message.artifact == {"query": "q"}
+
+
+def test_cache_key_includes_tool_settings(cache):
+    CachedFakeSearch(max_results=5).invoke({"query": "q"})
+    tool = CachedFakeSearch(max_results=10)
+    tool.invoke({"query": "q"})
+
+    assert tool.calls == 1
+    assert cache.metrics().entries == 2
+
+
+def test_failed_searches_are_not_cached(cache):
+    tool = CachedFakeSearch()
+
+    tool.invoke({"query": "fail"})
+    tool.invoke({"query": "fail"})
+
+    assert tool.calls == 2
+
+
+def test_expired_entries_are_refetched(cache):
+    tool = CachedFakeSearch()
+    tool.invoke({"query": "q"})
+
+    with patch("deerflowx.libs.search.cache.time.time", return_value=10**12):
+        tool.invoke({"query": "q"})
+
+    assert tool.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_async_searches_use_cache(cache):
+    native = CachedFakeAsyncSearch()
+    await native.ainvoke({"query": "q"})
+    await native.ainvoke({"query": "q"})
+    assert native.calls == 1
+
+    # Tools without a native _arun go through the cached _run in a thread
+    threaded = CachedFakeSearch()
+    await threaded.ainvoke({"query": "other"})
+    await threaded.ainvoke({"query": "other"})
+    assert threaded.calls == 1
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = SearchCache(tmp_path / "search_cache.sqlite", ttl_seconds=60, max_bytes=100)
+    try:
+        for query in ["a", "b", "c"]:
+            cache.put(query, "fake", query, "x" * 20)
+            cache.get("a")
+
+        assert cache.get("a")[0]
+        assert not cache.get("b")[0]
+        assert cache.metrics().evictions == 1
+    finally:
+        cache.close()
+
+
+def test_search_tool_is_disabled_without_cache():
+    tool = CachedFakeSearch()
+
+    tool.invoke({"query": "q"})
+    tool.invoke({"query": "q"})
+
+    assert tool.calls == 2
+
+
+def test_cached_search_tool_must_define_cache_params():
+    class IncompleteCachedSearch(CachedSearchToolMixin, FakeSearch):
+        cache_engine: ClassVar[str] = "fake"
+
+    with pytest.raises(TypeError, match="_cache_params"):
+        IncompleteCachedSearch()
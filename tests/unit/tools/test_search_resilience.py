@@ -0,0 +1,214 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from langchain_core.tools import BaseTool
+
+from deerflowx.config.settings import SearchResilienceSettings, settings
+from deerflowx.libs.search import (
+    CircuitBreaker,
+    CircuitOpenError,
+    ProviderResilience,
+    SearchProviderError,
+    parse_retry_after,
+)
+from deerflowx.libs.tavily_search.tavily_search_api_wrapper import EnhancedTavilySearchAPIWrapper
+from deerflowx.tools.decorators import create_resilient_search_tool
+
+
+def make_resilience(**overrides) -> ProviderResilience:
+    options = {"hedge_min_samples": 3, "failure_threshold": 2, "backoff_base_seconds": 0.01, **overrides}
+    return ProviderResilience("test", SearchResilienceSettings(**options))
+
+
+class Flaky:
+    """Fails with the given errors, then returns "ok"."""
+
+    def __init__(self, *errors: Exception) -> None:
+        self.errors = list(errors)
+        self.calls = 0
+
+    def __call__(self) -> str:
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return "ok"
+
+    async def acall(self) -> str:
+        return self()
+
+
+class TestParseRetryAfter:
+    def test_seconds(self):
+        assert parse_retry_after("3") == 3
+
+    def test_http_date(self):
+        date = time.strftime("%a, %d %b %Y %H:%M:%S GMT", time.gmtime(time.time() + 60))
+        assert 55 < parse_retry_after(date) <= 60
+
+    def test_invalid(self):
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+
+class TestCircuitBreaker:
+    def test_opens_after_consecutive_failures_and_probes_after_cooldown(self):
+        breaker = CircuitBreaker("test", failure_threshold=2, reset_timeout_seconds=0.05)
+        breaker.record_failure()
+        breaker.before_call()
+        breaker.record_failure()
+
+        assert breaker.state == "open"
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+        time.sleep(0.06)
+        breaker.before_call()
+        # Only one probe at a time
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+        breaker.record_success()
+        assert breaker.state == "closed"
+
+    def test_failed_probe_reopens(self):
+        breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout_seconds=0.05)
+        breaker.record_failure()
+        time.sleep(0.06)
+        breaker.before_call()
+        breaker.record_failure()
+
+        assert breaker.state == "open"
+
+
+class TestProviderResilience:
+    def test_transient_errors_are_retried(self):
+        fn = Flaky(ConnectionError("reset"), SearchProviderError("Error 503", 503))
+        assert make_resilience(failure_threshold=5).call(fn) == "ok"
+        assert fn.calls == 3
+
+    def test_client_errors_are_not_retried(self):
+        resilience = make_resilience()
+        fn = Flaky(SearchProviderError("Error 400", 400))
+        with pytest.raises(SearchProviderError):
+            resilience.call(fn)
+        assert fn.calls == 1
+        assert resilience.breaker.state == "closed"
+
+    def test_retry_after_is_respected(self):
+        fn = Flaky(SearchProviderError("Error 429", 429, retry_after=0.2))
+        start = time.monotonic()
+        assert make_resilience().call(fn) == "ok"
+        assert time.monotonic() - start >= 0.2
+
+    def test_long_retry_after_fails_fast(self):
+        fn = Flaky(SearchProviderError("Error 429", 429, retry_after=60))
+        with pytest.raises(SearchProviderError):
+            make_resilience().call(fn)
+        assert fn.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_short_circuits(self):
+        resilience = make_resilience(max_retries=0)
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                await resilience.acall(Flaky(ConnectionError("reset")).acall)
+
+        fn = Flaky()
+        with pytest.raises(CircuitOpenError):
+            await resilience.acall(fn.acall)
+        assert fn.calls == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_probe_reopens_breaker(self):
+        resilience = make_resilience(max_retries=0, failure_threshold=1, reset_timeout_seconds=0.05)
+        with pytest.raises(ConnectionError):
+            await resilience.acall(Flaky(ConnectionError("reset")).acall)
+        await asyncio.sleep(0.06)
+
+        probe = asyncio.create_task(resilience.acall(lambda: asyncio.sleep(5)))
+        await asyncio.sleep(0.01)
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+
+        assert resilience.breaker.state == "open"
+        await asyncio.sleep(0.06)
+        assert await resilience.acall(Flaky().acall) == "ok"
+        assert resilience.breaker.state == "closed"
+
+    @pytest.mark.asyncio
+    async def test_slow_request_is_hedged(self):
+        resilience = make_resilience()
+        for _ in range(3):
+            resilience.latency.record(0.01)
+        delays = [5, 0]
+
+        async def search() -> float:
+            delay = delays.pop(0)
+            await asyncio.sleep(delay)
+            return delay
+
+        start = time.monotonic()
+        assert await resilience.acall(search) == 0
+        assert time.monotonic() - start < 1
+        assert resilience.hedged_requests == 1
+
+    @pytest.mark.asyncio
+    async def test_no_hedging_without_latency_samples(self):
+        resilience = make_resilience()
+        assert await resilience.acall(Flaky().acall) == "ok"
+        assert resilience.hedged_requests == 0
+
+
+class TestResilientSearchTool:
+    @pytest.mark.asyncio
+    async def test_sync_tool_is_retried_from_arun(self, monkeypatch):
+        monkeypatch.setattr(settings.search_resilience, "enabled", True)
+        monkeypatch.setattr(settings.search_resilience, "backoff_base_seconds", 0.01)
+        flaky = Flaky(ConnectionError("reset"))
+
+        class SyncSearch(BaseTool):
+            name: str = "sync_search"
+            description: str = "search"
+
+            def _run(self, query: str) -> str:
+                return flaky()
+
+        tool = create_resilient_search_tool(SyncSearch, "sync_search")()
+        with patch("deerflowx.libs.search.resilience._providers", {}):
+            assert await tool.ainvoke("query") == "ok"
+        assert flaky.calls == 2
+
+
+class TestTavilyResilience:
+    @pytest.mark.asyncio
+    async def test_rate_limited_request_is_retried(self, monkeypatch):
+        monkeypatch.setattr(settings.search_resilience, "enabled", True)
+        responses = []
+        for status in (429, 200):
+            response = AsyncMock()
+            response.__aenter__ = AsyncMock(return_value=response)
+            response.__aexit__ = AsyncMock(return_value=None)
+            response.status = status
+            response.reason = "Too Many Requests"
+            response.headers = {"Retry-After": "0"}
+            response.text = AsyncMock(return_value='{"results": [], "images": []}')
+            responses.append(response)
+        session = MagicMock()
+        session.post = MagicMock(side_effect=responses)
+
+        with (
+            patch("deerflowx.libs.search.resilience._providers", {}),
+            patch(
+                "deerflowx.libs.tavily_search.tavily_search_api_wrapper.get_tavily_async_session",
+                return_value=session,
+            ),
+        ):
+            result = await EnhancedTavilySearchAPIWrapper(tavily_api_key="key").raw_results_async("query")
+
+        assert result == {"results": [], "images": []}
+        assert session.post.call_count == 2
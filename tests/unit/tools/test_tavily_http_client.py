@@ -0,0 +1,32 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+from deerflowx.libs.tavily_search import aclose_tavily_sessions
+from deerflowx.libs.tavily_search.http_client import get_tavily_async_session, get_tavily_session
+
+
+@pytest.mark.asyncio
+async def test_async_session_is_shared_and_closed():
+    session = get_tavily_async_session()
+    try:
+        assert get_tavily_async_session() is session
+        assert session.connector.limit > 0
+    finally:
+        await aclose_tavily_sessions()
+
+    assert session.closed
+    assert get_tavily_async_session() is not session
+    await aclose_tavily_sessions()
+
+
+@pytest.mark.asyncio
+async def test_sync_session_is_shared_until_closed():
+    session = get_tavily_session()
+    assert get_tavily_session() is session
+
+    await aclose_tavily_sessions()
+
+    assert get_tavily_session() is not session
+    await aclose_tavily_sessions()
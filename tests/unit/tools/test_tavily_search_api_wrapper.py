@@ -41,8 +41,9 @@ class TestEnhancedTavilySearchAPIWrapper:
             ],
         }
 
-    @patch("deerflowx.libs.tavily_search.tavily_search_api_wrapper.requests.post")
-    def test_raw_results_success(self, mock_post, wrapper, mock_response_data):
+    @patch("deerflowx.libs.tavily_search.tavily_search_api_wrapper.get_tavily_session")
+    def test_raw_results_success(self, mock_get_session, wrapper, mock_response_data):
+        mock_post = mock_get_session.return_value.post
         mock_response = Mock()
         mock_response.json.return_value = mock_response_data
         mock_response.raise_for_status.return_value = None
@@ -57,8 +58,9 @@ class TestEnhancedTavilySearchAPIWrapper:
         assert call_args.kwargs["json"]["query"] == "test query"
         assert call_args.kwargs["json"]["max_results"] == 10
 
-    @patch("deerflowx.libs.tavily_search.tavily_search_api_wrapper.requests.post")
-    def test_raw_results_with_all_parameters(self, mock_post, wrapper, mock_response_data):
+    @patch("deerflowx.libs.tavily_search.tavily_search_api_wrapper.get_tavily_session")
+    def test_raw_results_with_all_parameters(self, mock_get_session, wrapper, mock_response_data):
+        mock_post = mock_get_session.return_value.post
         mock_response = Mock()
         mock_response.json.return_value = mock_response_data
         mock_response.raise_for_status.return_value = None
@@ -84,8 +86,9 @@ class TestEnhancedTavilySearchAPIWrapper:
         assert request_params["include_answer"] is True
         assert request_params["include_raw_content"] is True
 
-    @patch("deerflowx.libs.tavily_search.tavily_search_api_wrapper.requests.post")
-    def test_raw_results_http_error(self, mock_post, wrapper):
+    @patch("deerflowx.libs.tavily_search.tavily_search_api_wrapper.get_tavily_session")
+    def test_raw_results_http_error(self, mock_get_session, wrapper):
+        mock_post = mock_get_session.return_value.post
         mock_response = Mock()
         mock_response.raise_for_status.side_effect = requests.HTTPError("API Error")
         mock_post.return_value = mock_response
@@ -106,14 +109,9 @@ class TestEnhancedTavilySearchAPIWrapper:
         mock_session = AsyncMock()
         mock_session.post = MagicMock(return_value=mock_response_cm)  # Use MagicMock, not AsyncMock
 
-        # Create mock session class
-        mock_session_cm = AsyncMock()
-        mock_session_cm.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session_cm.__aexit__ = AsyncMock(return_value=None)
-
         with patch(
-            "deerflowx.libs.tavily_search.tavily_search_api_wrapper.aiohttp.ClientSession",
-            return_value=mock_session_cm,
+            "deerflowx.libs.tavily_search.tavily_search_api_wrapper.get_tavily_async_session",
+            return_value=mock_session,
         ):
             result = await wrapper.raw_results_async("test query")
 
@@ -132,14 +130,9 @@ class TestEnhancedTavilySearchAPIWrapper:
         mock_session = AsyncMock()
         mock_session.post = MagicMock(return_value=mock_response_cm)  # Use MagicMock, not AsyncMock
 
-        # Create mock session class
-        mock_session_cm = AsyncMock()
-        mock_session_cm.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session_cm.__aexit__ = AsyncMock(return_value=None)
-
         with patch(
-            "deerflowx.libs.tavily_search.tavily_search_api_wrapper.aiohttp.ClientSession",
-            return_value=mock_session_cm,
+            "deerflowx.libs.tavily_search.tavily_search_api_wrapper.get_tavily_async_session",
+            return_value=mock_session,
         ):
             with pytest.raises(Exception, match="Error 400: Bad Request"):
                 await wrapper.raw_results_async("test query")
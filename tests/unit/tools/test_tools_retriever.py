@@ -1,7 +1,7 @@
 # Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
 # SPDX-License-Identifier: MIT
 
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from langchain_core.callbacks import (
@@ -64,18 +64,18 @@ async def test_retriever_tool_arun():
     mock_retriever = Mock(spec=Retriever)
     chunk = Chunk(content="async content", similarity=0.8)
     doc = Document(doc_id="doc2", chunks=[chunk])
-    mock_retriever.query_relevant_documents.return_value = [doc]
+    mock_retriever.aquery_relevant_documents = AsyncMock(return_value=[doc])
 
     resources = [Resource(uri="test://uri", title="Test", description="")]
     tool = RetrieverTool(retriever=mock_retriever, resources=resources)
 
     mock_run_manager = Mock(spec=AsyncCallbackManagerForToolRun)
-    mock_sync_manager = Mock(spec=CallbackManagerForToolRun)
-    mock_run_manager.get_sync.return_value = mock_sync_manager
 
     result = await tool._arun("async keywords", mock_run_manager)
 
-    mock_run_manager.get_sync.assert_called_once()
+    # The async path must not fall back to the blocking client
+    mock_retriever.query_relevant_documents.assert_not_called()
+    mock_retriever.aquery_relevant_documents.assert_awaited_once_with("async keywords", resources)
     assert isinstance(result, list)
     assert len(result) == 1
     assert result[0] == doc.to_dict()
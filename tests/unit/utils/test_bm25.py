@@ -0,0 +1,28 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+from deerflowx.utils.bm25 import BM25, tokenize
+
+
+def test_tokenize_lowercases_words_and_splits_cjk():
+    assert tokenize("Hello, World_2025! 深度研究") == ["hello", "world", "2025", "深", "度", "研", "究"]
+
+
+def test_matching_documents_score_higher():
+    corpus = [tokenize(text) for text in ["the cat sat", "dogs bark loudly", "the cat and the dog"]]
+    scores = BM25(corpus).scores(tokenize("cat"))
+
+    assert scores[1] == 0
+    assert scores[0] > 0
+    assert scores[2] > 0
+
+
+def test_rare_terms_weigh_more_than_common_terms():
+    corpus = [tokenize(text) for text in ["apple banana", "apple cherry", "apple durian"]]
+    bm25 = BM25(corpus)
+
+    assert bm25.score(tokenize("cherry"), 1) > bm25.score(tokenize("apple"), 1)
+
+
+def test_empty_corpus():
+    assert BM25([]).scores(["anything"]) == []
@@ -0,0 +1,207 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+from deerflowx.utils import context_compressor
+from deerflowx.utils.context_compressor import (
+    SmartContextCompressor,
+    clear_context_compressor_cache,
+    get_context_compressor,
+)
+from deerflowx.utils.tokenizer import Tokenizer
+
+
+class FakeEncoding:
+    """One token per four characters, recording the encoded texts."""
+
+    def __init__(self) -> None:
+        self.texts = []
+
+    def encode_ordinary_batch(self, texts):
+        self.texts.extend(texts)
+        return [[0] * (len(text) // 4) for text in texts]
+
+    def encode_ordinary(self, text):
+        return self.encode_ordinary_batch([text])[0]
+
+    def decode_with_offsets(self, tokens):
+        return "", [4 * i for i in range(len(tokens))]
+
+
+@pytest.fixture
+def token_counter(monkeypatch):
+    encoding = FakeEncoding()
+    tokenizer = Tokenizer(encoding)
+    monkeypatch.setattr(context_compressor, "get_tokenizer", lambda _: tokenizer)
+    return encoding.texts
+
+
+class Summarizer:
+    def __init__(self) -> None:
+        self.running = 0
+        self.max_running = 0
+        self.calls = 0
+        self.summary = "short summary"
+
+    async def ainvoke(self, prompt):
+        self.calls += 1
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        return AIMessage(content=self.summary)
+
+
+@pytest.fixture
+def summarizer(monkeypatch):
+    summarizer = Summarizer()
+    monkeypatch.setattr(context_compressor, "get_llm_by_type", lambda _: summarizer)
+    monkeypatch.setattr(context_compressor, "SUMMARY_TOKENS_ESTIMATE", 40)
+    return summarizer
+
+
+@pytest.fixture
+def compressor(summarizer, token_counter):
+    return SmartContextCompressor("gpt-4o", override_token_limit=200, extractive=False)
+
+
+def conversation():
+    return [
+        HumanMessage(content="question " * 10),
+        AIMessage(content="", tool_calls=[{"id": "a", "name": "crawl_tool", "args": {}}]),
+        ToolMessage(content="a" * 800, tool_call_id="a"),
+        ToolMessage(content="b" * 600, tool_call_id="b"),
+        ToolMessage(content="c" * 200, tool_call_id="c"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_compress_tokenizes_each_message_once(compressor, token_counter):
+    messages = await compressor.compress(conversation())
+
+    assert isinstance(messages[2], HumanMessage)
+    assert "in response to `crawl_tool` call" in messages[2].content
+    assert isinstance(messages[3], HumanMessage)
+    assert isinstance(messages[4], ToolMessage)
+    assert compressor.get_total_tokens(messages) <= 200
+    # Five originals plus the two summaries
+    assert len(token_counter) == 7
+
+
+@pytest.mark.asyncio
+async def test_planned_summaries_run_concurrently(compressor, summarizer, token_counter):
+    await compressor.compress(conversation())
+
+    assert (summarizer.calls, summarizer.max_running) == (2, 2)
+
+
+@pytest.mark.asyncio
+async def test_summary_concurrency_is_limited(summarizer, token_counter):
+    compressor = SmartContextCompressor("gpt-4o", override_token_limit=50, max_concurrent_summaries=1, extractive=False)
+
+    await compressor.compress(conversation())
+
+    assert (summarizer.calls, summarizer.max_running) == (3, 1)
+
+
+@pytest.mark.asyncio
+async def test_serial_mode_summarizes_one_message_per_round(summarizer, token_counter):
+    compressor = SmartContextCompressor("gpt-4o", override_token_limit=200, plan_summaries=False, extractive=False)
+
+    messages = await compressor.compress(conversation())
+
+    assert [type(message) for message in messages[2:]] == [HumanMessage, HumanMessage, ToolMessage]
+    assert (summarizer.calls, summarizer.max_running) == (2, 1)
+
+
+@pytest.mark.asyncio
+async def test_longer_summaries_than_planned_trigger_another_round(summarizer, token_counter):
+    summarizer.summary = "s" * 200
+    compressor = SmartContextCompressor("gpt-4o", override_token_limit=200, extractive=False)
+
+    messages = await compressor.compress(conversation())
+
+    # The first round plans a and b only, but their summaries leave the total above the limit
+    assert summarizer.calls == 3
+    assert not any(isinstance(message, ToolMessage) for message in messages)
+
+
+@pytest.mark.asyncio
+async def test_token_counts_are_reused_across_compressors(compressor, token_counter):
+    await compressor.compress(conversation())
+    calls = len(token_counter)
+
+    await SmartContextCompressor("gpt-4o", override_token_limit=200, extractive=False).compress(conversation())
+
+    assert len(token_counter) == calls
+
+
+@pytest.mark.asyncio
+async def test_extractive_tier_avoids_llm_calls(summarizer, token_counter):
+    page = "\n".join(
+        ["[Home](/) | [About](/about) | [Blog](/blog)"] * 5
+        + [f"Paragraph {i} about unrelated gardening topics and seasonal flowers." for i in range(20)]
+        + ["The deployment uses docker compose with a reverse proxy."]
+    )
+    messages = [
+        HumanMessage(content="Research the deployment"),
+        AIMessage(content="", tool_calls=[{"id": "a", "name": "crawl_tool", "args": {}}]),
+        ToolMessage(content=page, tool_call_id="a"),
+    ]
+    compressor = SmartContextCompressor("gpt-4o", override_token_limit=120)
+
+    messages = await compressor.compress(messages, query="docker deployment")
+
+    assert summarizer.calls == 0
+    assert isinstance(messages[2], ToolMessage)
+    assert messages[2].tool_call_id == "a"
+    assert "docker compose" in messages[2].content
+    assert "[Home]" not in messages[2].content
+    assert compressor.get_total_tokens(messages) <= 120
+
+
+@pytest.mark.asyncio
+async def test_llm_summarizes_when_extraction_is_not_enough(summarizer, token_counter):
+    compressor = SmartContextCompressor("gpt-4o", override_token_limit=30)
+
+    messages = await compressor.compress(conversation())
+
+    assert summarizer.calls > 0
+    assert isinstance(messages[2], HumanMessage)
+
+
+@pytest.fixture
+def max_tokens(monkeypatch):
+    clear_context_compressor_cache()
+    lookup = MagicMock(side_effect=lambda model: {"gpt-4o": 128000}.get(model) or _unmapped(model))
+    monkeypatch.setattr(context_compressor.litellm, "get_max_tokens", lookup)
+    yield lookup
+    clear_context_compressor_cache()
+
+
+def _unmapped(model):
+    msg = f"This model isn't mapped yet. model={model}"
+    raise Exception(msg)  # noqa: TRY002
+
+
+def test_compressors_are_reused(summarizer, max_tokens):
+    compressor = get_context_compressor("gpt-4o")
+
+    assert get_context_compressor("gpt-4o") is compressor
+    assert compressor.token_limit == int(128000 * 0.8)
+    assert get_context_compressor("gpt-4o", override_token_limit=1000).token_limit == 1000
+    assert get_context_compressor("gpt-4o", safety_margin=0.5).token_limit == 64000
+    assert max_tokens.call_count == 1
+
+
+def test_unknown_models_are_looked_up_once(summarizer, max_tokens):
+    assert SmartContextCompressor("doubao-seed-1-6").token_limit == 28000
+    assert SmartContextCompressor("doubao-seed-1-6").token_limit == 28000
+    assert SmartContextCompressor("doubao-pro-32k").token_limit == int(32000 * 0.8)
+    # doubao-pro-32k maps to gpt-3.5-turbo, which is unknown to the fake litellm too
+    assert max_tokens.call_count == 2
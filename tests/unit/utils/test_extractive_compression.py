@@ -0,0 +1,99 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+import json
+
+from deerflowx.utils.extractive_compression import (
+    ELISION,
+    collapse_duplicate_lines,
+    compress_text,
+    prune_json,
+    select_sentences,
+    strip_boilerplate,
+)
+from deerflowx.utils.tokenizer import get_tokenizer, split_sentences
+
+FILLER = [f"Paragraph {i} covers gardening, seasonal flowers and the weather in spring." for i in range(10)]
+
+
+def test_strip_boilerplate():
+    text = """<!-- tracking --><div>Intro text.</div>
+[Home](/) | [Docs](/docs) | [Blog](/blog)
+![logo](https://example.com/logo.png)See [the guide](https://example.com/guide) for details.
+[Back to top](#top)
+[Source](https://example.com/paper)"""
+
+    assert strip_boilerplate(text).splitlines() == [
+        "Intro text.",
+        "See [the guide](https://example.com/guide) for details.",
+        "[Source](https://example.com/paper)",
+    ]
+
+
+def test_collapse_duplicate_lines():
+    text = "Cookie notice.\n\n\n\nBody text.\n  cookie   NOTICE.\nMore text.\n\n"
+
+    assert collapse_duplicate_lines(text) == "Cookie notice.\n\nBody text.\nMore text."
+
+
+def test_prune_json():
+    results = [
+        {"url": "https://a", "title": "A", "content": "alpha", "score": 0.9, "images": []},
+        {"url": "https://b", "title": "", "content": "beta", "favicon": "https://b/favicon.ico"},
+        {"url": "https://a", "title": "A again", "content": "alpha"},
+    ]
+
+    assert prune_json(results) == [
+        {"url": "https://a", "title": "A", "content": "alpha"},
+        {"url": "https://b", "content": "beta"},
+    ]
+
+
+def test_select_sentences_keeps_query_matches_in_order():
+    text = " ".join([*FILLER[:5], "The deployment uses docker compose.", *FILLER[5:]])
+
+    selected = select_sentences(text, "docker deployment", token_budget=12)
+
+    assert selected.splitlines() == [ELISION, "The deployment uses docker compose.", ELISION]
+
+
+def test_select_sentences_without_query_prefers_central_sentences():
+    text = """Docker images bundle the server and its dependencies.
+The weather was pleasant.
+Docker compose starts the server and the database.
+Docker volumes keep the database files."""
+
+    selected = select_sentences(text, None, token_budget=31)
+
+    assert "The weather was pleasant." not in selected
+    assert "Docker" in selected
+
+
+def test_compress_text_stops_at_the_cheapest_sufficient_step():
+    results = json.dumps([{"url": "https://a", "content": "alpha", "score": 0.5, "images": ["x"] * 50}])
+
+    assert compress_text(results, None, token_budget=100) == '[{"url":"https://a","content":"alpha"}]'
+    assert compress_text("Short text.\nShort text.", None, token_budget=100) == "Short text."
+
+
+def test_compress_text_selects_sentences_within_budget():
+    text = "\n".join([*FILLER, "Docker compose runs the stack.", *FILLER])
+
+    compressed = compress_text(text, "docker", token_budget=30)
+
+    assert "Docker compose runs the stack." in compressed
+    assert get_tokenizer().count(compressed) <= 30
+
+
+def test_select_sentences_counts_tokens_of_the_given_tokenizer():
+    text = "研究人工智能在教育领域的应用。" * 3 + "The weather was pleasant."
+    tokenizer = get_tokenizer("gpt-4o")
+    budget = tokenizer.count("研究人工智能在教育领域的应用。") + 1
+
+    selected = select_sentences(text, "教育", budget, tokenizer)
+
+    assert selected.splitlines() == ["研究人工智能在教育领域的应用。", ELISION]
+
+
+def test_split_sentences():
+    assert split_sentences("First one. Second one!  研究。应用？ ") == ["First one.", "Second one!", "研究。", "应用？"]
@@ -0,0 +1,69 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import threading
+
+import httpx
+import pytest
+import requests
+
+from deerflowx.utils.http_pool import aclose_clients, get_async_client, get_session
+
+
+@pytest.fixture
+def other_loop():
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    yield loop
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+async def _get_client():
+    return get_async_client("test", httpx.AsyncClient)
+
+
+@pytest.mark.asyncio
+async def test_each_event_loop_keeps_its_own_client(other_loop):
+    client = await _get_client()
+    other = await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(_get_client(), other_loop))
+
+    try:
+        assert other is not client
+        # Using the client on another loop does not replace the client of this one
+        assert await _get_client() is client
+    finally:
+        await aclose_clients("test")
+
+    assert client.is_closed
+    assert other.is_closed
+    assert await _get_client() is not client
+    await aclose_clients("test")
+
+
+@pytest.mark.asyncio
+async def test_clients_of_closed_loops_are_dropped():
+    def use_in_throwaway_loop():
+        return asyncio.run(_get_client())
+
+    stale = await asyncio.to_thread(use_in_throwaway_loop)
+
+    client = await _get_client()
+    try:
+        assert client is not stale
+    finally:
+        await aclose_clients("test")
+
+
+@pytest.mark.asyncio
+async def test_sync_session_is_shared_until_closed():
+    session = get_session("test", requests.Session)
+    assert get_session("test", requests.Session) is session
+
+    await aclose_clients("test")
+
+    assert get_session("test", requests.Session) is not session
+    await aclose_clients("test")
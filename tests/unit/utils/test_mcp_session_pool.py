@@ -0,0 +1,185 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import os
+import sys
+import textwrap
+import threading
+import time
+
+import pytest
+
+from deerflowx.config.settings import MCPPoolSettings
+from deerflowx.utils.mcp_session_pool import MCPSessionPool, get_connection_key
+
+SERVER_SCRIPT = """
+import os
+import sys
+
+from mcp.server.fastmcp import FastMCP
+
+with open(sys.argv[1], "a") as f:
+    f.write(f"{os.getpid()}\\n")
+
+mcp = FastMCP("echo")
+
+
+@mcp.tool()
+def echo(text: str) -> str:
+    \"\"\"Echo the text back.\"\"\"
+    return text
+
+
+mcp.run()
+"""
+
+
+@pytest.fixture
+def server_factory(tmp_path):
+    script = tmp_path / "echo_server.py"
+    script.write_text(textwrap.dedent(SERVER_SCRIPT))
+    starts = tmp_path / "starts.log"
+    starts.touch()
+
+    def make(*extra_args):
+        return {"transport": "stdio", "command": sys.executable, "args": [str(script), str(starts), *extra_args]}
+
+    make.starts = lambda: len(starts.read_text().splitlines())
+    return make
+
+
+def _pool(**overrides):
+    return MCPSessionPool(MCPPoolSettings(**({"max_sessions": 4, "idle_timeout_seconds": 300} | overrides)))
+
+
+def test_connection_key_is_order_independent():
+    assert get_connection_key({"a": 1, "b": [1, 2]}) == get_connection_key({"b": [1, 2], "a": 1})
+    assert get_connection_key({"a": 1}) != get_connection_key({"a": 2})
+
+
+@pytest.mark.asyncio
+async def test_sessions_are_reused_across_leases(server_factory):
+    pool = _pool()
+    try:
+        for _ in range(3):
+            async with pool.lease({"echo": server_factory()}) as tools:
+                assert [tool.name for tool in tools["echo"]] == ["echo"]
+                assert await tools["echo"][0].ainvoke({"text": "hi"}) == "hi"
+        assert server_factory.starts() == 1
+        assert pool.size == 1
+    finally:
+        await pool.close()
+    assert pool.size == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_leases_share_one_session(server_factory):
+    pool = _pool()
+
+    async def use():
+        async with pool.lease({"echo": server_factory()}) as tools:
+            return await tools["echo"][0].ainvoke({"text": "hi"})
+
+    try:
+        assert await asyncio.gather(*(use() for _ in range(4))) == ["hi"] * 4
+        assert server_factory.starts() == 1
+    finally:
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_dead_session_is_replaced(server_factory):
+    pool = _pool(health_check_interval_seconds=0)
+    try:
+        async with pool.lease({"echo": server_factory()}):
+            pass
+        (pooled,) = pool._sessions.values()
+        pooled.stop.set()
+        await pooled.task
+
+        async with pool.lease({"echo": server_factory()}) as tools:
+            assert await tools["echo"][0].ainvoke({"text": "again"}) == "again"
+        assert server_factory.starts() == 2
+    finally:
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_idle_session_is_closed_over_cap(server_factory):
+    pool = _pool(max_sessions=1)
+    try:
+        async with pool.lease({"first": server_factory("first"), "second": server_factory("second")}):
+            # Leased sessions are kept even though the pool is over its cap
+            assert pool.size == 2
+        assert pool.size == 1
+    finally:
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_idle_sessions_are_shut_down(server_factory):
+    pool = _pool(idle_timeout_seconds=0)
+    try:
+        async with pool.lease({"echo": server_factory()}):
+            await pool._close_idle_sessions()
+            assert pool.size == 1
+        await pool._close_idle_sessions()
+        assert pool.size == 0
+    finally:
+        await pool.close()
+
+
+def _server_pids(tmp_path):
+    return [int(pid) for pid in (tmp_path / "starts.log").read_text().split()]
+
+
+async def _wait_for_exit(pid):
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return True
+        await asyncio.sleep(0.05)
+    return False
+
+
+@pytest.mark.asyncio
+async def test_sessions_of_another_running_loop_are_shut_down_on_rebind(server_factory, tmp_path):
+    pool = _pool()
+    other_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=other_loop.run_forever, daemon=True)
+    thread.start()
+
+    async def use():
+        async with pool.lease({"echo": server_factory()}):
+            pass
+
+    try:
+        await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(use(), other_loop))
+        (old_pid,) = _server_pids(tmp_path)
+
+        await use()
+
+        assert await _wait_for_exit(old_pid)
+        assert server_factory.starts() == 2
+        assert pool.size == 1
+    finally:
+        await pool.close()
+        other_loop.call_soon_threadsafe(other_loop.stop)
+        thread.join()
+        other_loop.close()
+
+
+@pytest.mark.asyncio
+async def test_close_awaits_the_reaper(server_factory):
+    pool = _pool()
+    async with pool.lease({"echo": server_factory()}):
+        pass
+    reaper = pool._reaper
+
+    await pool.close()
+
+    assert reaper.done()
+    assert pool.size == 0
@@ -0,0 +1,194 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import operator
+import time
+from typing import Annotated
+from unittest.mock import patch
+
+import pytest
+from langgraph.graph import END, START, StateGraph
+from typing_extensions import TypedDict
+
+from deerflowx.config.settings import ThreadLifecycleSettings
+from deerflowx.libs.checkpoint import InMemoryCheckpointSaver, SQLiteCheckpointSaver
+from deerflowx.utils.thread_lifecycle import ThreadLifecycleManager
+
+
+class CounterState(TypedDict):
+    items: Annotated[list[str], operator.add]
+
+
+def _build_graph(checkpointer):
+    builder = StateGraph(CounterState)
+    builder.add_node("first", lambda _state: {"items": ["a"]})
+    builder.add_node("second", lambda _state: {"items": ["b"]})
+    builder.add_edge(START, "first")
+    builder.add_edge("first", "second")
+    builder.add_edge("second", END)
+    return builder.compile(checkpointer=checkpointer)
+
+
+async def _run(graph, thread_id, turns=1):
+    config = {"configurable": {"thread_id": thread_id}}
+    for _ in range(turns):
+        await graph.ainvoke({"items": []}, config)
+    return config
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def checkpointer(request, tmp_path):
+    if request.param == "memory":
+        yield InMemoryCheckpointSaver()
+        return
+    saver = SQLiteCheckpointSaver(tmp_path / "checkpoints.sqlite")
+    yield saver
+    saver.close()
+
+
+def _settings(**overrides):
+    values = {
+        "idle_ttl_seconds": 3600,
+        "max_threads": 100,
+        "max_bytes": 1024 * 1024 * 1024,
+        "keep_last_checkpoints": 2,
+        "sweep_interval_seconds": 3600,
+    }
+    return ThreadLifecycleSettings(**(values | overrides))
+
+
+@pytest.mark.asyncio
+async def test_prune_keeps_latest_checkpoints_and_state(checkpointer):
+    graph = _build_graph(checkpointer)
+    config = await _run(graph, "thread-1", turns=3)
+    before = await checkpointer.aget_tuple(config)
+    size_before = await checkpointer.aget_thread_size("thread-1")
+
+    pruned = await checkpointer.aprune_thread("thread-1", 2)
+
+    assert pruned > 0
+    assert len([c async for c in checkpointer.alist(config)]) == 2
+    after = await checkpointer.aget_tuple(config)
+    assert after.checkpoint["id"] == before.checkpoint["id"]
+    assert (await graph.aget_state(config)).values["items"] == ["a", "b"] * 3
+    assert await checkpointer.aget_thread_size("thread-1") < size_before
+
+    # The thread keeps working after compaction
+    await _run(graph, "thread-1")
+    assert (await graph.aget_state(config)).values["items"] == ["a", "b"] * 4
+
+
+@pytest.mark.asyncio
+async def test_track_compacts_thread_after_run(checkpointer):
+    graph = _build_graph(checkpointer)
+    manager = ThreadLifecycleManager(checkpointer, _settings())
+
+    async with manager.track("thread-1"):
+        config = await _run(graph, "thread-1", turns=2)
+
+    assert len([c async for c in checkpointer.alist(config)]) == 2
+    assert (await manager.metrics()).pruned_checkpoints > 0
+
+
+@pytest.mark.asyncio
+async def test_sweep_evicts_idle_threads_but_not_active_ones(checkpointer):
+    graph = _build_graph(checkpointer)
+    manager = ThreadLifecycleManager(checkpointer, _settings(idle_ttl_seconds=10))
+    await _run(graph, "idle")
+    await _run(graph, "running")
+
+    await manager.sweep()
+    assert sorted(checkpointer.list_thread_ids()) == ["idle", "running"]
+    with patch("deerflowx.utils.thread_lifecycle.time.time", return_value=time.time() + 100):
+        manager._active["running"] = 1
+        await manager.sweep()
+
+    assert checkpointer.list_thread_ids() == ["running"]
+    assert (await manager.metrics()).evicted_threads == 1
+
+
+@pytest.mark.asyncio
+async def test_sweep_keeps_threads_written_by_other_workers(checkpointer):
+    graph = _build_graph(checkpointer)
+    manager = ThreadLifecycleManager(checkpointer, _settings(idle_ttl_seconds=10, max_threads=0))
+    async with manager.track("shared"):
+        await _run(graph, "shared")
+    manager._last_access["shared"] = time.time() - 100
+
+    # Another worker sharing the checkpointer runs the thread; this worker only sees the checkpoint
+    started = time.time()
+    await _run(graph, "shared")
+    assert started <= await checkpointer.aget_thread_last_write("shared") <= time.time()
+    await manager.sweep()
+
+    assert checkpointer.list_thread_ids() == ["shared"]
+    assert await checkpointer.aget_thread_last_write("unknown") is None
+
+
+@pytest.mark.asyncio
+async def test_periodic_sweeps_evict_idle_threads_without_runs(checkpointer):
+    graph = _build_graph(checkpointer)
+    await _run(graph, "idle")
+    manager = ThreadLifecycleManager(checkpointer, _settings(idle_ttl_seconds=0.1, sweep_interval_seconds=0.05))
+    await manager.sweep()
+    assert checkpointer.list_thread_ids() == ["idle"]
+
+    manager.start()
+    await asyncio.sleep(0.3)
+    await manager.stop()
+
+    assert checkpointer.list_thread_ids() == []
+
+
+@pytest.mark.asyncio
+async def test_sweep_evicts_least_recently_used_threads_first(checkpointer):
+    graph = _build_graph(checkpointer)
+    manager = ThreadLifecycleManager(checkpointer, _settings(idle_ttl_seconds=10))
+    for thread_id in ["a", "b", "c"]:
+        async with manager.track(thread_id):
+            await _run(graph, thread_id)
+    now = time.time()
+    manager._last_access.update({"a": now - 100, "b": now - 200, "c": now})
+    evicted = []
+    evict = manager.evict
+
+    async def record_eviction(thread_id):
+        evicted.append(thread_id)
+        await evict(thread_id)
+
+    with (
+        patch.object(manager, "evict", side_effect=record_eviction),
+        patch.object(checkpointer, "aget_thread_last_write", return_value=None),
+    ):
+        await manager.sweep()
+
+    assert evicted == ["b", "a"]
+    assert checkpointer.list_thread_ids() == ["c"]
+
+
+@pytest.mark.asyncio
+async def test_sweep_keeps_recent_threads_over_limits(checkpointer, caplog):
+    graph = _build_graph(checkpointer)
+    manager = ThreadLifecycleManager(checkpointer, _settings(max_threads=1, max_bytes=1))
+    for thread_id in ["a", "b"]:
+        await _run(graph, thread_id)
+
+    await manager.sweep()
+
+    assert sorted(checkpointer.list_thread_ids()) == ["a", "b"]
+    assert "above the limits" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_metrics_report_resident_bytes(checkpointer):
+    graph = _build_graph(checkpointer)
+    manager = ThreadLifecycleManager(checkpointer, _settings())
+    await _run(graph, "a")
+    await _run(graph, "b", turns=3)
+
+    metrics = await manager.metrics()
+
+    assert metrics.thread_count == 2
+    assert metrics.resident_bytes == sum(metrics.largest_threads.values())
+    assert list(metrics.largest_threads) == ["b", "a"]
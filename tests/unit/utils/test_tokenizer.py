@@ -0,0 +1,97 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+from unittest.mock import MagicMock
+
+import pytest
+from langchain_core.messages import HumanMessage, ToolMessage
+
+from deerflowx.utils import tokenizer as tokenizer_module
+from deerflowx.utils.tokenizer import (
+    MESSAGE_OVERHEAD_TOKENS,
+    Tokenizer,
+    clear_tokenizer_cache,
+    get_agent_tokenizer,
+    get_tokenizer,
+)
+
+TEXT = "Deploy the server with docker compose. 研究人工智能在教育领域的应用。" * 20
+
+
+@pytest.fixture(autouse=True)
+def fresh_tokenizers():
+    clear_tokenizer_cache()
+    yield
+    clear_tokenizer_cache()
+
+
+def test_encodings_are_resolved_per_model():
+    assert get_tokenizer("gpt-4o").encoding.name == "o200k_base"
+    assert get_tokenizer("deepseek/deepseek-chat").encoding.name == "cl100k_base"
+    assert get_tokenizer("doubao-1-5-pro-32k-250115") is get_tokenizer(None)
+
+
+def test_agent_without_model_gets_default_tokenizer(monkeypatch):
+    monkeypatch.setattr(tokenizer_module, "get_model_name_for_agent", MagicMock(side_effect=ValueError))
+
+    assert get_agent_tokenizer("researcher") is get_tokenizer()
+
+
+def test_count_batch_encodes_only_uncached_texts(monkeypatch):
+    tokenizer = get_tokenizer()
+    encode = MagicMock(wraps=tokenizer.encoding.encode_ordinary_batch)
+    monkeypatch.setattr(tokenizer.encoding, "encode_ordinary_batch", encode)
+
+    first = tokenizer.count_batch(["one", TEXT])
+    second = tokenizer.count_batch([TEXT, "two", "one"])
+
+    assert first == [1, len(tokenizer.encoding.encode_ordinary(TEXT))]
+    assert second == [first[1], 1, 1]
+    assert [call.args[0] for call in encode.call_args_list] == [["one", TEXT], ["two"]]
+
+
+def test_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(tokenizer_module, "TOKEN_CACHE_MAX_ENTRIES", 2)
+    tokenizer = get_tokenizer()
+
+    tokenizer.count_batch(["one", "two", "three"])
+
+    assert len(tokenizer._cache) == 2
+
+
+def test_count_messages_adds_message_overhead():
+    tokenizer = get_tokenizer()
+    messages = [HumanMessage(content="hello world"), ToolMessage(content="", tool_call_id="1")]
+
+    assert tokenizer.count_messages(messages) == 2 + 2 * MESSAGE_OVERHEAD_TOKENS
+
+
+def test_approximation_is_calibrated_by_exact_counts():
+    tokenizer = get_tokenizer()
+
+    exact = tokenizer.count(TEXT * 5)
+
+    assert tokenizer.count(TEXT, approximate=True) == pytest.approx(exact / 5, rel=0.01)
+
+
+def test_without_encoding_counts_are_approximate():
+    tokenizer = Tokenizer(None)
+
+    assert tokenizer.count("x" * 40) == 10
+    assert tokenizer.count("研究") == 2
+    assert tokenizer.split("x" * 100, chunk_size=10, overlap=2) == ["x" * 40, "x" * 40, "x" * 36]
+
+
+def test_split_keeps_overlap_and_whole_characters():
+    tokenizer = get_tokenizer()
+
+    chunks = tokenizer.split(TEXT, chunk_size=50, overlap=10)
+
+    assert len(chunks) > 1
+    assert all(tokenizer.count(chunk) <= 50 for chunk in chunks)
+    assert all("�" not in chunk for chunk in chunks)
+    _, offsets = tokenizer.encoding.decode_with_offsets(tokenizer.encoding.encode_ordinary(TEXT))
+    overlap = TEXT[offsets[40] : offsets[50]]
+    assert chunks[0].endswith(overlap)
+    assert chunks[1].startswith(overlap)
+    assert tokenizer.split("short", chunk_size=50, overlap=10) == ["short"]